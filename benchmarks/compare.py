@@ -0,0 +1,87 @@
+"""Compares two pytest-benchmark JSON results and flags regressions.
+
+Usage:
+
+    python benchmarks/compare.py baseline.json current.json [--threshold 10]
+
+Exits with status 1 if the median time of any benchmark found in both
+results grew by more than the threshold percentage.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load_medians(path):
+    """Returns a dict mapping benchmark full names to median times."""
+    with open(path) as f:
+        results = json.load(f)
+    return {
+        bench["fullname"]: bench["stats"]["median"]
+        for bench in results["benchmarks"]
+    }
+
+
+def compare(baseline, current, threshold):
+    """Returns (name, baseline, current, change %) rows and regressions.
+
+    Parameters
+    ----------
+    baseline : dict
+        Maps benchmark names to baseline median times.
+    current : dict
+        Maps benchmark names to current median times.
+    threshold : float
+        The percentage of slowdown above which a benchmark regressed.
+
+    Returns
+    -------
+    rows : list of tuple
+        A row for each benchmark found in both results, sorted by name.
+    regressions : list of tuple
+        The rows of regressed benchmarks.
+
+    """
+    rows = []
+    for name in sorted(baseline.keys() & current.keys()):
+        old, new = baseline[name], current[name]
+        change = (new - old) / old * 100 if old else 0.0
+        rows.append((name, old, new, change))
+    regressions = [row for row in rows if row[3] > threshold]
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="baseline pytest-benchmark JSON")
+    parser.add_argument("current", help="current pytest-benchmark JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="slowdown percentage flagged as a regression (default: 10)",
+    )
+    args = parser.parse_args(argv)
+    baseline = load_medians(args.baseline)
+    current = load_medians(args.current)
+    rows, regressions = compare(baseline, current, args.threshold)
+    for name, old, new, change in rows:
+        flag = "  REGRESSION" if change > args.threshold else ""
+        print(
+            "{:+8.1f}%  {:12.3e}s -> {:12.3e}s  {}{}".format(
+                change, old, new, name, flag
+            )
+        )
+    for name in sorted(baseline.keys() - current.keys()):
+        print("missing from current: {}".format(name))
+    print(
+        "{} benchmarks compared, {} regressed by more than {}%.".format(
+            len(rows), len(regressions), args.threshold
+        )
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""Shared fixtures for the strct benchmarks."""
+
+import os
+import sys
+
+# makes the datagen module importable regardless of the invocation directory
+sys.path.insert(0, os.path.dirname(__file__))
@@ -0,0 +1,81 @@
+"""Deterministic data generators for the strct benchmarks."""
+
+import random
+
+SEED = 1729
+
+
+def int_dict(size, seed=SEED):
+    """Returns a dict mapping size string keys to random int values."""
+    rand = random.Random(seed)
+    return {"k{}".format(i): rand.randint(1, 1000) for i in range(size)}
+
+
+def nested_dict(depth, width):
+    """Returns nested dicts of the given depth, with width keys per level.
+
+    Only the first key of each level maps to a nested dict; all others map
+    to int leaves.
+    """
+    root = node = {}
+    for level in range(depth):
+        for i in range(1, width):
+            node["k{}".format(i)] = level * width + i
+        if level < depth - 1:
+            node["k0"] = {}
+            node = node["k0"]
+        else:
+            node["k0"] = level
+    return root
+
+
+def deep_path(depth):
+    """Returns the key tuple of the deepest leaf of a nested_dict."""
+    return ("k0",) * depth
+
+
+def wide_nested_dict(n_outer, n_inner):
+    """Returns a two-level dict of n_outer dicts with n_inner leaves each."""
+    return {
+        "o{}".format(i): {"i{}".format(j): j for j in range(n_inner)}
+        for i in range(n_outer)
+    }
+
+
+def sorted_points(length, seed=SEED):
+    """Returns a sorted list of length random float points in [0, length)."""
+    rand = random.Random(seed)
+    return sorted(rand.uniform(0, length) for _ in range(length))
+
+
+def section_list(size):
+    """Returns a sorted list of size section boundaries, 10 units apart."""
+    return list(range(0, 10 * size, 10))
+
+
+def query_points(count, upper, seed=SEED):
+    """Returns count random query points in [-10, upper + 10)."""
+    rand = random.Random(seed + 1)
+    return [rand.uniform(-10, upper + 10) for _ in range(count)]
+
+
+def intervals(count, span, seed=SEED):
+    """Returns count random (start, end) intervals of length up to span."""
+    rand = random.Random(seed)
+    result = []
+    for _ in range(count):
+        start = rand.uniform(0, count)
+        result.append((start, start + rand.uniform(0, span)))
+    return result
+
+
+def int_sets(count, set_size, universe, seed=SEED):
+    """Returns count random sets of set_size ints out of range(universe)."""
+    rand = random.Random(seed)
+    return [set(rand.sample(range(universe), set_size)) for _ in range(count)]
+
+
+def key_stream(count, n_keys, seed=SEED):
+    """Returns count random keys out of range(n_keys), skewed to low keys."""
+    rand = random.Random(seed)
+    return [int(n_keys * rand.random() ** 2) for _ in range(count)]
@@ -0,0 +1,53 @@
+"""Benchmarks of strct.dicts.concurrent, at 1 to 32 threads."""
+
+import threading
+
+import pytest
+
+from strct.dicts import increment_dict_val
+from strct.dicts.concurrent import ShardedDict
+
+THREADS = [1, 2, 4, 8, 16, 32]
+TOTAL_INCREMENTS = 64_000
+
+
+def _run_threads(num_threads, target):
+    per_thread = TOTAL_INCREMENTS // num_threads
+    threads = [
+        threading.Thread(target=target, args=(i, per_thread))
+        for i in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.parametrize("num_threads", THREADS)
+def test_global_lock_increments(benchmark, num_threads):
+    def run():
+        dict_obj = {}
+        lock = threading.Lock()
+
+        def work(thread_ix, count):
+            for i in range(count):
+                with lock:
+                    increment_dict_val(dict_obj, (thread_ix + i) % 1000, 1)
+
+        _run_threads(num_threads, work)
+
+    benchmark.pedantic(run, rounds=3)
+
+
+@pytest.mark.parametrize("num_threads", THREADS)
+def test_sharded_dict_increments(benchmark, num_threads):
+    def run():
+        sdict = ShardedDict(num_shards=32)
+
+        def work(thread_ix, count):
+            for i in range(count):
+                sdict.increment((thread_ix + i) % 1000)
+
+        _run_threads(num_threads, work)
+
+    benchmark.pedantic(run, rounds=3)
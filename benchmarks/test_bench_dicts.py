@@ -0,0 +1,512 @@
+"""Benchmarks of strct.dicts."""
+
+import copy
+import io
+import tracemalloc
+
+import datagen
+import pytest
+
+from strct.dicts import (
+    BiDict,
+    CaseInsensitiveDict,
+    Distribution,
+    FrozenNestedDict,
+    KeyProjector,
+    LFUDict,
+    LRUDict,
+    MultiDict,
+    MultiSet,
+    NestedCounter,
+    NestedIndex,
+    TTLDict,
+    add_many_to_dict_val_list,
+    add_many_to_dict_val_set,
+    add_to_dict_val_set,
+    any_in_dict,
+    any_path_in_dict,
+    append_to_dict_val_list,
+    apply_patch,
+    build_inverse_index,
+    deep_merge_dict,
+    diff_nested,
+    flatten_dict,
+    get_alternative_nested_val,
+    get_first_val,
+    get_key_of_max,
+    get_key_of_min,
+    get_key_val_of_max,
+    get_key_val_of_max_key,
+    get_keys_of_max_n,
+    get_nested_val,
+    in_nested_dicts,
+    increment_dict_val,
+    increment_nested_many,
+    increment_nested_val,
+    key_tuple_value_nested_generator,
+    key_value_nested_generator,
+    log_norm_dict,
+    norm_int_dict,
+    normalize_inplace,
+    pformat_dist_dict_chunks,
+    pformat_int_dict_chunks,
+    pprint_dist_dict,
+    pprint_int_dict,
+    put_nested_val,
+    reverse_dict,
+    reverse_dict_partial,
+    reverse_list_valued_dict,
+    safe_alternative_nested_val,
+    safe_nested_val,
+    select,
+    softmax_dict,
+    subdict_by_keys,
+    sum_dicts,
+    sum_num_dicts,
+    unite_dicts,
+)
+
+SIZES = [100, 10_000]
+DEPTHS = [4, 64]
+# the nested generators walk iteratively, so they also cover very deep dicts
+GENERATOR_DEPTHS = [*DEPTHS, 1000]
+WIDTH = 8
+
+# === nested access ===
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+@pytest.mark.parametrize(
+    "func",
+    [
+        get_nested_val,
+        safe_nested_val,
+        in_nested_dicts,
+        any_path_in_dict,
+        get_alternative_nested_val,
+        safe_alternative_nested_val,
+    ],
+    ids=lambda func: func.__name__,
+)
+def test_nested_lookup(benchmark, func, depth):
+    dict_obj = datagen.nested_dict(depth, WIDTH)
+    path = datagen.deep_path(depth)
+    if func in (get_alternative_nested_val, safe_alternative_nested_val):
+        path = tuple(("x", key) for key in path)
+    benchmark(func, path, dict_obj)
+
+
+@pytest.mark.parametrize("func", [get_first_val, any_in_dict])
+def test_first_key_lookup(benchmark, func):
+    dict_obj = datagen.int_dict(1000)
+    key_tuple = tuple("m{}".format(i) for i in range(10)) + ("k5",)
+    benchmark(func, key_tuple, dict_obj)
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_put_nested_val(benchmark, depth):
+    path = datagen.deep_path(depth)
+    benchmark(lambda: put_nested_val({}, path, 1))
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_increment_nested_val(benchmark, depth):
+    dict_obj = datagen.nested_dict(depth, WIDTH)
+    benchmark(increment_nested_val, dict_obj, datagen.deep_path(depth), 1)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_increment_nested_many(benchmark, size):
+    updates = [(("a", "k{}".format(i % 97)), 1) for i in range(size)]
+    benchmark(lambda: increment_nested_many({}, updates))
+
+
+# === nested generators, merging and diffing ===
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+@pytest.mark.parametrize(
+    "func",
+    [key_value_nested_generator, key_tuple_value_nested_generator],
+    ids=lambda func: func.__name__,
+)
+def test_nested_generator(benchmark, func, n_outer):
+    dict_obj = datagen.wide_nested_dict(n_outer, 30)
+    benchmark(lambda: sum(1 for _ in func(dict_obj)))
+
+
+@pytest.mark.parametrize("depth", GENERATOR_DEPTHS)
+@pytest.mark.parametrize(
+    "func",
+    [key_value_nested_generator, key_tuple_value_nested_generator],
+    ids=lambda func: func.__name__,
+)
+def test_deep_nested_generator(benchmark, func, depth):
+    dict_obj = datagen.nested_dict(depth, WIDTH)
+    benchmark(lambda: sum(1 for _ in func(dict_obj)))
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+def test_flatten_dict(benchmark, n_outer):
+    dict_obj = datagen.wide_nested_dict(n_outer, 30)
+    benchmark(flatten_dict, dict_obj)
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+def test_deep_merge_dict(benchmark, n_outer):
+    base = datagen.wide_nested_dict(n_outer, 30)
+    priority = datagen.wide_nested_dict(n_outer // 2, 15)
+    benchmark(deep_merge_dict, base, priority)
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+def test_diff_nested(benchmark, n_outer):
+    a = datagen.wide_nested_dict(n_outer, 30)
+    b = datagen.wide_nested_dict(n_outer, 30)
+    b["o0"]["i0"] = -1
+    benchmark(diff_nested, a, b)
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+def test_apply_patch(benchmark, n_outer):
+    a = datagen.wide_nested_dict(n_outer, 30)
+    patch = {"added": {("o0", "new"): 1}, "changed": {("o1", "i1"): (1, 2)}}
+    benchmark(apply_patch, a, patch)
+
+
+# === flat dicts ===
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_subdict_by_keys(benchmark, size):
+    dict_obj = datagen.int_dict(size)
+    keys = list(dict_obj)[::2]
+    benchmark(subdict_by_keys, dict_obj, keys)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_key_projector(benchmark, size):
+    dicts = [datagen.int_dict(50, seed=i) for i in range(size // 50)]
+    projector = KeyProjector(["k1", "k7", "k42", "missing"])
+    benchmark(projector.project_many, dicts)
+
+
+@pytest.mark.parametrize("size", [100, 1000])
+@pytest.mark.parametrize("num_dicts", [2, 10, 1000])
+def test_unite_dicts(benchmark, num_dicts, size):
+    dicts = [datagen.int_dict(size, seed=i) for i in range(num_dicts)]
+    benchmark(unite_dicts, *dicts)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_increment_dict_val(benchmark, size):
+    keys = list(datagen.int_dict(size))
+
+    def run():
+        dict_obj = {}
+        for key in keys:
+            increment_dict_val(dict_obj, key, 1)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "func",
+    [
+        add_to_dict_val_set,
+        append_to_dict_val_list,
+        add_many_to_dict_val_set,
+        add_many_to_dict_val_list,
+    ],
+    ids=lambda func: func.__name__,
+)
+def test_dict_val_collections(benchmark, func, size):
+    many = func in (add_many_to_dict_val_set, add_many_to_dict_val_list)
+    val = [1, 2] if many else 1
+
+    def run():
+        dict_obj = {}
+        for i in range(size):
+            func(dict_obj, i % 100, val)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "func",
+    [
+        get_key_of_max,
+        get_key_of_min,
+        get_key_val_of_max,
+        get_key_val_of_max_key,
+    ],
+    ids=lambda func: func.__name__,
+)
+def test_extremes(benchmark, func, size):
+    benchmark(func, datagen.int_dict(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_get_keys_of_max_n(benchmark, size):
+    benchmark(get_keys_of_max_n, datagen.int_dict(size), 10)
+
+
+# === numeric dicts ===
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "func", [norm_int_dict, log_norm_dict], ids=lambda func: func.__name__
+)
+def test_norm_dict(benchmark, func, size):
+    benchmark(func, datagen.int_dict(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_normalize_inplace(benchmark, size):
+    dict_obj = datagen.int_dict(size)
+    benchmark(lambda: normalize_inplace(dict(dict_obj)))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_softmax_dict(benchmark, size):
+    benchmark(softmax_dict, log_norm_dict(datagen.int_dict(size)))
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "func", [sum_num_dicts, sum_dicts], ids=lambda func: func.__name__
+)
+def test_sum_dicts(benchmark, func, size):
+    dicts = [datagen.int_dict(size, seed=i) for i in range(5)]
+    benchmark(func, dicts, normalize=True)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_distribution_sample(benchmark, size):
+    pytest.importorskip("numpy")
+    dist = Distribution.from_dict(datagen.int_dict(size))
+    benchmark(dist.sample_indices, 10_000, 0)
+
+
+# === reversing ===
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "func",
+    [reverse_dict, reverse_dict_partial],
+    ids=lambda func: func.__name__,
+)
+def test_reverse_dict(benchmark, func, size):
+    benchmark(func, datagen.int_dict(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_reverse_list_valued_dict(benchmark, size):
+    dict_obj = {
+        key: [val, val + 1] for key, val in datagen.int_dict(size).items()
+    }
+    benchmark(reverse_list_valued_dict, dict_obj)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_build_inverse_index(benchmark, size):
+    benchmark(build_inverse_index, datagen.int_dict(size))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_bidict_build(benchmark, size):
+    benchmark(BiDict, datagen.int_dict(size), on_dup="multi")
+
+
+# === printing ===
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "func", [pprint_int_dict, pprint_dist_dict], ids=lambda func: func.__name__
+)
+def test_pprint(benchmark, func, size):
+    dict_obj = datagen.int_dict(size)
+    benchmark(lambda: func(dict_obj, file=io.StringIO()))
+
+
+@pytest.mark.parametrize(
+    "func",
+    [pformat_int_dict_chunks, pformat_dist_dict_chunks],
+    ids=lambda func: func.__name__,
+)
+def test_pformat_chunks_top_n(benchmark, func):
+    dict_obj = datagen.int_dict(100_000)
+    benchmark(lambda: list(func(dict_obj, top_n=10)))
+
+
+# === classes ===
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_case_insensitive_dict(benchmark, size):
+    dict_obj = CaseInsensitiveDict.from_dict(datagen.int_dict(size))
+    keys = [key.upper() for key in dict_obj]
+    benchmark(lambda: [dict_obj[key] for key in keys])
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_nested_counter(benchmark, size):
+    updates = [
+        (("a", "b{}".format(i % 10), "c{}".format(i % 97)), 1)
+        for i in range(size)
+    ]
+
+    def run():
+        counter = NestedCounter()
+        counter.update(updates)
+        return counter.top_n(("a",), 3)
+
+    benchmark(run)
+
+
+def _retained_bytes(build):
+    # the memory still allocated by the object build() returns
+    tracemalloc.start()
+    try:
+        obj = build()  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def _counter_paths(size):
+    return [
+        ("t{}".format(i % 50), "e{}".format(i % 20), i % 7)
+        for i in range(size)
+    ]
+
+
+def _count_in_nested_dict(paths):
+    nested = {}
+    for path in paths:
+        increment_nested_val(nested, path, 1)
+    return nested
+
+
+def _count_in_nested_counter(paths):
+    counter = NestedCounter()
+    for path in paths:
+        counter.increment(path)
+    return counter
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "build",
+    [_count_in_nested_dict, _count_in_nested_counter],
+    ids=["nested_dict", "NestedCounter"],
+)
+def test_nested_counting(benchmark, build, size):
+    # per-path increments into plain nested dicts and into a NestedCounter;
+    # the memory each retains is recorded in the extra_info of the results
+    paths = _counter_paths(size)
+    benchmark.extra_info["retained_bytes"] = _retained_bytes(
+        lambda: build(paths)
+    )
+    benchmark(build, paths)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "cls", [MultiDict, MultiSet], ids=lambda c: c.__name__
+)
+def test_multidict_build(benchmark, cls, size):
+    pairs = [(i % (size // 10), i) for i in range(size)]
+
+    def run():
+        multi = cls()
+        multi.extend_from_pairs(pairs)
+        return multi
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_nested_index_lookup(benchmark, depth):
+    index = NestedIndex(datagen.nested_dict(depth, WIDTH))
+    benchmark(index.get, datagen.deep_path(depth))
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+def test_nested_index_build(benchmark, n_outer):
+    benchmark(NestedIndex, datagen.wide_nested_dict(n_outer, 30))
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+@pytest.mark.parametrize(
+    "query", [("*", "i3"), ("**", "i3"), ("o1", "i3")], ids=str
+)
+def test_select(benchmark, query, n_outer):
+    dict_obj = datagen.wide_nested_dict(n_outer, 30)
+    benchmark(lambda: list(select(query, dict_obj)))
+
+
+def _churn_hand_rolled_lfu(maxsize, keys):
+    # the dict-and-helpers cache LFUDict replaces; evicts by an O(N) scan
+    values, counts = {}, {}
+    for key in keys:
+        if key in values:
+            increment_dict_val(counts, key, 1)
+            continue
+        if len(values) >= maxsize:
+            old_key = get_key_of_min(counts)
+            del values[old_key], counts[old_key]
+        values[key] = key
+        counts[key] = 1
+
+
+def _churn(cache, keys):
+    for key in keys:
+        if cache.get(key) is None:
+            cache[key] = key
+
+
+@pytest.mark.parametrize("maxsize", [100, 1000])
+@pytest.mark.parametrize(
+    "cls",
+    [LRUDict, LFUDict, TTLDict, None],
+    ids=lambda cls: getattr(cls, "__name__", "hand_rolled"),
+)
+def test_cache_churn(benchmark, cls, maxsize):
+    keys = datagen.key_stream(5000, 4 * maxsize)
+    if cls is None:
+        benchmark(_churn_hand_rolled_lfu, maxsize, keys)
+    elif cls is TTLDict:
+        benchmark(lambda: _churn(TTLDict(60, maxsize=maxsize), keys))
+    else:
+        benchmark(lambda: _churn(cls(maxsize), keys))
+
+
+def _copy_and_put(dict_obj, key_tuple, value):
+    # the defensive-copy update FrozenNestedDict.set_in replaces
+    dict_obj = copy.deepcopy(dict_obj)
+    put_nested_val(dict_obj, key_tuple, value)
+    return dict_obj
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+def test_frozen_nested_set_in(benchmark, n_outer):
+    fdict = FrozenNestedDict(datagen.wide_nested_dict(n_outer, 30))
+    benchmark(fdict.set_in, ("o1", "i3"), -1)
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+def test_deepcopy_put_nested_val(benchmark, n_outer):
+    dict_obj = datagen.wide_nested_dict(n_outer, 30)
+    benchmark(_copy_and_put, dict_obj, ("o1", "i3"), -1)
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+def test_frozen_nested_merge(benchmark, n_outer):
+    fdict = FrozenNestedDict(datagen.wide_nested_dict(n_outer, 30))
+    benchmark(fdict.merge, {"o1": {"i3": -1, "new": 1}, "o2": 5})
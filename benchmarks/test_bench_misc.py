@@ -0,0 +1,57 @@
+"""Benchmarks of strct.hash, strct.lists and strct.sets."""
+
+import datagen
+import pytest
+
+from strct.hash import json_based_stable_hash, stable_hash
+from strct.lists import (
+    all_but,
+    order_preserving_single_element_shift,
+    order_preserving_single_index_shift,
+)
+from strct.sets import PriorityResolver, get_priority_elem_in_set
+
+LENGTHS = [100, 100_000]
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+@pytest.mark.parametrize(
+    "func",
+    [stable_hash, json_based_stable_hash],
+    ids=lambda func: func.__name__,
+)
+def test_hash(benchmark, func, n_outer):
+    benchmark(func, datagen.wide_nested_dict(n_outer, 30))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_all_but(benchmark, length):
+    benchmark(all_but, list(range(length)), length // 2)
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_order_preserving_single_index_shift(benchmark, length):
+    arr = list(range(length))
+    benchmark(order_preserving_single_index_shift, arr, 1, length - 1)
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_order_preserving_single_element_shift(benchmark, length):
+    arr = list(range(length))
+    benchmark(order_preserving_single_element_shift, arr, 1, length - 1)
+
+
+@pytest.mark.parametrize("universe", [100, 10_000])
+def test_get_priority_elem_in_set(benchmark, universe):
+    priority_list = list(range(universe))
+    sets = datagen.int_sets(100, 5, universe)
+    benchmark(
+        lambda: [get_priority_elem_in_set(s, priority_list) for s in sets]
+    )
+
+
+@pytest.mark.parametrize("universe", [100, 10_000])
+def test_priority_resolver(benchmark, universe):
+    resolver = PriorityResolver(list(range(universe)))
+    sets = datagen.int_sets(100, 5, universe)
+    benchmark(resolver.resolve_many, sets)
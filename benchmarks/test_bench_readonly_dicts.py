@@ -0,0 +1,94 @@
+"""Benchmarks of the read-only and compiled structures of strct.dicts."""
+
+import datagen
+import pytest
+
+from strct.dicts import (
+    FrozenMultiDict,
+    MultiDict,
+    SharedFrozenDict,
+    compile_query,
+)
+from strct.dicts._query import _compile
+
+SIZES = [1000, 100_000]
+N_LOOKUPS = 1000
+
+# === SharedFrozenDict ===
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: "size={}".format(size))
+def shared_int_dict(request):
+    dict_obj = datagen.int_dict(request.param)
+    shared = SharedFrozenDict.create(dict_obj)
+    yield dict_obj, shared
+    shared.close()
+    shared.unlink()
+
+
+def test_shared_frozen_dict_create(benchmark):
+    dict_obj = datagen.int_dict(10_000)
+
+    def run():
+        shared = SharedFrozenDict.create(dict_obj)
+        shared.close()
+        shared.unlink()
+
+    benchmark(run)
+
+
+def test_shared_frozen_dict_lookup(benchmark, shared_int_dict):
+    dict_obj, shared = shared_int_dict
+    keys = list(dict_obj)[:N_LOOKUPS]
+    benchmark(lambda: [shared[key] for key in keys])
+
+
+def test_shared_frozen_dict_attach(benchmark, shared_int_dict):
+    _, shared = shared_int_dict
+
+    def run():
+        SharedFrozenDict.attach(shared.name).close()
+
+    benchmark(run)
+
+
+# === FrozenMultiDict ===
+
+
+def _multi_pairs(size):
+    return [(i % (size // 10), i) for i in range(size)]
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("typecode", [None, "q"], ids=["list", "array"])
+def test_frozen_multidict_build(benchmark, typecode, size):
+    multi = MultiDict(_multi_pairs(size))
+    benchmark(FrozenMultiDict, multi, typecode)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("typecode", [None, "q"], ids=["list", "array"])
+def test_frozen_multidict_lookup(benchmark, typecode, size):
+    frozen = FrozenMultiDict(MultiDict(_multi_pairs(size)), typecode)
+    keys = list(frozen)[:N_LOOKUPS]
+    benchmark(lambda: [frozen[key] for key in keys])
+
+
+# === compiled queries ===
+
+
+@pytest.mark.parametrize("query", ["o1.i3", "*.i3", "**.i3", "o1.*"], ids=str)
+def test_compile_query_uncached(benchmark, query):
+    # compile_query() caches compiled queries, so time the compilation itself
+    benchmark(_compile, query, ".")
+
+
+@pytest.mark.parametrize("n_outer", [10, 300])
+@pytest.mark.parametrize(
+    "query", [("o1", "i3"), ("*", "i3"), ("**", "i3")], ids=str
+)
+def test_query_select(benchmark, query, n_outer):
+    # a precompiled Query skips the compile cache lookup of select()
+    compiled = compile_query(query)
+    dict_obj = datagen.wide_nested_dict(n_outer, 30)
+    benchmark(lambda: list(compiled.select(dict_obj)))
@@ -0,0 +1,105 @@
+"""Benchmarks of strct.sortedlists."""
+
+import datagen
+import pytest
+
+from strct.sortedlists import (
+    IntervalTree,
+    OnDiskSectionList,
+    WeightedPointList,
+    count_in_ranges,
+    find_point_in_section_list,
+    find_range_in_section_list,
+    find_range_ix_in_point_list,
+    find_range_ix_in_section_list,
+    sum_in_ranges,
+)
+
+SIZES = [1000, 1_000_000]
+N_QUERIES = 1000
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_find_point_in_section_list(benchmark, size):
+    section_list = datagen.section_list(size)
+    points = datagen.query_points(N_QUERIES, section_list[-1])
+    benchmark(
+        lambda: [find_point_in_section_list(p, section_list) for p in points]
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "func",
+    [
+        find_range_ix_in_section_list,
+        find_range_in_section_list,
+        find_range_ix_in_point_list,
+    ],
+    ids=lambda func: func.__name__,
+)
+def test_find_range(benchmark, func, size):
+    section_list = datagen.section_list(size)
+    points = datagen.query_points(N_QUERIES, section_list[-1])
+    benchmark(lambda: [func(p, p + 25, section_list) for p in points])
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_on_disk_section_list(benchmark, size, tmp_path):
+    section_list = datagen.section_list(size)
+    points = datagen.query_points(N_QUERIES, section_list[-1])
+    path = tmp_path / "sections.bin"
+    OnDiskSectionList.from_iterable(path, section_list).close()
+    with OnDiskSectionList(path) as on_disk:
+        benchmark(
+            lambda: [find_point_in_section_list(p, on_disk) for p in points]
+        )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_count_in_ranges(benchmark, size):
+    np = pytest.importorskip("numpy")
+    points = np.asarray(datagen.section_list(size))
+    starts = np.asarray(datagen.query_points(N_QUERIES, points[-1]))
+    benchmark(count_in_ranges, starts, starts + 25, points)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_sum_in_ranges(benchmark, size):
+    np = pytest.importorskip("numpy")
+    points = np.asarray(datagen.section_list(size))
+    weighted = WeightedPointList(points, np.ones(size))
+    starts = np.asarray(datagen.query_points(N_QUERIES, points[-1]))
+    benchmark(sum_in_ranges, starts, starts + 25, weighted)
+
+
+@pytest.mark.parametrize("count", [1000, 100_000])
+def test_interval_tree_build(benchmark, count):
+    intervals = sorted(datagen.intervals(count, 10))
+    benchmark(IntervalTree.from_sorted, intervals)
+
+
+@pytest.mark.parametrize("count", [1000, 100_000])
+def test_interval_tree_at_many(benchmark, count):
+    tree = IntervalTree.from_sorted(sorted(datagen.intervals(count, 10)))
+    benchmark(tree.at_many, datagen.query_points(N_QUERIES, count))
+
+
+def _linear_overlap_many(intervals, ranges):
+    # the scan an IntervalTree replaces
+    return [
+        sorted(iv for iv in intervals if iv[0] <= end and iv[1] >= start)
+        for start, end in ranges
+    ]
+
+
+@pytest.mark.parametrize("count", [100, 1000, 10_000, 100_000])
+@pytest.mark.parametrize("method", ["tree", "linear_scan"])
+def test_interval_overlap_many(benchmark, method, count):
+    intervals = sorted(datagen.intervals(count, 10))
+    ranges = [(p, p + 5) for p in datagen.query_points(100, count)]
+    if method == "tree":
+        tree = IntervalTree.from_sorted(intervals)
+        benchmark(tree.overlap_many, ranges)
+    else:
+        benchmark(_linear_overlap_many, intervals, ranges)
@@ -0,0 +1,35 @@
+"""Testing the regression detection of compare.py."""
+
+import json
+
+import compare
+
+
+def _write_results(path, medians):
+    results = {
+        "benchmarks": [
+            {"fullname": name, "stats": {"median": median}}
+            for name, median in medians.items()
+        ]
+    }
+    path.write_text(json.dumps(results))
+    return str(path)
+
+
+def test_compare():
+    baseline = {"a": 1.0, "b": 2.0, "c": 1.0, "gone": 1.0}
+    current = {"a": 1.05, "b": 3.0, "c": 0.5, "new": 1.0}
+    rows, regressions = compare.compare(baseline, current, threshold=10)
+    assert [row[0] for row in rows] == ["a", "b", "c"]
+    assert regressions == [("b", 2.0, 3.0, 50.0)]
+    _, regressions = compare.compare(baseline, current, threshold=60)
+    assert regressions == []
+
+
+def test_main_exit_status(tmp_path, capsys):
+    baseline = _write_results(tmp_path / "base.json", {"a": 1.0, "b": 1.0})
+    slower = _write_results(tmp_path / "slow.json", {"a": 1.0, "b": 1.2})
+    assert compare.main([baseline, slower]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+    assert compare.main([baseline, slower, "--threshold", "25"]) == 0
+    assert compare.main([baseline, baseline]) == 0
@@ -59,6 +59,7 @@ setup(
     include_package_data=True,
     python_requires=">=3.10",
     install_requires=_load_requirements(),
+    extras_require={"numpy": ["numpy"]},
     platforms=["any"],
     keywords=["python", "list", "dict", "set", "sortedlist"],
     classifiers=[
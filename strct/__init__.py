@@ -1,16 +1,21 @@
 """Utility pure-Python 3 decorators."""
 
-# ruff: noqa
+import os
 
-import strct.dicts
-import strct.hash
-import strct.lists
-import strct.sets
-import strct.sortedlists
+from ._lazy import lazy_attributes
 
-from ._version import *  # noqa: F403
+# subpackages, and the version (read from a file and enriched with the git
+# commit hash), are only loaded on first access
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {"._version": ("__version__",)},
+    ("dicts", "hash", "instrument", "lists", "sets", "sortedlists"),
+)
 
-from contextlib import suppress
+if os.environ.get("STRCT_INSTRUMENT", "0") not in ("", "0"):
+    from . import instrument
 
-with suppress(NameError):
-    del strct
+    instrument.enable()
+
+__all__ = ["dicts", "hash", "lists", "sets", "sortedlists"]
+del lazy_attributes, os
@@ -0,0 +1,55 @@
+"""Lazy loading of package attributes, using module __getattr__ (PEP 562)."""
+
+import importlib
+
+
+def lazy_attributes(package_name, module_attrs, submodules=()):
+    """Returns __getattr__ and __dir__ functions for a lazy package.
+
+    Parameters
+    ----------
+    package_name : str
+        The __name__ of the package.
+    module_attrs : dict
+        Maps the names of modules, relative to the package, to the names of
+        the lazy attributes of the package they define. A module is imported
+        on the first access to any of its attributes, which is then cached
+        in the package.
+    submodules : iterable of str, optional
+        Names of submodules of the package to import on first access, so
+        they are available as attributes without being imported explicitly.
+
+    Returns
+    -------
+    __getattr__ : callable
+        The module-level __getattr__ function of the package.
+    __dir__ : callable
+        The module-level __dir__ function of the package.
+
+    """
+    package = importlib.import_module(package_name)
+    attr_modules = {
+        name: module_name
+        for module_name, names in module_attrs.items()
+        for name in names
+    }
+    submodules = frozenset(submodules)
+
+    def __getattr__(name):
+        module_name = attr_modules.get(name)
+        if module_name is not None:
+            module = importlib.import_module(module_name, package_name)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module("." + name, package_name)
+        else:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(package_name, name)
+            )
+        setattr(package, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(package)) | set(attr_modules) | submodules)
+
+    return __getattr__, __dir__
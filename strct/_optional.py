@@ -0,0 +1,20 @@
+"""Lazy imports of optional dependencies."""
+
+
+def import_numpy(feature):
+    """Returns the numpy module, or raises an informative ImportError.
+
+    Parameters
+    ----------
+    feature : str
+        A description of the feature requiring numpy, used in the error.
+
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for {}; install it with "
+            "`pip install strct[numpy]`.".format(feature)
+        ) from None
+    return numpy
@@ -1,41 +1,76 @@
 """Dict-related utility functions."""
 
-from ._dict import (  # noqa: F401
-    # classes
-    CaseInsensitiveDict,
-    add_many_to_dict_val_list,
-    add_many_to_dict_val_set,
-    add_to_dict_val_set,
-    any_in_dict,
-    any_path_in_dict,
-    append_to_dict_val_list,
-    deep_merge_dict,
-    flatten_dict,
-    get_alternative_nested_val,
-    # functions
-    get_first_val,
-    get_key_of_max,
-    get_key_of_min,
-    get_key_val_of_max,
-    get_key_val_of_max_key,
-    get_keys_of_max_n,
-    get_nested_val,
-    in_nested_dicts,
-    increment_dict_val,
-    increment_nested_val,
-    key_tuple_value_nested_generator,
-    key_value_nested_generator,
-    norm_int_dict,
-    pprint_dist_dict,
-    pprint_int_dict,
-    put_nested_val,
-    reverse_dict,
-    reverse_dict_partial,
-    reverse_list_valued_dict,
-    safe_alternative_nested_val,
-    safe_nested_val,
-    subdict_by_keys,
-    sum_dicts,
-    sum_num_dicts,
-    unite_dicts,
+from .._lazy import lazy_attributes
+
+_MODULE_ATTRS = {
+    "._bidict": ("BiDict",),
+    "._cache": ("LFUDict", "LRUDict", "TTLDict"),
+    "._counter": ("NestedCounter",),
+    "._dict": (
+        "CaseInsensitiveDict",
+        "KeyProjector",
+        "add_many_to_dict_val_list",
+        "add_many_to_dict_val_set",
+        "add_to_dict_val_set",
+        "any_in_dict",
+        "any_path_in_dict",
+        "append_to_dict_val_list",
+        "deep_merge_dict",
+        "flatten_dict",
+        "get_alternative_nested_val",
+        "get_first_val",
+        "get_key_of_max",
+        "get_key_of_min",
+        "get_key_val_of_max",
+        "get_key_val_of_max_key",
+        "get_keys_of_max_n",
+        "get_nested_val",
+        "in_nested_dicts",
+        "increment_dict_val",
+        "increment_nested_many",
+        "increment_nested_val",
+        "key_tuple_value_nested_generator",
+        "key_value_nested_generator",
+        "log_norm_dict",
+        "norm_int_dict",
+        "normalize_inplace",
+        "pformat_dist_dict_chunks",
+        "pformat_int_dict_chunks",
+        "pprint_dist_dict",
+        "pprint_int_dict",
+        "put_nested_val",
+        "reverse_dict",
+        "reverse_dict_partial",
+        "reverse_list_valued_dict",
+        "safe_alternative_nested_val",
+        "safe_nested_val",
+        "softmax_dict",
+        "subdict_by_keys",
+        "sum_dicts",
+        "sum_num_dicts",
+        "unite_dicts",
+    ),
+    "._diff": (
+        "apply_patch",
+        "diff_nested",
+    ),
+    "._distribution": ("Distribution",),
+    "._inverse": (
+        "InverseIndex",
+        "build_inverse_index",
+    ),
+    "._multidict": (
+        "FrozenMultiDict",
+        "MultiDict",
+        "MultiSet",
+    ),
+    "._nested_index": ("NestedIndex",),
+    "._persistent": ("FrozenNestedDict",),
+    "._query": ("Query", "compile_query", "select"),
+    "._shared": ("SharedFrozenDict",),
+}
+__all__ = sorted(name for names in _MODULE_ATTRS.values() for name in names)
+__getattr__, __dir__ = lazy_attributes(
+    __name__, _MODULE_ATTRS, submodules=("concurrent",)
 )
+del lazy_attributes
@@ -0,0 +1,161 @@
+"""A dict with an incrementally maintained inverse."""
+
+from collections.abc import Mapping, MutableMapping
+
+_MISSING = object()
+_ON_DUP_POLICIES = ("raise", "overwrite", "multi")
+
+
+class _InverseView(Mapping):
+    """A read-only view of the inverse mapping of a BiDict."""
+
+    def __init__(self, inverse, multi):
+        self._inverse = inverse
+        self._multi = multi
+
+    def __getitem__(self, value):
+        if self._multi:
+            return sorted(self._inverse[value])
+        return self._inverse[value]
+
+    def __contains__(self, value):
+        return value in self._inverse
+
+    def __iter__(self):
+        return iter(self._inverse)
+
+    def __len__(self):
+        return len(self._inverse)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, dict(self.items()))
+
+
+class BiDict(MutableMapping):
+    """A dict with an inverse value-to-key mapping kept in sync on updates.
+
+    The inverse mapping is available through the read-only inverse
+    attribute, and is updated in O(1) on every set or delete, so it never
+    needs to be rebuilt with reverse_dict_partial or reverse_dict. Values
+    must be hashable.
+
+    Parameters
+    ----------
+    mapping : mapping or iterable, optional
+        Initial key-value pairs, or a mapping of them.
+    on_dup : str, default 'raise'
+        What to do when a value is mapped by more than one key:
+        'raise' raises a ValueError and leaves the dict unchanged.
+        'overwrite' removes the key previously mapping to the value, so the
+        inverse maps each value to its latest key.
+        'multi' keeps all keys, and the inverse maps each value to a sorted
+        list of its keys, just like reverse_dict.
+
+    Example
+    -------
+    >>> bdict = BiDict({'a': 1, 'b': 3})
+    >>> bdict.inverse[3]
+    'b'
+    >>> bdict['c'] = 4
+    >>> del bdict['a']
+    >>> dict(bdict.inverse)
+    {3: 'b', 4: 'c'}
+    >>> mdict = BiDict({'a': 1, 'b': 3, 'c': 1}, on_dup='multi')
+    >>> mdict.inverse[1]
+    ['a', 'c']
+
+    """
+
+    def __init__(self, mapping=(), on_dup="raise"):
+        if on_dup not in _ON_DUP_POLICIES:
+            raise ValueError(
+                "on_dup must be one of {}.".format(_ON_DUP_POLICIES)
+            )
+        self.on_dup = on_dup
+        self._multi = on_dup == "multi"
+        forward = dict(mapping)
+        if self._multi:
+            inverse = {}
+            for key, value in forward.items():
+                keys = inverse.get(value)
+                if keys is None:
+                    inverse[value] = {key}
+                else:
+                    keys.add(key)
+        else:
+            inverse = {value: key for key, value in forward.items()}
+            if len(inverse) != len(forward):
+                if on_dup == "raise":
+                    raise ValueError("Some values are mapped by several keys.")
+                # the latest key of each value wins, as in reverse_dict_partial
+                forward = {
+                    key: value
+                    for key, value in forward.items()
+                    if inverse[value] == key
+                }
+        self._forward = forward
+        self._inverse = inverse
+        self.inverse = _InverseView(inverse, self._multi)
+
+    def __getitem__(self, key):
+        return self._forward[key]
+
+    def __setitem__(self, key, value):
+        forward = self._forward
+        inverse = self._inverse
+        if self._multi:
+            old_value = forward.get(key, _MISSING)
+            if old_value is not _MISSING:
+                self._discard_inverse(old_value, key)
+            forward[key] = value
+            keys = inverse.get(value)
+            if keys is None:
+                inverse[value] = {key}
+            else:
+                keys.add(key)
+            return
+        owner = inverse.get(value, _MISSING)
+        if owner is not _MISSING and owner != key:
+            if self.on_dup == "raise":
+                raise ValueError(
+                    "Value {!r} is already mapped by key {!r}.".format(
+                        value, owner
+                    )
+                )
+            del forward[owner]
+        old_value = forward.get(key, _MISSING)
+        if old_value is not _MISSING:
+            del inverse[old_value]
+        forward[key] = value
+        inverse[value] = key
+
+    def _discard_inverse(self, value, key):
+        keys = self._inverse[value]
+        keys.discard(key)
+        if not keys:
+            del self._inverse[value]
+
+    def __delitem__(self, key):
+        value = self._forward.pop(key)
+        if self._multi:
+            self._discard_inverse(value, key)
+        else:
+            del self._inverse[value]
+
+    def __contains__(self, key):
+        return key in self._forward
+
+    def __iter__(self):
+        return iter(self._forward)
+
+    def __len__(self):
+        return len(self._forward)
+
+    def copy(self):
+        """Returns a shallow copy of this dict, with the same policy."""
+        return type(self)(self._forward, on_dup=self.on_dup)
+
+    def __repr__(self):
+        return "{}({!r}, on_dup={!r})".format(
+            type(self).__name__, self._forward, self.on_dup
+        )
@@ -0,0 +1,340 @@
+"""Bounded dicts with LRU, TTL and LFU eviction."""
+
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+_MISSING = object()
+
+
+class _CacheDict(MutableMapping):
+    """Base class of bounded dicts, counting hits, misses and evictions."""
+
+    def __init__(self, maxsize, on_evict):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be a positive integer or None.")
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _evicted(self, key, value):
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def items(self):
+        """Returns a list of all (key, value) pairs, in iteration order.
+
+        Unlike lookups, listing items does not affect eviction order or
+        statistics.
+        """
+        peek = self._peek
+        return [(key, peek(key)) for key in self]
+
+    def values(self):
+        """Returns a list of all values, in iteration order.
+
+        Unlike lookups, listing values does not affect eviction order or
+        statistics.
+        """
+        peek = self._peek
+        return [peek(key) for key in self]
+
+    def cache_info(self):
+        """Returns a dict of hit, miss and eviction counts, and sizes.
+
+        Lookups through [] and get() count as hits or misses; membership
+        tests with `in` are not counted.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "maxsize": self.maxsize,
+            "currsize": len(self),
+        }
+
+    def __repr__(self):
+        return "{}({!r}, maxsize={})".format(
+            type(self).__name__, dict(self.items()), self.maxsize
+        )
+
+
+class LRUDict(_CacheDict):
+    """A dict holding at most maxsize items, evicting the least recently used.
+
+    Getting or setting a key makes it the most recently used one; iteration
+    goes from the least to the most recently used key. All operations take
+    O(1) time.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximal number of items.
+    on_evict : callable, optional
+        Called with the key and value of each evicted item.
+
+    Example
+    -------
+    >>> cache = LRUDict(2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache['a']
+    1
+    >>> cache['c'] = 3
+    >>> list(cache)
+    ['a', 'c']
+    >>> cache.cache_info()['hits']
+    1
+
+    """
+
+    def __init__(self, maxsize, on_evict=None):
+        if maxsize is None:
+            raise ValueError("LRUDict requires a maxsize.")
+        super().__init__(maxsize, on_evict)
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        data = self._data
+        value = data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        if len(data) > self.maxsize:
+            self._evicted(*data.popitem(last=False))
+
+    def _peek(self, key):
+        return self._data[key]
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TTLDict(_CacheDict):
+    """A dict whose items expire a fixed time after they were last set.
+
+    Expired items are dropped lazily, on access and on updates. Since all
+    items live equally long, they expire in the order they were set, so
+    dropping them, like evicting the oldest item when the dict is full,
+    takes O(1) time per item. Getting a key does not extend its life.
+
+    Parameters
+    ----------
+    ttl : float
+        The time, in seconds, items live after being set.
+    maxsize : int, optional
+        The maximal number of items. If given, the oldest item is evicted
+        when the dict is full. Unbounded by default.
+    on_evict : callable, optional
+        Called with the key and value of each evicted or expired item.
+    timer : callable, default time.monotonic
+        Returns the current time, in seconds.
+
+    Example
+    -------
+    >>> now = [0]
+    >>> cache = TTLDict(ttl=10, timer=lambda: now[0])
+    >>> cache['a'] = 1
+    >>> now[0] = 5
+    >>> cache['b'] = 2
+    >>> now[0] = 12
+    >>> dict(cache)
+    {'b': 2}
+
+    """
+
+    def __init__(self, ttl, maxsize=None, on_evict=None, timer=time.monotonic):
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        super().__init__(maxsize, on_evict)
+        self.ttl = ttl
+        self.timer = timer
+        self._data = OrderedDict()  # key -> (expiration time, value)
+
+    def expire(self):
+        """Drops all expired items."""
+        data = self._data
+        now = self.timer()
+        while data:
+            key, (expires, value) = next(iter(data.items()))
+            if expires > now:
+                break
+            del data[key]
+            self._evicted(key, value)
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if entry[0] <= self.timer():
+            self.expire()
+            self.misses += 1
+            return default
+        self.hits += 1
+        return entry[1]
+
+    def __setitem__(self, key, value):
+        data = self._data
+        self.expire()
+        data[key] = (self.timer() + self.ttl, value)
+        data.move_to_end(key)
+        if self.maxsize is not None and len(data) > self.maxsize:
+            old_key, (_, old_value) = data.popitem(last=False)
+            self._evicted(old_key, old_value)
+
+    def _peek(self, key):
+        return self._data[key][1]
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > self.timer()
+
+    def __iter__(self):
+        self.expire()
+        return iter(list(self._data))
+
+    def __len__(self):
+        self.expire()
+        return len(self._data)
+
+
+class _LFUNode:
+    __slots__ = ("value", "freq")
+
+    def __init__(self, value, freq):
+        self.value = value
+        self.freq = freq
+
+
+class LFUDict(_CacheDict):
+    """A dict holding at most maxsize items, evicting the least used.
+
+    Each item counts how many times it was set or gotten. When the dict is
+    full, the item with the lowest count is evicted, the least recently
+    used one among several such items. Keys are kept in buckets by count,
+    so all operations take O(1) time (evicting right after deleting an item
+    takes time proportional to the number of distinct counts).
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximal number of items.
+    on_evict : callable, optional
+        Called with the key and value of each evicted item.
+
+    Example
+    -------
+    >>> cache = LFUDict(2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache['a'], cache['a'], cache['b']
+    (1, 1, 2)
+    >>> cache['c'] = 3
+    >>> sorted(cache)
+    ['a', 'c']
+
+    """
+
+    def __init__(self, maxsize, on_evict=None):
+        if maxsize is None:
+            raise ValueError("LFUDict requires a maxsize.")
+        super().__init__(maxsize, on_evict)
+        self._nodes = {}
+        # maps each count to the keys with that count, least recent first
+        self._buckets = {}
+        self._min_freq = 0
+
+    def _touch(self, key, node):
+        freq = node.freq
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        node.freq = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def get(self, key, default=None):
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(key, node)
+        return node.value
+
+    def frequency(self, key):
+        """Returns the number of times the given key was set or gotten."""
+        return self._nodes[key].freq
+
+    def __setitem__(self, key, value):
+        node = self._nodes.get(key)
+        if node is not None:
+            node.value = value
+            self._touch(key, node)
+            return
+        if len(self._nodes) >= self.maxsize:
+            self._evict()
+        self._nodes[key] = _LFUNode(value, 1)
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def _evict(self):
+        buckets = self._buckets
+        if self._min_freq not in buckets:  # stale after a deletion
+            self._min_freq = min(buckets)
+        bucket = buckets[self._min_freq]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del buckets[self._min_freq]
+        self._evicted(key, self._nodes.pop(key).value)
+
+    def _peek(self, key):
+        return self._nodes[key].value
+
+    def __delitem__(self, key):
+        node = self._nodes.pop(key)
+        bucket = self._buckets[node.freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[node.freq]
+
+    def __contains__(self, key):
+        return key in self._nodes
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
@@ -0,0 +1,222 @@
+"""A flat-table nested counter."""
+
+import heapq
+
+from ._dict import key_tuple_value_nested_generator
+
+
+def _mixed_depths_error(path):
+    return ValueError(
+        "Counts of paths of mixed depths cannot be nested: path {!r} has a "
+        "count, but is also a prefix of another path.".format(path)
+    )
+
+
+class NestedCounter:
+    """A multi-level counter storing counts keyed by full key-path tuples.
+
+    Counts are held in a single flat dict mapping each full path (e.g.
+    (tenant, endpoint, status)) to its count, so increments cost one dict
+    operation regardless of depth. Rollups over path prefixes are computed
+    lazily, in a single pass, on the first query; after that, increment()
+    keeps them up to date in O(depth) time, while bulk update() and merge()
+    discard them, to be rebuilt on the next query.
+
+    Parameters
+    ----------
+    counts : mapping or iterable, optional
+        Initial (key_tuple, count) pairs, or a mapping of them.
+
+    Example
+    -------
+    >>> counter = NestedCounter()
+    >>> counter.increment(('t1', '/a', 200))
+    >>> counter.increment(('t1', '/a', 500), 2)
+    >>> counter.increment(('t1', '/b', 200), 4)
+    >>> counter.total(('t1', '/a'))
+    3
+    >>> counter.top_n(('t1',), 1)
+    [('/b', 4)]
+    >>> counter.to_nested_dict()
+    {'t1': {'/a': {200: 1, 500: 2}, '/b': {200: 4}}}
+
+    """
+
+    def __init__(self, counts=None):
+        self._counts = {}
+        self._totals = None
+        self._children = None
+        if counts is not None:
+            self.update(counts)
+
+    @classmethod
+    def from_nested_dict(cls, dict_obj):
+        """Builds a counter from nested dicts with numeric leaves.
+
+        Parameters
+        ----------
+        dict_obj : dict
+            Nested dicts, like those built with increment_nested_val.
+
+        Returns
+        -------
+        NestedCounter
+            A counter holding a count for each path to a leaf.
+
+        """
+        return cls(key_tuple_value_nested_generator(dict_obj))
+
+    def increment(self, key_tuple, value=1):
+        """Increments the count of the given path by the given value.
+
+        Parameters
+        ----------
+        key_tuple : tuple
+            The full path of keys to increment the count of.
+        value : int or float, default 1
+            The value to increment the count by.
+
+        """
+        key_tuple = tuple(key_tuple)
+        counts = self._counts
+        counts[key_tuple] = counts.get(key_tuple, 0) + value
+        if self._totals is not None:
+            self._add_to_rollup(key_tuple, value)
+
+    def update(self, counts):
+        """Increments the counts of many paths.
+
+        Parameters
+        ----------
+        counts : mapping or iterable
+            (key_tuple, value) pairs, or a mapping of them.
+
+        """
+        if hasattr(counts, "items"):
+            counts = counts.items()
+        own_counts = self._counts
+        get = own_counts.get
+        for key_tuple, value in counts:
+            key_tuple = tuple(key_tuple)
+            own_counts[key_tuple] = get(key_tuple, 0) + value
+        self._totals = None
+
+    def merge(self, other):
+        """Adds all counts of another counter to this one.
+
+        Parameters
+        ----------
+        other : NestedCounter
+            The counter to merge into this one.
+
+        """
+        self.update(other._counts)
+
+    def _add_to_rollup(self, path, count):
+        totals = self._totals
+        children = self._children
+        for i in range(len(path)):
+            prefix = path[:i]
+            totals[prefix] = totals.get(prefix, 0) + count
+            prefix_children = children.get(prefix)
+            if prefix_children is None:
+                prefix_children = children[prefix] = {}
+            key = path[i]
+            prefix_children[key] = prefix_children.get(key, 0) + count
+        totals[path] = totals.get(path, 0) + count
+
+    def _rollup(self):
+        self._totals = {}
+        self._children = {}
+        for path, count in self._counts.items():
+            self._add_to_rollup(path, count)
+
+    def total(self, prefix=()):
+        """Returns the sum of counts of all paths starting with a prefix.
+
+        Parameters
+        ----------
+        prefix : tuple, default ()
+            A path prefix. The empty prefix sums all counts.
+
+        Returns
+        -------
+        int or float
+            The sum of counts of all paths starting with the given prefix.
+
+        """
+        if self._totals is None:
+            self._rollup()
+        return self._totals.get(tuple(prefix), 0)
+
+    def top_n(self, prefix, n):
+        """Returns the n keys following a prefix with the largest totals.
+
+        Parameters
+        ----------
+        prefix : tuple
+            A path prefix. The empty prefix ranks the top-level keys.
+        n : int
+            The number of keys to return.
+
+        Returns
+        -------
+        list
+            Up to n (key, total) pairs, in descending order of total.
+
+        """
+        if self._totals is None:
+            self._rollup()
+        children = self._children.get(tuple(prefix), {})
+        return heapq.nlargest(n, children.items(), key=lambda item: item[1])
+
+    def to_nested_dict(self):
+        """Returns the counts as nested dicts, one level per path key.
+
+        Returns
+        -------
+        dict
+            Nested dicts mapping each full path to its count.
+
+        Raises
+        ------
+        ValueError
+            If a path with a count is a prefix of another such path, as its
+            count and the nested dict of the longer path would share a key.
+
+        """
+        nested = {}
+        for path, count in self._counts.items():
+            node = nested
+            for i, key in enumerate(path[:-1]):
+                node = node.setdefault(key, {})
+                if not isinstance(node, dict):
+                    raise _mixed_depths_error(path[: i + 1])
+            if isinstance(node.get(path[-1]), dict):
+                raise _mixed_depths_error(path)
+            node[path[-1]] = count
+        return nested
+
+    def items(self):
+        """Returns a view of (key_tuple, count) pairs."""
+        return self._counts.items()
+
+    def __getitem__(self, key_tuple):
+        return self._counts.get(tuple(key_tuple), 0)
+
+    def __contains__(self, key_tuple):
+        return tuple(key_tuple) in self._counts
+
+    def __iter__(self):
+        return iter(self._counts)
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __eq__(self, other):
+        if not isinstance(other, NestedCounter):
+            return NotImplemented
+        return self._counts == other._counts
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self._counts)
@@ -1,7 +1,13 @@
 """Dict-related utility functions."""
 
 import copy  # for deep copies of dicts
+import heapq
+import math
 import numbers
+import operator
+import sys
+
+_MISSING = object()
 
 # === Functions ===
 
@@ -132,6 +138,19 @@ def safe_nested_val(key_tuple, dict_obj, default_value=None):
         return default_value
 
 
+def _get_or_create_nested(dict_obj, key_tuple):
+    # walks down the given keys, creating any missing intermediate dicts
+    current_dict = dict_obj
+    for key in key_tuple:
+        try:
+            current_dict = current_dict[key]
+        except KeyError:
+            new_dict = {}
+            current_dict[key] = new_dict
+            current_dict = new_dict
+    return current_dict
+
+
 def put_nested_val(dict_obj, key_tuple, value):
     """Put a value into nested dicts by the order of the given keys tuple.
 
@@ -163,14 +182,21 @@ def put_nested_val(dict_obj, key_tuple, value):
     88
 
     """
-    current_dict = dict_obj
-    for key in key_tuple[:-1]:
+    _get_or_create_nested(dict_obj, key_tuple[:-1])[key_tuple[-1]] = value
+
+
+def _child_or_missing(obj, key):
+    # plain dicts are checked without raising; anything else, including
+    # dict subclasses that may override item access, is subscripted
+    if type(obj) is dict:
         try:
-            current_dict = current_dict[key]
-        except KeyError:
-            current_dict[key] = {}
-            current_dict = current_dict[key]
-    current_dict[key_tuple[-1]] = value
+            return obj.get(key, _MISSING)
+        except TypeError:  # unhashable key
+            return _MISSING
+    try:
+        return obj[key]
+    except (KeyError, IndexError, TypeError):
+        return _MISSING
 
 
 def in_nested_dicts(key_tuple, dict_obj):
@@ -186,19 +212,28 @@ def in_nested_dicts(key_tuple, dict_obj):
     Returns
     -------
     True : object
-        If some value if nested in the given dict by the given keys tuple, in
-        order. False otherwise.
+        If some value, including None, is nested in the given dict by the
+        given keys tuple, in order. False otherwise.
 
     Example
     -------
-    >>> dict_obj = {'a': {'b': 7}}
+    >>> dict_obj = {'a': {'b': 7, 'n': None}}
     >>> in_nested_dicts(('a', 'b'), dict_obj)
     True
     >>> in_nested_dicts(('a', 'c'), dict_obj)
     False
+    >>> in_nested_dicts(('a', 'n'), dict_obj)
+    True
 
     """
-    return safe_nested_val(key_tuple, dict_obj) is not None
+    if not key_tuple:
+        return False
+    current = dict_obj
+    for key in key_tuple:
+        current = _child_or_missing(current, key)
+        if current is _MISSING:
+            return False
+    return True
 
 
 def get_alternative_nested_val(key_tuple, dict_obj):
@@ -284,17 +319,34 @@ def any_path_in_dict(key_tuple, dict_obj):
     Returns
     -------
     bool
-        True if any path in the given keys tuple is in the given dict. False
-        otherwise.
+        True if any path in the given keys tuple is in the given dict, even
+        if it maps to None. False otherwise.
 
     Example
     -------
-    >>> dict_obj = {'a': {'b': 7}}
+    >>> dict_obj = {'a': {'b': 7, 'n': None}}
     >>> any_path_in_dict(('a', ('b', 'c')), dict_obj)
     True
+    >>> any_path_in_dict(('a', ('c', 'n')), dict_obj)
+    True
 
     """
-    return safe_alternative_nested_val(key_tuple, dict_obj) is not None
+    depth = len(key_tuple)
+    if not depth:
+        return False
+    stack = [(0, dict_obj)]
+    while stack:
+        level, current = stack.pop()
+        if level == depth:
+            return True
+        keys = key_tuple[level]
+        if not isinstance(keys, (list, tuple)):
+            keys = (keys,)
+        for key in keys:
+            child = _child_or_missing(current, key)
+            if child is not _MISSING:
+                stack.append((level + 1, child))
+    return False
 
 
 def subdict_by_keys(dict_obj, keys):
@@ -311,7 +363,9 @@ def subdict_by_keys(dict_obj, keys):
     Returns
     -------
     dict
-        A sub-dict of the given dict composed solely of the given keys.
+        A sub-dict of the given dict composed solely of the given keys, in
+        the order they were given. To project many dicts by the same keys,
+        use a KeyProjector.
 
     Example:
     --------
@@ -320,7 +374,7 @@ def subdict_by_keys(dict_obj, keys):
     {'b': 2, 'd': 4}
 
     """
-    return {k: dict_obj[k] for k in set(keys).intersection(dict_obj.keys())}
+    return {k: dict_obj[k] for k in keys if k in dict_obj}
 
 
 def increment_dict_val(dict_obj, key, value, zero_value=0):
@@ -355,6 +409,13 @@ def increment_dict_val(dict_obj, key, value, zero_value=0):
     dict_obj[key] = dict_obj.get(key, zero_value) + value
 
 
+def _increment_in(dict_obj, key, value, zero_value):
+    try:
+        dict_obj[key] = value + dict_obj[key]
+    except KeyError:
+        dict_obj[key] = value + zero_value
+
+
 def increment_nested_val(dict_obj, key_tuple, value, zero_value=0):
     """Increments the value mapped by the given key by the given val. If the
     key is missing from the dict, the given mapping is added.
@@ -384,18 +445,52 @@ def increment_nested_val(dict_obj, key_tuple, value, zero_value=0):
     17
 
     """
-    inc_val = value + safe_nested_val(
-        key_tuple=key_tuple,
-        dict_obj=dict_obj,
-        default_value=zero_value,
-    )
-    put_nested_val(
-        dict_obj=dict_obj,
-        key_tuple=key_tuple,
-        value=inc_val,
+    _increment_in(
+        _get_or_create_nested(dict_obj, key_tuple[:-1]),
+        key_tuple[-1],
+        value,
+        zero_value,
     )
 
 
+def increment_nested_many(dict_obj, updates, zero_value=0):
+    """Increments many nested values, walking each shared key prefix once.
+
+    Missing intermediate dicts and values are added, just like with
+    increment_nested_val.
+
+    Parameters
+    ----------
+    dict_obj : dict
+        The outer-most dict to increment values in.
+    updates : iterable
+        (key_tuple, value) pairs, each giving the keys mapping to a nested
+        value to increment, in order, and the value to increment it by.
+    zero_value : object, optional
+        The value added to the given value if no existing mapping is found.
+        Set to 0 by default.
+
+    Examples
+    --------
+    >>> dict_obj = {'t1': {'e1': {200: 3}}}
+    >>> updates = [(('t1', 'e1', 200), 1), (('t1', 'e1', 500), 1),
+    ...            (('t1', 'e1', 200), 2), (('t2', 'e1', 200), 1)]
+    >>> increment_nested_many(dict_obj, updates)
+    >>> dict_obj
+    {'t1': {'e1': {200: 6, 500: 1}}, 't2': {'e1': {200: 1}}}
+
+    """
+    parents = {}
+    for key_tuple, value in updates:
+        prefix = tuple(key_tuple[:-1])
+        try:
+            parent = parents[prefix]
+        except KeyError:
+            parent = _get_or_create_nested(dict_obj, prefix)
+            parents[prefix] = parent
+        _increment_in(parent, key_tuple[-1], value, zero_value)
+
+
 def add_to_dict_val_set(dict_obj, key, val):
     """Adds the given val to the set mapped by the given key. If the key is
     missing from the dict, the given mapping is added.
@@ -575,7 +670,12 @@ def unite_dicts(*args):
     {'a': 8, 'b': 1, 'c': 5}
 
     """
-    return dict(i for dct in args for i in dct.items())
+    if not args:
+        return {}
+    united = dict(args[0])
+    for dct in args[1:]:
+        united |= dct
+    return united
 
 
 def deep_merge_dict(base, priority):
@@ -648,6 +748,92 @@ def norm_int_dict(int_dict):
     return norm_dict
 
 
+def normalize_inplace(dict_obj):
+    """Normalizes the numeric values of the given dict in place.
+
+    Unlike norm_int_dict, no copy of the dict is made.
+
+    Parameters
+    ----------
+    dict_obj : dict
+        A dict object mapping each key to a numeric value.
+
+    Example
+    -------
+    >>> dict_obj = {'a': 3, 'b': 5, 'c': 2}
+    >>> normalize_inplace(dict_obj)
+    >>> dict_obj
+    {'a': 0.3, 'b': 0.5, 'c': 0.2}
+
+    """
+    val_sum = sum(dict_obj.values())
+    for key, val in dict_obj.items():
+        dict_obj[key] = val / val_sum
+
+
+def log_norm_dict(int_dict):
+    """Returns the log of the normalized values in the given dict.
+
+    Logs are computed as log(value) - log(sum of values), so counts too
+    large to be converted to floats, or whose ratios underflow, are handled.
+
+    Parameters
+    ----------
+    int_dict : dict
+        A dict object mapping each key to a non-negative numeric value.
+
+    Returns
+    -------
+    dict
+        A dict where each key is mapped to the natural log of its relative
+        part in the sum of all dict values. Zero values map to -inf.
+
+    Example
+    -------
+    >>> dict_obj = {'a': 10 ** 400, 'b': 3 * 10 ** 400}
+    >>> log_norm = log_norm_dict(dict_obj)
+    >>> round(math.exp(log_norm['a']), 2)
+    0.25
+
+    """
+    log_sum = math.log(sum(int_dict.values()))
+    return {
+        key: math.log(val) - log_sum if val else -math.inf
+        for key, val in int_dict.items()
+    }
+
+
+def softmax_dict(log_dict):
+    """Normalizes the exponents of the log-space values in the given dict.
+
+    The maximal value is subtracted from all values before exponentiating,
+    so very large or very small log values don't overflow or underflow.
+
+    Parameters
+    ----------
+    log_dict : dict
+        A dict object mapping each key to a log-space (or score) value.
+
+    Returns
+    -------
+    dict
+        A dict where each key is mapped to the exponent of its value divided
+        by the sum of exponents of all dict values.
+
+    Example
+    -------
+    >>> softmax_dict({'a': 1000.0, 'b': 1000.0})
+    {'a': 0.5, 'b': 0.5}
+    >>> softmax_dict(log_norm_dict({'a': 1, 'b': 3}))
+    {'a': 0.25, 'b': 0.75}
+
+    """
+    max_val = max(log_dict.values())
+    exps = {key: math.exp(val - max_val) for key, val in log_dict.items()}
+    normalize_inplace(exps)
+    return exps
+
+
 def sum_num_dicts(dicts, normalize=False):
     """Sums the given dicts into a single dict mapping each key to the sum of
     its mappings in all given dicts.
@@ -680,7 +866,7 @@ def sum_num_dicts(dicts, normalize=False):
         for key in dicti:
             sum_dict[key] = sum_dict.get(key, 0) + dicti[key]
     if normalize:
-        return norm_int_dict(sum_dict)
+        normalize_inplace(sum_dict)
     return sum_dict
 
 
@@ -712,7 +898,7 @@ def sum_dicts(dicts, normalize=False):
             else:
                 sum_dict[key] = val
     if normalize:
-        return norm_int_dict(sum_dict)
+        normalize_inplace(sum_dict)
     return sum_dict
 
 
@@ -859,97 +1045,405 @@ def flatten_dict(dict_obj, separator=".", flatten_lists=False):
     return flat
 
 
-def pprint_int_dict(int_dict, indent=4, descending=False):
+def _pprint_rows(int_dict, descending, top_n, head, tail):
+    # the (key, value) rows to print, in order, with None marking where
+    # rows were omitted; heaps are used so that truncated output doesn't
+    # require sorting all items. Items are ranked by (value, insertion
+    # index), the order of a stable sort by value, so truncated output
+    # breaks ties just like full output
+    n_items = len(int_dict)
+
+    def ranked(pick, n):
+        rows = pick(n, enumerate(int_dict.items()), key=_value_then_index)
+        return [item for _, item in rows]
+
+    if top_n is not None:
+        if head is not None or tail is not None:
+            raise ValueError("top_n can't be given with head or tail.")
+        if top_n < n_items:
+            rows = ranked(heapq.nlargest, top_n)
+            if descending:
+                return rows + [None]
+            rows.reverse()
+            return [None] + rows
+    elif (head is not None or tail is not None) and (head or 0) + (
+        tail or 0
+    ) < n_items:
+        if descending:
+            first, last = heapq.nlargest, heapq.nsmallest
+        else:
+            first, last = heapq.nsmallest, heapq.nlargest
+        rows = ranked(first, head) if head else []
+        rows.append(None)
+        if tail:
+            tail_rows = ranked(last, tail)
+            tail_rows.reverse()
+            rows.extend(tail_rows)
+        return rows
+    rows = sorted(int_dict.items(), key=operator.itemgetter(1))
+    if descending:
+        rows.reverse()
+    return rows
+
+
+def _value_then_index(indexed_item):
+    ix, (_, value) = indexed_item
+    return value, ix
+
+
+def _pformat_chunks(rows, format_row, indent, chunk_size):
+    pad = " " * indent
+    lines = ["{"]
+    for row in rows:
+        lines.append(pad + "..." if row is None else format_row(pad, row))
+        if chunk_size and len(lines) >= chunk_size:
+            lines.append("")
+            yield "\n".join(lines)
+            lines = []
+    lines.extend(("}", ""))
+    yield "\n".join(lines)
+
+
+def _format_int_row(pad, row):
+    return "{}{}: {}".format(pad, row[0], row[1])
+
+
+def _format_dist_row(pad, row):
+    return "{}{}: {:.2f} %".format(pad, row[0], row[1] * 100)
+
+
+def pformat_int_dict_chunks(
+    int_dict,
+    indent=4,
+    descending=False,
+    top_n=None,
+    head=None,
+    tail=None,
+    chunk_size=1000,
+):
+    """Yields the nice representation of a dict with int values in chunks.
+
+    Chunks are produced lazily, so huge dicts can be dumped incrementally,
+    e.g. yielding to an event loop between chunks.
+
+    Parameters
+    ----------
+    int_dict : dict
+        A dict object mapping each key to an int value.
+    indent : int, default 4
+        The number of spaces to indent each item by.
+    descending : bool, default False
+        If True, items are ordered by descending value.
+    top_n : int, optional
+        If given, only the top_n items with largest values are included.
+    head : int, optional
+        If given, only the first head items, in order, are included (along
+        with any tail items).
+    tail : int, optional
+        If given, only the last tail items, in order, are included (along
+        with any head items).
+    chunk_size : int, default 1000
+        The maximal number of lines per chunk.
+
+    Returns
+    -------
+    generator
+        A generator over newline-terminated string chunks. Omitted items are
+        represented by a single '...' line.
+
+    Example
+    -------
+    >>> dict_obj = {'a': 3, 'b': 1, 'c': 7}
+    >>> print(''.join(pformat_int_dict_chunks(dict_obj, top_n=2)), end='')
+    {
+        ...
+        a: 3
+        c: 7
+    }
+
+    """
+    rows = _pprint_rows(int_dict, descending, top_n, head, tail)
+    return _pformat_chunks(rows, _format_int_row, indent, chunk_size)
+
+
+def pformat_dist_dict_chunks(
+    int_dict,
+    indent=4,
+    descending=False,
+    top_n=None,
+    head=None,
+    tail=None,
+    chunk_size=1000,
+):
+    """Yields the nice representation of a distribution dict in chunks.
+
+    Parameters
+    ----------
+    int_dict : dict
+        A dict object mapping each key to a value between 0 and 1, and all
+        values sum to 1.
+    indent : int, default 4
+        The number of spaces to indent each item by.
+    descending : bool, default False
+        If True, items are ordered by descending value.
+    top_n : int, optional
+        If given, only the top_n items with largest values are included.
+    head : int, optional
+        If given, only the first head items, in order, are included.
+    tail : int, optional
+        If given, only the last tail items, in order, are included.
+    chunk_size : int, default 1000
+        The maximal number of lines per chunk.
+
+    Returns
+    -------
+    generator
+        A generator over newline-terminated string chunks.
+
+    """
+    rows = _pprint_rows(int_dict, descending, top_n, head, tail)
+    return _pformat_chunks(rows, _format_dist_row, indent, chunk_size)
+
+
+def pprint_int_dict(
+    int_dict,
+    indent=4,
+    descending=False,
+    file=None,
+    top_n=None,
+    head=None,
+    tail=None,
+):
     """Prints the given dict with int values in a nice way.
 
+    The whole representation is written with a single write call.
+
     Parameters
     ----------
     int_dict : list
         A dict object mapping each key to an int value.
+    indent : int, default 4
+        The number of spaces to indent each item by.
+    descending : bool, default False
+        If True, items are ordered by descending value.
+    file : file-like object, optional
+        The text stream to write to. Defaults to sys.stdout.
+    top_n : int, optional
+        If given, only the top_n items with largest values are printed.
+    head : int, optional
+        If given, only the first head items, in order, are printed.
+    tail : int, optional
+        If given, only the last tail items, in order, are printed.
 
     """
-    sorted_tup = sorted(int_dict.items(), key=lambda x: x[1])
-    if descending:
-        sorted_tup.reverse()
-    print("{")
-    for tup in sorted_tup:
-        print("{}{}: {}".format(" " * indent, tup[0], tup[1]))
-    print("}")
+    if file is None:
+        file = sys.stdout
+    file.write(
+        "".join(
+            pformat_int_dict_chunks(
+                int_dict, indent, descending, top_n, head, tail, None
+            )
+        )
+    )
 
 
-def pprint_dist_dict(int_dict, indent=4, descending=False):
+def pprint_dist_dict(
+    int_dict,
+    indent=4,
+    descending=False,
+    file=None,
+    top_n=None,
+    head=None,
+    tail=None,
+):
     """Prints the given dict, representing a normalized distribution, nicely.
 
+    The whole representation is written with a single write call.
+
     Parameters
     ----------
     int_dict : list
         A dict object mapping each key to an int value between 0 and 1, and all
         values sum to 1.
+    indent : int, default 4
+        The number of spaces to indent each item by.
+    descending : bool, default False
+        If True, items are ordered by descending value.
+    file : file-like object, optional
+        The text stream to write to. Defaults to sys.stdout.
+    top_n : int, optional
+        If given, only the top_n items with largest values are printed.
+    head : int, optional
+        If given, only the first head items, in order, are printed.
+    tail : int, optional
+        If given, only the last tail items, in order, are printed.
 
     """
-    sorted_tup = sorted(int_dict.items(), key=lambda x: x[1])
-    if descending:
-        sorted_tup.reverse()
-    print("{")
-    for tup in sorted_tup:
-        print("{}{}: {:.2f} %".format(" " * indent, tup[0], tup[1] * 100))
-    print("}")
+    if file is None:
+        file = sys.stdout
+    file.write(
+        "".join(
+            pformat_dist_dict_chunks(
+                int_dict, indent, descending, top_n, head, tail, None
+            )
+        )
+    )
+
+
+def _nested_leaf_generator(dict_obj, prefix, root_path, join, max_depth):
+    # iterative depth-first walk over the leaves of nested dicts, yielding
+    # (join(parent_path, key), value) pairs, or (key, value) pairs if join
+    # is None; an explicit stack avoids both recursion limits and re-yielding
+    # every leaf up through a generator frame per level
+    if max_depth is None:
+        max_depth = float("inf")
+    node = dict_obj
+    ancestors = {id(node)}
+    path = root_path
+    for i, key in enumerate(prefix):
+        try:
+            node = node[key]
+        except (KeyError, TypeError, IndexError):
+            return
+        if not isinstance(node, dict) or i + 1 >= max_depth:
+            if i + 1 == len(prefix):
+                yield (join(path, key) if join else key), node
+            return
+        ancestors.add(id(node))
+        if join:
+            path = join(path, key)
+    stack = [(iter(node.items()), path, node)]
+    base_depth = len(prefix)
+    while stack:
+        items, path, node = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict) and base_depth + len(stack) < max_depth:
+                if id(value) in ancestors:
+                    raise ValueError("Cycle detected at key {!r}.".format(key))
+                ancestors.add(id(value))
+                stack.append(
+                    (
+                        iter(value.items()),
+                        join(path, key) if join else None,
+                        value,
+                    )
+                )
+                break
+            yield (join(path, key) if join else key), value
+        else:
+            stack.pop()
+            ancestors.discard(id(node))
+
 
+def key_value_nested_generator(dict_obj, max_depth=None, prefix=()):
+    """Iterate over key-value pairs of nested dictionaries.
 
-def key_value_nested_generator(dict_obj):
-    """Recursively iterate over key-value pairs of nested dictionaries.
+    Nested dicts are walked iteratively, depth-first, so arbitrarily deep
+    dicts are supported.
 
     Parameters
     ----------
     dict_obj : dict
         The outer-most dict to iterate on.
+    max_depth : int, optional
+        If given, dicts nested deeper than this number of levels are yielded
+        as values instead of being iterated on. Top-level keys are at
+        depth 1.
+    prefix : tuple, optional
+        If given, only the subtree mapped by this keys tuple is iterated on,
+        and no other subtree is visited.
 
     Returns
     -------
     generator
         A generator over key-value pairs in all nested dictionaries.
 
+    Raises
+    ------
+    ValueError
+        If a dict contains itself, directly or through nested dicts.
+
     Example
     -------
     >>> dicti = {'a': 1, 'b': {'c': 3, 'd': 4}}
     >>> sorted(key_value_nested_generator(dicti))
     [('a', 1), ('c', 3), ('d', 4)]
+    >>> list(key_value_nested_generator(dicti, max_depth=1))
+    [('a', 1), ('b', {'c': 3, 'd': 4})]
+    >>> list(key_value_nested_generator(dicti, prefix=('b',)))
+    [('c', 3), ('d', 4)]
 
     """
-    for key, value in dict_obj.items():
-        if isinstance(value, dict):
-            for key, val in key_value_nested_generator(value):
-                yield key, val
-        else:
-            yield key, value
+    return _nested_leaf_generator(dict_obj, prefix, None, None, max_depth)
 
 
-def key_tuple_value_nested_generator(dict_obj):
-    """Recursively iterate over key-tuple-value pairs of nested dictionaries.
+def _tuple_path_join(path, key):
+    return path + (key,)
+
+
+def key_tuple_value_nested_generator(
+    dict_obj, max_depth=None, prefix=(), paths_as="tuple", separator="."
+):
+    """Iterate over key-tuple-value pairs of nested dictionaries.
+
+    Nested dicts are walked iteratively, depth-first, so arbitrarily deep
+    dicts are supported.
 
     Parameters
     ----------
     dict_obj : dict
         The outer-most dict to iterate on.
+    max_depth : int, optional
+        If given, dicts nested deeper than this number of levels are yielded
+        as values instead of being iterated on. Top-level keys are at
+        depth 1.
+    prefix : tuple, optional
+        If given, only the subtree mapped by this keys tuple is iterated on,
+        and no other subtree is visited. Yielded paths still start with the
+        given prefix.
+    paths_as : str, default 'tuple'
+        The type of yielded key paths: 'tuple', 'list', or 'str' for string
+        representations of keys joined by the given separator.
+    separator : str, default '.'
+        The separator between keys of 'str' key paths.
 
     Returns
     -------
     generator
         A generator over key-tuple-value pairs in all nested dictionaries.
 
+    Raises
+    ------
+    ValueError
+        If a dict contains itself, directly or through nested dicts.
+
     Example
     -------
     >>> dicti = {'a': 1, 'b': {'c': 3, 'd': 4}}
     >>> sorted(key_tuple_value_nested_generator(dicti))
     [(('a',), 1), (('b', 'c'), 3), (('b', 'd'), 4)]
+    >>> list(key_tuple_value_nested_generator(dicti, paths_as='str'))
+    [('a', 1), ('b.c', 3), ('b.d', 4)]
 
     """
-    for key, value in dict_obj.items():
-        if isinstance(value, dict):
-            for nested_key, val in key_tuple_value_nested_generator(value):
-                yield (key,) + nested_key, val
-        else:
-            yield (key,), value
+    if paths_as == "str":
+
+        def _str_path_join(path, key):
+            if path is None:
+                return str(key)
+            return path + separator + str(key)
+
+        return _nested_leaf_generator(
+            dict_obj, prefix, None, _str_path_join, max_depth
+        )
+    generator = _nested_leaf_generator(
+        dict_obj, prefix, (), _tuple_path_join, max_depth
+    )
+    if paths_as == "tuple":
+        return generator
+    if paths_as == "list":
+        return ((list(path), value) for path, value in generator)
+    raise ValueError("paths_as must be one of 'tuple', 'list' or 'str'.")
 
 
 # === Classes ===
@@ -990,3 +1484,73 @@ class CaseInsensitiveDict(dict):
             else:
                 new[key] = value
         return new
+
+
+class KeyProjector:
+    """Projects dicts onto a fixed list of keys.
+
+    The keys are deduplicated once, on construction, so projecting a dict
+    costs no per-call set construction: only the projector keys or only the
+    dict keys, whichever are fewer, are iterated over.
+
+    Parameters
+    ----------
+    keys : iterable
+        The keys to keep in projected dicts. Keys not present in a projected
+        dict are ignored.
+
+    Example
+    -------
+    >>> projector = KeyProjector(['b', 'd', 'e'])
+    >>> projector({'a': 1, 'b': 2, 'd': 4})
+    {'b': 2, 'd': 4}
+    >>> projector.project_many([{'b': 1}, {'e': 5, 'f': 6}])
+    [{'b': 1}, {'e': 5}]
+
+    """
+
+    def __init__(self, keys):
+        self.keys = tuple(dict.fromkeys(keys))
+        self._rank = {key: i for i, key in enumerate(self.keys)}
+
+    def __call__(self, dict_obj):
+        """Returns a sub-dict of the given dict composed solely of the keys.
+
+        Parameters
+        ----------
+        dict_obj : dict
+            The dict to create a sub-dict from.
+
+        Returns
+        -------
+        dict
+            A sub-dict of the given dict composed solely of the projector
+            keys, in the order of the projector keys, as in subdict_by_keys.
+
+        """
+        if len(dict_obj) < len(self.keys):
+            rank = self._rank
+            found = [k for k in dict_obj if k in rank]
+            if len(found) > 1:
+                found.sort(key=rank.__getitem__)
+            return {k: dict_obj[k] for k in found}
+        return {k: dict_obj[k] for k in self.keys if k in dict_obj}
+
+    def project_many(self, dicts):
+        """Returns the sub-dicts of all given dicts composed of the keys.
+
+        Parameters
+        ----------
+        dicts : iterable
+            The dicts to create sub-dicts from.
+
+        Returns
+        -------
+        list
+            A sub-dict of each given dict, in the given order.
+
+        """
+        return list(map(self, dicts))
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self.keys))
@@ -0,0 +1,141 @@
+"""Diffing and patching nested dicts."""
+
+_MISSING = object()
+
+
+def _cached_hash(obj, hash_func, hash_cache):
+    # cache entries hold the object itself, so its id can't be reused
+    entry = hash_cache.get(id(obj))
+    if entry is not None and entry[0] is obj:
+        return entry[1]
+    obj_hash = hash_func(obj)
+    hash_cache[id(obj)] = (obj, obj_hash)
+    return obj_hash
+
+
+def diff_nested(a, b, hash_func=None, hash_cache=None):
+    """Returns the differences between two nested dicts.
+
+    Both dicts are walked together, and subtrees that are the very same
+    object in both are skipped without being visited, so diffing two
+    versions that share unchanged subtrees (like those produced by
+    apply_patch) takes time proportional to the size of the change.
+
+    Parameters
+    ----------
+    a : dict
+        The old version of the nested dict.
+    b : dict
+        The new version of the nested dict.
+    hash_func : callable, optional
+        If given, nested dicts in both versions whose hash values under this
+        function are equal (e.g. strct.hash.json_based_stable_hash) are also
+        skipped. It must map distinct values to distinct hashes; note that
+        strct.hash.stable_hash, for example, hashes floats by their integer
+        part.
+    hash_cache : dict, optional
+        A dict used to cache hash values of nested dicts by object identity
+        across calls. Only use it if cached dicts are never mutated.
+
+    Returns
+    -------
+    dict
+        A patch dict with three keys: 'added' maps each path (a keys tuple)
+        found only in b to its value; 'removed' maps each path found only in
+        a to its old value; 'changed' maps each path found in both to an
+        (old value, new value) tuple. Whole added, removed or replaced
+        subtrees are reported by their top-most path.
+
+    Example
+    -------
+    >>> a = {'x': 1, 'y': {'z': 2, 'w': 3}}
+    >>> b = {'x': 1, 'y': {'z': 5}, 'v': 7}
+    >>> patch = diff_nested(a, b)
+    >>> patch['added']
+    {('v',): 7}
+    >>> patch['removed']
+    {('y', 'w'): 3}
+    >>> patch['changed']
+    {('y', 'z'): (2, 5)}
+
+    """
+    if hash_func is not None and hash_cache is None:
+        hash_cache = {}
+    added = {}
+    removed = {}
+    changed = {}
+    stack = [((), a, b)]
+    while stack:
+        path, old, new = stack.pop()
+        for key, old_val in old.items():
+            new_val = new.get(key, _MISSING)
+            if new_val is _MISSING:
+                removed[path + (key,)] = old_val
+            elif old_val is new_val:
+                continue
+            elif isinstance(old_val, dict) and isinstance(new_val, dict):
+                if hash_func is not None and _cached_hash(
+                    old_val, hash_func, hash_cache
+                ) == _cached_hash(new_val, hash_func, hash_cache):
+                    continue
+                stack.append((path + (key,), old_val, new_val))
+            elif old_val != new_val or type(old_val) is not type(new_val):
+                changed[path + (key,)] = (old_val, new_val)
+        for key, new_val in new.items():
+            if key not in old:
+                added[path + (key,)] = new_val
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def apply_patch(dict_obj, patch):
+    """Returns a new version of a nested dict with the given patch applied.
+
+    Only dicts along patched paths are copied (shallowly); all other
+    subtrees are shared between the given and the returned dicts, which
+    keeps patching cheap and lets diff_nested skip shared subtrees later.
+
+    Parameters
+    ----------
+    dict_obj : dict
+        The nested dict to patch. It is not modified.
+    patch : dict
+        A patch dict, as returned by diff_nested. Only the new values of
+        'changed' paths are used.
+
+    Returns
+    -------
+    dict
+        The patched nested dict.
+
+    Example
+    -------
+    >>> a = {'x': 1, 'y': {'z': 2}, 'u': {'t': 4}}
+    >>> b = {'x': 1, 'y': {'z': 5}, 'u': {'t': 4}}
+    >>> c = apply_patch(a, diff_nested(a, b))
+    >>> c == b
+    True
+    >>> c['u'] is a['u']
+    True
+
+    """
+    root = dict(dict_obj)
+    copies = {(): root}
+
+    def _parent(path):
+        prefix = path[:-1]
+        parent = copies.get(prefix)
+        if parent is None:
+            grandparent = _parent(prefix)
+            original = grandparent.get(prefix[-1])
+            parent = dict(original) if isinstance(original, dict) else {}
+            grandparent[prefix[-1]] = parent
+            copies[prefix] = parent
+        return parent
+
+    for path in patch.get("removed", ()):
+        del _parent(path)[path[-1]]
+    for path, (_, new_val) in patch.get("changed", {}).items():
+        _parent(path)[path[-1]] = new_val
+    for path, new_val in patch.get("added", {}).items():
+        _parent(path)[path[-1]] = new_val
+    return root
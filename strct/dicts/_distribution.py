@@ -0,0 +1,221 @@
+"""A numpy-backed discrete probability distribution."""
+
+import math
+
+from .._optional import import_numpy
+
+
+def _numpy():
+    return import_numpy("Distribution objects")
+
+
+class Distribution:
+    """A discrete distribution over keys, backed by a probability array.
+
+    Sampling uses Vose's alias method: an alias table is built once, on the
+    first sampling call, after which drawing each sample takes O(1),
+    vectorized over all samples drawn in a call. Requires numpy.
+
+    Parameters
+    ----------
+    keys : sequence
+        The keys of the distribution.
+    weights : sequence of numbers
+        A non-negative weight for each key, in the order of keys. Weights
+        are normalized to sum to 1.
+
+    Example
+    -------
+    >>> dist = Distribution.from_dict({'a': 3, 'b': 1})
+    >>> dist['a']
+    0.75
+    >>> dist.sample(rng=0) in ('a', 'b')
+    True
+    >>> round(dist.entropy(base=2), 3)
+    0.811
+
+    """
+
+    def __init__(self, keys, weights):
+        np = _numpy()
+        self.keys = list(keys)
+        probs = np.asarray(weights, dtype=np.float64)
+        if probs.shape != (len(self.keys),):
+            raise ValueError(
+                "Got {} weights for {} keys.".format(
+                    probs.size, len(self.keys)
+                )
+            )
+        if len(probs) == 0 or (probs < 0).any() or probs.sum() <= 0:
+            raise ValueError("Weights must be non-negative with a sum > 0.")
+        self.probs = probs / probs.sum()
+        self._index = {key: i for i, key in enumerate(self.keys)}
+        self._alias = None
+        self._key_array = None
+
+    @classmethod
+    def from_dict(cls, dict_obj):
+        """Builds a distribution from a dict mapping keys to weights.
+
+        Parameters
+        ----------
+        dict_obj : dict
+            A dict object mapping each key to a non-negative numeric value,
+            e.g. a count.
+
+        Returns
+        -------
+        Distribution
+            The normalized distribution.
+
+        """
+        return cls(list(dict_obj), list(dict_obj.values()))
+
+    def to_dict(self):
+        """Returns a dict mapping each key to its probability."""
+        return dict(zip(self.keys, self.probs.tolist(), strict=True))
+
+    def _build_alias_table(self):
+        np = _numpy()
+        n = len(self.probs)
+        scaled = (self.probs * n).tolist()
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # leftovers are 1.0 up to floating point error, and keep prob 1.0
+        self._alias = (np.array(prob), np.array(alias, dtype=np.intp))
+
+    def sample_indices(self, size=None, rng=None):
+        """Draws key indices from the distribution.
+
+        Parameters
+        ----------
+        size : int, optional
+            The number of indices to draw. If not given, a single index is
+            drawn.
+        rng : numpy.random.Generator or int, optional
+            The random generator to use, or a seed for a new one.
+
+        Returns
+        -------
+        int or numpy.ndarray
+            The drawn index, or an array of size drawn indices.
+
+        """
+        np = _numpy()
+        if self._alias is None:
+            self._build_alias_table()
+        prob, alias = self._alias
+        rng = np.random.default_rng(rng)
+        columns = rng.integers(len(prob), size=size)
+        coins = rng.random(size=size)
+        indices = np.where(coins < prob[columns], columns, alias[columns])
+        if size is None:
+            return int(indices)
+        return indices
+
+    def sample(self, size=None, rng=None):
+        """Draws keys from the distribution.
+
+        Parameters
+        ----------
+        size : int, optional
+            The number of keys to draw. If not given, a single key is drawn.
+        rng : numpy.random.Generator or int, optional
+            The random generator to use, or a seed for a new one.
+
+        Returns
+        -------
+        object or numpy.ndarray
+            The drawn key, or an object array of size drawn keys.
+
+        """
+        indices = self.sample_indices(size=size, rng=rng)
+        if size is None:
+            return self.keys[indices]
+        if self._key_array is None:
+            key_array = _numpy().empty(len(self.keys), dtype=object)
+            for i, key in enumerate(self.keys):
+                key_array[i] = key
+            self._key_array = key_array
+        return self._key_array[indices]
+
+    def entropy(self, base=None):
+        """Returns the entropy of the distribution.
+
+        Parameters
+        ----------
+        base : float, optional
+            The logarithm base. Natural logarithms are used by default.
+
+        Returns
+        -------
+        float
+            The entropy of the distribution.
+
+        """
+        np = _numpy()
+        probs = self.probs[self.probs > 0]
+        entropy = -float(np.sum(probs * np.log(probs)))
+        if base is not None:
+            entropy /= math.log(base)
+        return entropy
+
+    def kl_divergence(self, other, base=None):
+        """Returns the Kullback-Leibler divergence of another distribution.
+
+        Parameters
+        ----------
+        other : Distribution
+            The distribution to measure the divergence from. Keys missing
+            from it are treated as having zero probability.
+        base : float, optional
+            The logarithm base. Natural logarithms are used by default.
+
+        Returns
+        -------
+        float
+            The KL divergence D(self || other); infinite if other assigns
+            zero probability to a key with positive probability in self.
+
+        """
+        np = _numpy()
+        if other.keys == self.keys:
+            other_probs = other.probs
+        else:
+            other_probs = np.zeros(len(self.keys))
+            for i, key in enumerate(self.keys):
+                j = other._index.get(key)
+                if j is not None:
+                    other_probs[i] = other.probs[j]
+        mask = self.probs > 0
+        probs = self.probs[mask]
+        other_probs = other_probs[mask]
+        if (other_probs == 0).any():
+            return float("inf")
+        divergence = float(np.sum(probs * np.log(probs / other_probs)))
+        if base is not None:
+            divergence /= math.log(base)
+        return divergence
+
+    def __getitem__(self, key):
+        return float(self.probs[self._index[key]])
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.to_dict())
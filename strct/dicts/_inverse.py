@@ -0,0 +1,223 @@
+"""A frozen, CSR-backed inverse index of dicts."""
+
+import array
+import json
+import mmap
+import struct
+from collections.abc import Mapping
+
+_MAGIC = b"STRCTIIX"
+_HEADER = struct.Struct("<8sQQQ")
+
+
+class InverseIndex(Mapping):
+    """A read-only index mapping each value of a dict to its sorted keys.
+
+    Keys of the indexed dict are interned to integer ids by their sorted
+    order, and values to consecutive row numbers. The ids of the keys
+    mapping to the value of row i are stored, in ascending order, at
+    positions offsets[i] to offsets[i + 1] of a single members array
+    (compressed sparse row layout), so the index holds two flat arrays and
+    two lookup tables instead of a Python list per value.
+
+    Build indices with build_inverse_index(). Indices saved with save() can
+    be opened with load(), which memory-maps the arrays so that worker
+    processes loading the same file share them instead of copying them.
+
+    Example
+    -------
+    >>> index = build_inverse_index({'a': 1, 'b': 3, 'c': 1})
+    >>> index[1]
+    ['a', 'c']
+    >>> dict(index)
+    {1: ['a', 'c'], 3: ['b']}
+
+    """
+
+    def __init__(self, keys, values, offsets, members):
+        self._keys = keys
+        self._values = values
+        self._rows = {value: i for i, value in enumerate(values)}
+        self.offsets = offsets
+        self.members = members
+        self._file = None
+        self._mmap = None
+
+    def num_members(self, value):
+        """Returns the number of keys mapping to the given value."""
+        row = self._rows[value]
+        return self.offsets[row + 1] - self.offsets[row]
+
+    def __getitem__(self, value):
+        row = self._rows[value]
+        keys = self._keys
+        return [
+            keys[i]
+            for i in self.members[self.offsets[row] : self.offsets[row + 1]]
+        ]
+
+    def __contains__(self, value):
+        return value in self._rows
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, dict(self.items()))
+
+    def save(self, path):
+        """Saves the index to a file that can be memory-mapped by load().
+
+        The interned key and value tables are stored as JSON, so keys and
+        values must be str, int, float or bool objects.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The path of the file to write.
+
+        """
+        tables = json.dumps([self._keys, self._values]).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC, len(self._values), len(self.members), len(tables)
+                )
+            )
+            array.array("q", self.offsets).tofile(f)
+            array.array("q", self.members).tofile(f)
+            f.write(tables)
+
+    @classmethod
+    def load(cls, path):
+        """Opens an index saved with save(), memory-mapping its arrays.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The path of the saved index.
+
+        Returns
+        -------
+        InverseIndex
+            The loaded index. Call close() to release the mapped file.
+
+        """
+        f = open(path, "rb")  # noqa: SIM115
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be memory-mapped
+            f.close()
+            raise ValueError("{} is not a saved index.".format(path)) from None
+        if buf[: len(_MAGIC)] != _MAGIC:
+            buf.close()
+            f.close()
+            raise ValueError("{} is not a saved index.".format(path))
+        views = []
+        try:
+            _, n_values, n_members, tables_len = _HEADER.unpack_from(buf)
+            members_start = _HEADER.size + 8 * (n_values + 1)
+            tables_start = members_start + 8 * n_members
+            if tables_start + tables_len > len(buf):
+                raise ValueError("truncated file")
+            view = memoryview(buf)
+            views.append(view)
+            offsets = view[_HEADER.size : members_start].cast("q")
+            views.append(offsets)
+            members = view[members_start:tables_start].cast("q")
+            views.append(members)
+            keys, values = json.loads(
+                bytes(view[tables_start : tables_start + tables_len])
+            )
+            index = cls(keys, values, offsets, members)
+        except (ValueError, TypeError, struct.error) as err:
+            for memview in views:
+                memview.release()
+            buf.close()
+            f.close()
+            raise ValueError("corrupt inverse index file") from err
+        view.release()
+        index._file = f
+        index._mmap = buf
+        return index
+
+    def close(self):
+        """Releases the mapped file of an index opened with load()."""
+        if self._mmap is None:
+            return
+        self.offsets.release()
+        self.members.release()
+        self.offsets = self.members = None
+        self._mmap.close()
+        self._file.close()
+        self._mmap = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def build_inverse_index(dict_obj, list_valued=False):
+    """Builds a frozen index mapping each value of a dict to its sorted keys.
+
+    This is a compact, read-only equivalent of reverse_dict (or of
+    reverse_list_valued_dict, for list-valued dicts).
+
+    Parameters
+    ----------
+    dict_obj : dict
+        A key-value dict. Keys must be mutually comparable.
+    list_valued : bool, default False
+        If True, each key of the given dict maps to an iterable of values,
+        and the key is indexed under each of them.
+
+    Returns
+    -------
+    InverseIndex
+        An index where each value maps to a sorted list of all the unique
+        keys that mapped to it.
+
+    Example
+    -------
+    >>> index = build_inverse_index({'a': [1, 2], 'b': [2]}, list_valued=True)
+    >>> index[2]
+    ['a', 'b']
+
+    """
+    keys = sorted(dict_obj)
+    rows = {}
+    counts = []
+    for key in keys:
+        # a value repeated in one list indexes its key only once
+        key_values = (
+            dict.fromkeys(dict_obj[key]) if list_valued else (dict_obj[key],)
+        )
+        for value in key_values:
+            row = rows.get(value)
+            if row is None:
+                rows[value] = len(counts)
+                counts.append(1)
+            else:
+                counts[row] += 1
+    offsets = array.array("q", [0]) * (len(counts) + 1)
+    total = 0
+    for row, count in enumerate(counts):
+        total += count
+        offsets[row + 1] = total
+    members = array.array("q", [0]) * total
+    # keys are visited in sorted order, so each row is filled sorted
+    fill = array.array("q", offsets[:-1])
+    for key_id, key in enumerate(keys):
+        key_values = (
+            dict.fromkeys(dict_obj[key]) if list_valued else (dict_obj[key],)
+        )
+        for value in key_values:
+            row = rows[value]
+            members[fill[row]] = key_id
+            fill[row] += 1
+    return InverseIndex(keys, list(rows), offsets, members)
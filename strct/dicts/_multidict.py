@@ -0,0 +1,300 @@
+"""Compact multi-valued dicts."""
+
+import array
+from abc import abstractmethod
+from collections.abc import Mapping, MutableMapping
+
+
+class _ValueList(list):
+    __slots__ = ()
+
+
+class _ValueSet(set):
+    __slots__ = ()
+
+
+class _MultiDictBase(MutableMapping):
+    # subclasses set the container type used for keys with 2+ values and
+    # the public type of the value collections they return
+    _container = None
+    _public = None
+
+    def __init__(self, pairs=None):
+        self._data = {}
+        if pairs is not None:
+            self.extend_from_pairs(pairs)
+
+    @abstractmethod
+    def add(self, key, value):
+        """Adds a value to the values of the given key."""
+
+    def extend(self, key, values):
+        """Adds all given values to the values of the given key.
+
+        Parameters
+        ----------
+        key : object
+            The key to add values to.
+        values : iterable
+            The values to add.
+
+        """
+        add = self.add
+        for value in values:
+            add(key, value)
+
+    def extend_from_pairs(self, pairs):
+        """Adds many values from an iterable of key-value pairs.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (key, value) pairs.
+
+        """
+        add = self.add
+        for key, value in pairs:
+            add(key, value)
+
+    def num_values(self, key):
+        """Returns the number of values mapped by the given key.
+
+        Parameters
+        ----------
+        key : object
+            The key whose values to count. Raises KeyError if missing.
+
+        Returns
+        -------
+        int
+            The number of values mapped by the given key.
+
+        """
+        values = self._data[key]
+        if type(values) is self._container:
+            return len(values)
+        return 1
+
+    def freeze(self, typecode=None):
+        """Returns a read-only, CSR-layout copy of this multi-valued dict.
+
+        Parameters
+        ----------
+        typecode : str, optional
+            If given, values are stored in an array.array with this typecode
+            (e.g. 'q' for int values) instead of a list of Python objects.
+
+        Returns
+        -------
+        FrozenMultiDict
+            A frozen copy of this multi-valued dict.
+
+        """
+        return FrozenMultiDict(self, typecode=typecode)
+
+    def to_dict(self):
+        """Returns a plain dict mapping each key to a collection of values.
+
+        Returns
+        -------
+        dict
+            A dict mapping each key to a list or set of its values, like
+            those built with append_to_dict_val_list or add_to_dict_val_set.
+
+        """
+        return {key: self[key] for key in self._data}
+
+    def __getitem__(self, key):
+        values = self._data[key]
+        if type(values) is self._container:
+            return self._public(values)
+        return self._public((values,))
+
+    def __setitem__(self, key, values):
+        values = self._container(values)
+        if len(values) > 1:
+            self._data[key] = values
+        elif values:
+            self._data[key] = next(iter(values))
+        else:
+            self._data.pop(key, None)
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.to_dict())
+
+
+class MultiDict(_MultiDictBase):
+    """A dict mapping each key to a list of values, stored compactly.
+
+    A key mapped to a single value stores it inline, and is promoted to a
+    list only when a second value is added, sparing the memory of a list
+    object per key for mostly single-valued mappings. Indexing returns a new
+    list of the values of a key.
+
+    Parameters
+    ----------
+    pairs : iterable, optional
+        (key, value) pairs to initialize the dict with.
+
+    Example
+    -------
+    >>> mdict = MultiDict([('a', 1), ('b', 2)])
+    >>> mdict.add('a', 3)
+    >>> mdict['a']
+    [1, 3]
+    >>> mdict['b']
+    [2]
+    >>> mdict.freeze()['a']
+    [1, 3]
+
+    """
+
+    _container = _ValueList
+    _public = list
+
+    def add(self, key, value):
+        """Appends the given value to the values of the given key.
+
+        Parameters
+        ----------
+        key : object
+            The key to add a value to.
+        value : object
+            The value to add.
+
+        """
+        data = self._data
+        try:
+            values = data[key]
+        except KeyError:
+            data[key] = value
+            return
+        if type(values) is _ValueList:
+            values.append(value)
+        else:
+            data[key] = _ValueList((values, value))
+
+
+class MultiSet(_MultiDictBase):
+    """A dict mapping each key to a set of values, stored compactly.
+
+    A key mapped to a single value stores it inline, and is promoted to a
+    set only when a second, different, value is added, sparing the memory of
+    a set object per key for mostly single-valued mappings. Indexing returns
+    a new set of the values of a key.
+
+    Parameters
+    ----------
+    pairs : iterable, optional
+        (key, value) pairs to initialize the dict with.
+
+    Example
+    -------
+    >>> mset = MultiSet([('a', 1), ('b', 2), ('a', 1)])
+    >>> mset['a']
+    {1}
+    >>> mset.add('a', 3)
+    >>> mset['a']
+    {1, 3}
+
+    """
+
+    _container = _ValueSet
+    _public = set
+
+    def add(self, key, value):
+        """Adds the given value to the values of the given key.
+
+        Parameters
+        ----------
+        key : object
+            The key to add a value to.
+        value : object
+            The value to add.
+
+        """
+        data = self._data
+        try:
+            values = data[key]
+        except KeyError:
+            data[key] = value
+            return
+        if type(values) is _ValueSet:
+            values.add(value)
+        elif values != value:
+            data[key] = _ValueSet((values, value))
+
+
+class FrozenMultiDict(Mapping):
+    """A read-only multi-valued dict in compressed sparse row (CSR) layout.
+
+    The values of all keys are stored contiguously in a single list, or in an
+    array.array if a typecode is given, with the values of the i-th key at
+    positions offsets[i] to offsets[i + 1]. Indexing returns a new list of
+    the values of a key.
+
+    Parameters
+    ----------
+    mapping : mapping
+        A mapping of each key to an iterable of its values, such as a
+        MultiDict or a dict of lists.
+    typecode : str, optional
+        If given, values are stored in an array.array with this typecode.
+
+    Example
+    -------
+    >>> fdict = FrozenMultiDict({'a': [1, 3], 'b': [2]}, typecode='q')
+    >>> fdict['a']
+    [1, 3]
+    >>> len(fdict)
+    2
+
+    """
+
+    def __init__(self, mapping, typecode=None):
+        self._keys = list(mapping)
+        self._index = {key: i for i, key in enumerate(self._keys)}
+        self.offsets = array.array("q", [0])
+        values = []
+        for key in self._keys:
+            values.extend(mapping[key])
+            self.offsets.append(len(values))
+        if typecode is not None:
+            values = array.array(typecode, values)
+        self.values = values
+
+    def num_values(self, key):
+        """Returns the number of values mapped by the given key."""
+        i = self._index[key]
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def __getitem__(self, key):
+        i = self._index[key]
+        values = self.values[self.offsets[i] : self.offsets[i + 1]]
+        if isinstance(values, list):
+            return values
+        return values.tolist()
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, dict(self.items()))
@@ -0,0 +1,237 @@
+"""A path-indexed, read-only view of a static nested dict."""
+
+import itertools
+
+_MISSING = object()
+
+
+class NestedIndex:
+    """A hash table mapping each key path of a nested dict to its value.
+
+    Every path of the indexed dict, to both nested dicts and leaf values, is
+    stored in a single dict keyed by key tuples, so looking up a path of any
+    depth takes one hash lookup instead of one per level. Leaf values are
+    also stored in depth-first order, with each nested dict recording the
+    range of its leaves, so enumerating the leaves under a prefix is a
+    slice. Only dicts are descended into; any other value is a leaf.
+
+    The indexed dict must not be mutated after the index is built.
+
+    Parameters
+    ----------
+    dict_obj : dict
+        The nested dict to index.
+    lazy : bool, default False
+        If True, the subtree under each top-level key is only indexed on the
+        first query involving it. Queries with a wildcard top-level key
+        index all subtrees.
+
+    Example
+    -------
+    >>> catalog = {'items': {'a': {'price': 3}, 'b': {'price': 5}}, 'v': 1}
+    >>> index = NestedIndex(catalog)
+    >>> index[('items', 'a', 'price')]
+    3
+    >>> ('items', 'c') in index
+    False
+    >>> index.match(('items', '*', 'price'))
+    [(('items', 'a', 'price'), 3), (('items', 'b', 'price'), 5)]
+    >>> list(index.items(('items', 'b')))
+    [(('items', 'b', 'price'), 5)]
+
+    """
+
+    def __init__(self, dict_obj, lazy=False):
+        self._root = dict_obj
+        self._table = {(): dict_obj}
+        # maps each top-level key to the (path, value) leaves under it, and
+        # each nested dict path to the range of its leaves in that list
+        self._leaves = {}
+        self._ranges = {}
+        self._match_cache = {}
+        self._lazy = lazy
+        if not lazy:
+            for key in dict_obj:
+                self._index_top_level(key)
+
+    def _index_top_level(self, key):
+        table = self._table
+        ranges = self._ranges
+        leaves = []
+        self._leaves[key] = leaves
+        root_path = (key,)
+        value = self._root[key]
+        table[root_path] = value
+        if not isinstance(value, dict):
+            leaves.append((root_path, value))
+            return
+        stack = [(root_path, iter(value.items()), 0)]
+        while stack:
+            path, items, start = stack[-1]
+            for child_key, child in items:
+                child_path = path + (child_key,)
+                table[child_path] = child
+                if isinstance(child, dict):
+                    stack.append(
+                        (child_path, iter(child.items()), len(leaves))
+                    )
+                    break
+                leaves.append((child_path, child))
+            else:
+                stack.pop()
+                ranges[path] = (start, len(leaves))
+
+    def _ensure_indexed(self, key):
+        if key not in self._leaves and key in self._root:
+            self._index_top_level(key)
+
+    def _ensure_all_indexed(self):
+        for key in self._root:
+            self._ensure_indexed(key)
+
+    def get(self, key_tuple, default_value=None):
+        """Returns the value at the given path, or a default value.
+
+        Parameters
+        ----------
+        key_tuple : tuple
+            The path to look up.
+        default_value : object, default None
+            The value to return if the path is not in the indexed dict.
+
+        Returns
+        -------
+        value : object
+            The value at the given path, if exists. Otherwise, the given
+            default_value.
+
+        """
+        if self._lazy and key_tuple:
+            self._ensure_indexed(key_tuple[0])
+        return self._table.get(key_tuple, default_value)
+
+    def __getitem__(self, key_tuple):
+        value = self.get(key_tuple, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key_tuple)
+        return value
+
+    def __contains__(self, key_tuple):
+        return self.get(key_tuple, _MISSING) is not _MISSING
+
+    def __len__(self):
+        """Returns the number of leaf values in the indexed dict."""
+        self._ensure_all_indexed()
+        return sum(len(leaves) for leaves in self._leaves.values())
+
+    def get_alternative(self, key_tuple, default_value=None):
+        """Returns the value at the first existing path of several.
+
+        Parameters
+        ----------
+        key_tuple : tuple
+            Describes all possible paths, as in get_alternative_nested_val:
+            each element is either a key or a list or tuple of alternative
+            keys. Paths are tried in the same order.
+        default_value : object, default None
+            The value to return if none of the paths is in the indexed dict.
+
+        Returns
+        -------
+        value : object
+            The value at the first existing path, if any. Otherwise, the
+            given default_value.
+
+        Example
+        -------
+        >>> index = NestedIndex({'a': {'b': 7}})
+        >>> index.get_alternative(('a', ('c', 'b')))
+        7
+
+        """
+        options = [
+            key if isinstance(key, (list, tuple)) else (key,)
+            for key in key_tuple
+        ]
+        for path in itertools.product(*options):
+            value = self.get(path, _MISSING)
+            if value is not _MISSING:
+                return value
+        return default_value
+
+    def items(self, prefix=()):
+        """Yields the (path, value) pairs of all leaves under a prefix.
+
+        Parameters
+        ----------
+        prefix : tuple, default ()
+            The path of a nested dict. By default, all leaves are yielded.
+
+        Yields
+        ------
+        path : tuple
+            The full path of a leaf value.
+        value : object
+            The leaf value.
+
+        """
+        if not prefix:
+            self._ensure_all_indexed()
+            for leaves in self._leaves.values():
+                yield from leaves
+            return
+        if self._lazy:
+            self._ensure_indexed(prefix[0])
+        leaf_range = self._ranges.get(prefix)
+        if leaf_range is not None:
+            start, end = leaf_range
+            yield from self._leaves[prefix[0]][start:end]
+        elif prefix in self._table:  # a leaf
+            yield prefix, self._table[prefix]
+
+    def match(self, pattern, wildcard="*"):
+        """Returns the (path, value) pairs of all paths matching a pattern.
+
+        Results are cached by pattern, so repeating a query is a lookup.
+
+        Parameters
+        ----------
+        pattern : tuple
+            A path in which some keys may be the wildcard.
+        wildcard : object, default '*'
+            The key matching any single key.
+
+        Returns
+        -------
+        list of tuple
+            The (path, value) pairs of all paths of the same length as the
+            pattern, matching it, in the order of the indexed dict.
+
+        """
+        pattern = tuple(pattern)
+        cache_key = (pattern, wildcard)
+        cached = self._match_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        if self._lazy and pattern:
+            if pattern[0] == wildcard:
+                self._ensure_all_indexed()
+            else:
+                self._ensure_indexed(pattern[0])
+        table = self._table
+        paths = [()]
+        for key in pattern:
+            if key == wildcard:
+                paths = [
+                    path + (child_key,)
+                    for path in paths
+                    if isinstance(table[path], dict)
+                    for child_key in table[path]
+                ]
+            else:
+                paths = [
+                    path + (key,) for path in paths if path + (key,) in table
+                ]
+        result = tuple((path, table[path]) for path in paths)
+        self._match_cache[cache_key] = result
+        return list(result)
@@ -0,0 +1,491 @@
+"""A persistent nested dict, with updates sharing unchanged structure."""
+
+from collections.abc import Mapping
+
+from ..hash._hash import _recursive_stable_hash
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+_MISSING = object()
+
+# A hash array mapped trie (HAMT): each node consumes five bits of the key
+# hash, and holds a bitmap of the occupied slots among its 32 ones, and a
+# tuple of just the occupied entries. Entries are either (hash, key, value)
+# leaf tuples or child nodes. Keys whose 64 hash bits are all equal share a
+# collision node. Updates copy only the nodes on the path to the key.
+
+
+class _Node:
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap, entries):
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _CollisionNode:
+    __slots__ = ("entries",)
+
+    def __init__(self, entries):
+        self.entries = entries
+
+
+_EMPTY = _Node(0, ())
+
+
+def _find(node, key_hash, key):
+    shift = 0
+    while True:
+        if type(node) is _CollisionNode:
+            for _, leaf_key, value in node.entries:
+                if leaf_key is key or leaf_key == key:
+                    return value
+            return _MISSING
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return _MISSING
+        entry = node.entries[(node.bitmap & (bit - 1)).bit_count()]
+        if type(entry) is tuple:
+            if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+                return entry[2]
+            return _MISSING
+        node = entry
+        shift += _BITS
+
+
+def _pair(shift, leaf1, leaf2):
+    # a node holding two leaves with different keys
+    if shift >= _HASH_BITS:
+        return _CollisionNode((leaf1, leaf2))
+    ix1 = (leaf1[0] >> shift) & _MASK
+    ix2 = (leaf2[0] >> shift) & _MASK
+    if ix1 == ix2:
+        return _Node(1 << ix1, (_pair(shift + _BITS, leaf1, leaf2),))
+    if ix1 > ix2:
+        leaf1, leaf2 = leaf2, leaf1
+    return _Node((1 << ix1) | (1 << ix2), (leaf1, leaf2))
+
+
+def _assoc(node, shift, leaf):
+    # returns the new node and whether a key was added
+    key_hash, key, value = leaf
+    if type(node) is _CollisionNode:
+        entries = node.entries
+        for i, (_, leaf_key, _) in enumerate(entries):
+            if leaf_key is key or leaf_key == key:
+                entries = entries[:i] + (leaf,) + entries[i + 1 :]
+                return _CollisionNode(entries), False
+        return _CollisionNode(entries + (leaf,)), True
+    bit = 1 << ((key_hash >> shift) & _MASK)
+    ix = (node.bitmap & (bit - 1)).bit_count()
+    entries = node.entries
+    if not node.bitmap & bit:
+        entries = entries[:ix] + (leaf,) + entries[ix:]
+        return _Node(node.bitmap | bit, entries), True
+    entry = entries[ix]
+    if type(entry) is tuple:
+        if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+            if entry[2] is value:
+                return node, False
+            new_entry, added = leaf, False
+        else:
+            new_entry, added = _pair(shift + _BITS, entry, leaf), True
+    else:
+        new_entry, added = _assoc(entry, shift + _BITS, leaf)
+        if new_entry is entry:
+            return node, False
+    entries = entries[:ix] + (new_entry,) + entries[ix + 1 :]
+    return _Node(node.bitmap, entries), added
+
+
+def _dissoc(node, shift, key_hash, key):
+    # returns the new node, a lone leaf tuple to inline into the parent, or
+    # None if the node is left empty; raises KeyError if the key is missing
+    if type(node) is _CollisionNode:
+        entries = tuple(
+            entry
+            for entry in node.entries
+            if not (entry[1] is key or entry[1] == key)
+        )
+        if len(entries) == len(node.entries):
+            raise KeyError(key)
+        if len(entries) == 1:
+            return entries[0]
+        return _CollisionNode(entries)
+    bit = 1 << ((key_hash >> shift) & _MASK)
+    if not node.bitmap & bit:
+        raise KeyError(key)
+    ix = (node.bitmap & (bit - 1)).bit_count()
+    entries = node.entries
+    entry = entries[ix]
+    if type(entry) is tuple:
+        if not (entry[0] == key_hash and (entry[1] is key or entry[1] == key)):
+            raise KeyError(key)
+        new_entry = None
+    else:
+        new_entry = _dissoc(entry, shift + _BITS, key_hash, key)
+    if new_entry is None:
+        entries = entries[:ix] + entries[ix + 1 :]
+        if not entries:
+            return None
+        if len(entries) == 1 and type(entries[0]) is tuple:
+            return entries[0]
+        return _Node(node.bitmap ^ bit, entries)
+    if len(entries) == 1 and type(new_entry) is tuple:
+        return new_entry
+    entries = entries[:ix] + (new_entry,) + entries[ix + 1 :]
+    return _Node(node.bitmap, entries)
+
+
+def _leaves(root):
+    stack = [root]
+    while stack:
+        for entry in reversed(stack.pop().entries):
+            if type(entry) is tuple:
+                yield entry
+            else:
+                stack.append(entry)
+
+
+def _freeze(value):
+    if isinstance(value, FrozenNestedDict):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenNestedDict(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    if isinstance(value, FrozenNestedDict):
+        return value.to_dict()
+    if type(value) is tuple:
+        return [_thaw(item) for item in value]
+    if type(value) is frozenset:
+        # set items must stay hashable, so they are kept frozen
+        return set(value)
+    return value
+
+
+class FrozenNestedDict(Mapping):
+    """An immutable nested dict, whose updates return new versions.
+
+    Every level is stored as a hash array mapped trie (HAMT), so set_in(),
+    update_in(), delete_in() and merge() copy only the O(log n) trie nodes
+    on the path to each changed key, at every level of the path, and share
+    everything else with the original version. Versions can thus be kept
+    and passed between threads freely, without defensive deep copies;
+    copy.copy() and copy.deepcopy() return the dict itself.
+
+    Values are frozen recursively: dicts (and other mappings) are converted
+    to FrozenNestedDicts, lists to tuples and sets to frozensets. Other
+    values are stored as they are, and must be hashable for the dict to be
+    hashable; they are assumed not to be mutated. to_dict() converts them
+    back, returning tuples as lists and frozensets as sets. The hash of a
+    FrozenNestedDict, and its stable_hash() value, are computed once and
+    cached, and both are computed from the cached hashes of its nested
+    FrozenNestedDicts, so rehashing a new version only hashes its new
+    levels. Keys are iterated in hash order, not in insertion order.
+
+    Parameters
+    ----------
+    mapping : mapping or iterable, optional
+        Initial key-value pairs, or a mapping of them.
+
+    Example
+    -------
+    >>> config = FrozenNestedDict({'db': {'host': 'a', 'port': 5432}})
+    >>> new_config = config.set_in(('db', 'host'), 'b')
+    >>> config['db']['host'], new_config['db']['host']
+    ('a', 'b')
+    >>> new_config.to_dict() == {'db': {'host': 'b', 'port': 5432}}
+    True
+    >>> cache = {new_config: 'seen'}
+    >>> cache[config.set_in(('db', 'host'), 'b')]
+    'seen'
+
+    """
+
+    __slots__ = ("_root", "_len", "_hash", "_stable_hash")
+
+    def __init__(self, mapping=()):
+        root = _EMPTY
+        length = 0
+        items = mapping.items() if isinstance(mapping, Mapping) else mapping
+        for key, value in items:
+            root, added = _assoc(
+                root, 0, (hash(key) & _HASH_MASK, key, _freeze(value))
+            )
+            length += added
+        self._root = root
+        self._len = length
+        self._hash = None
+        self._stable_hash = None
+
+    @classmethod
+    def _from_root(cls, root, length):
+        fdict = cls.__new__(cls)
+        fdict._root = root
+        fdict._len = length
+        fdict._hash = None
+        fdict._stable_hash = None
+        return fdict
+
+    # === single-level updates ===
+
+    def set(self, key, value):
+        """Returns a new version with the given key mapped to a value."""
+        root, added = _assoc(
+            self._root, 0, (hash(key) & _HASH_MASK, key, _freeze(value))
+        )
+        if root is self._root:
+            return self
+        return self._from_root(root, self._len + added)
+
+    def delete(self, key):
+        """Returns a new version without the given key.
+
+        Raises a KeyError if the key is missing.
+        """
+        key_hash = hash(key) & _HASH_MASK
+        root = _dissoc(self._root, 0, key_hash, key)
+        if root is None:
+            root = _EMPTY
+        elif type(root) is tuple:  # a lone leaf, which needs a root node
+            root = _Node(1 << (root[0] & _MASK), (root,))
+        return self._from_root(root, self._len - 1)
+
+    # === nested access and updates ===
+
+    def get_in(self, key_tuple, default=None):
+        """Returns the value at the given path, or default if it is missing.
+
+        Example
+        -------
+        >>> fdict = FrozenNestedDict({'a': {'b': 1}})
+        >>> fdict.get_in(('a', 'b')), fdict.get_in(('a', 'c'), 0)
+        (1, 0)
+
+        """
+        value = self
+        for key in key_tuple:
+            if not isinstance(value, FrozenNestedDict):
+                return default
+            value = _find(value._root, hash(key) & _HASH_MASK, key)
+            if value is _MISSING:
+                return default
+        return value
+
+    def set_in(self, key_tuple, value):
+        """Returns a new version with the value at the given path replaced.
+
+        Missing intermediate levels are created. Raises a TypeError if a
+        value on the path, other than the last one, is not a
+        FrozenNestedDict.
+
+        Parameters
+        ----------
+        key_tuple : tuple
+            The path of keys to the value; must not be empty.
+        value : object
+            The new value.
+
+        Returns
+        -------
+        FrozenNestedDict
+            The new version, sharing all unchanged levels and trie nodes
+            with this one.
+
+        Example
+        -------
+        >>> fdict = FrozenNestedDict({'a': {'b': 1}, 'c': {'d': 2}})
+        >>> new_fdict = fdict.set_in(('a', 'x', 'y'), 3)
+        >>> new_fdict['a'].to_dict() == {'b': 1, 'x': {'y': 3}}
+        True
+        >>> new_fdict['c'] is fdict['c']
+        True
+
+        """
+        if not key_tuple:
+            raise ValueError("key_tuple must not be empty.")
+        key = key_tuple[0]
+        if len(key_tuple) == 1:
+            return self.set(key, value)
+        child = _find(self._root, hash(key) & _HASH_MASK, key)
+        if child is _MISSING:
+            child = _EMPTY_DICT
+        elif not isinstance(child, FrozenNestedDict):
+            raise TypeError(
+                "The value at key {!r} is not a FrozenNestedDict.".format(key)
+            )
+        return self.set(key, child.set_in(key_tuple[1:], value))
+
+    def update_in(self, key_tuple, func, default=None):
+        """Returns a new version with the value at the given path updated.
+
+        Parameters
+        ----------
+        key_tuple : tuple
+            The path of keys to the value; must not be empty.
+        func : callable
+            Called with the current value, returning the new one.
+        default : object, optional
+            The value func is called with if the path is missing.
+
+        Returns
+        -------
+        FrozenNestedDict
+            The new version.
+
+        Example
+        -------
+        >>> fdict = FrozenNestedDict({'hits': {'a': 1}})
+        >>> fdict = fdict.update_in(('hits', 'a'), lambda x: x + 1)
+        >>> fdict = fdict.update_in(('hits', 'b'), lambda x: x + 1, 0)
+        >>> fdict['hits'].to_dict() == {'a': 2, 'b': 1}
+        True
+
+        """
+        return self.set_in(key_tuple, func(self.get_in(key_tuple, default)))
+
+    def delete_in(self, key_tuple):
+        """Returns a new version without the value at the given path.
+
+        Levels left empty are kept. Raises a KeyError if the path is missing.
+        """
+        if not key_tuple:
+            raise ValueError("key_tuple must not be empty.")
+        if len(key_tuple) == 1:
+            return self.delete(key_tuple[0])
+        child = self[key_tuple[0]]
+        if not isinstance(child, FrozenNestedDict):
+            raise KeyError(key_tuple[1])
+        return self.set(key_tuple[0], child.delete_in(key_tuple[1:]))
+
+    def merge(self, priority):
+        """Returns a recursive merge of this dict with a higher-priority one.
+
+        The merge rules are those of deep_merge_dict(): nested dicts are
+        merged recursively, and any other value of priority replaces the
+        value at the same path. Only the merged-in paths are copied.
+
+        Parameters
+        ----------
+        priority : mapping
+            The higher-priority dict to merge in, either a
+            FrozenNestedDict or any nested mapping.
+
+        Returns
+        -------
+        FrozenNestedDict
+            The merged version.
+
+        Example
+        -------
+        >>> base = FrozenNestedDict({'a': 1, 'c': {'d': 4, 'e': 5}})
+        >>> merged = base.merge({'a': {'g': 7}, 'c': {'d': 3}})
+        >>> merged.to_dict() == {'a': {'g': 7}, 'c': {'d': 3, 'e': 5}}
+        True
+
+        """
+        result = self
+        for key, value in priority.items():
+            current = _find(result._root, hash(key) & _HASH_MASK, key)
+            if isinstance(current, FrozenNestedDict) and isinstance(
+                value, Mapping
+            ):
+                value = current.merge(value)
+            result = result.set(key, value)
+        return result
+
+    def to_dict(self):
+        """Returns a nested dict copy of this dict.
+
+        Frozen values are converted back: tuples to lists and frozensets to
+        sets, so tuples and frozensets given on construction are returned
+        as lists and sets too. Items of sets are returned as stored.
+        """
+        return {key: _thaw(value) for _, key, value in _leaves(self._root)}
+
+    # === mapping methods ===
+
+    def __getitem__(self, key):
+        value = _find(self._root, hash(key) & _HASH_MASK, key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = _find(self._root, hash(key) & _HASH_MASK, key)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key):
+        try:
+            key_hash = hash(key) & _HASH_MASK
+        except TypeError:
+            return False
+        return _find(self._root, key_hash, key) is not _MISSING
+
+    def __iter__(self):
+        return (key for _, key, _ in _leaves(self._root))
+
+    def items(self):
+        return [(key, value) for _, key, value in _leaves(self._root)]
+
+    def values(self):
+        return [value for _, _, value in _leaves(self._root)]
+
+    def __len__(self):
+        return self._len
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, FrozenNestedDict):
+            if self._root is other._root:
+                return True
+            if self._len != other._len:
+                return False
+            if (
+                self._hash is not None
+                and other._hash is not None
+                and self._hash != other._hash
+            ):
+                return False
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self.items()))
+        return self._hash
+
+    def __stable_hash__(self):
+        # called by stable_hash(), instead of hashing the items anew
+        if self._stable_hash is None:
+            self._stable_hash = hash(
+                frozenset(
+                    _recursive_stable_hash(item) for item in self.items()
+                )
+            )
+        return self._stable_hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (self.to_dict(),))
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.to_dict())
+
+
+_EMPTY_DICT = FrozenNestedDict()
@@ -0,0 +1,307 @@
+"""Compiled wildcard path queries over nested dicts and lists."""
+
+import functools
+
+ANY_KEY = "*"
+ANY_DEPTH = "**"
+
+_EXACT = 0
+_ANY_KEY = 1
+_ANY_DEPTH = 2
+_SLICE = 3
+_PREDICATE = 4
+
+_MISSING = object()
+
+
+def _parse_token(token):
+    if token in (ANY_KEY, ANY_DEPTH):
+        return token
+    if token.startswith("[") and token.endswith("]"):
+        inner = token[1:-1]
+        try:
+            if ":" not in inner:
+                return int(inner)
+            bounds = [int(x) if x.strip() else None for x in inner.split(":")]
+        except ValueError:
+            raise ValueError(
+                "Invalid index token {!r}.".format(token)
+            ) from None
+        if len(bounds) > 3:
+            raise ValueError("Invalid slice token {!r}.".format(token))
+        return slice(*bounds)
+    return token
+
+
+def _lookup(node, key):
+    if isinstance(node, dict):
+        return node.get(key, _MISSING)
+    if (
+        isinstance(node, (list, tuple))
+        and isinstance(key, int)
+        and 0 <= key < len(node)
+    ):
+        return node[key]
+    return _MISSING
+
+
+def _children(node):
+    if isinstance(node, dict):
+        return node.items()
+    if isinstance(node, (list, tuple)):
+        return enumerate(node)
+    return ()
+
+
+class Query:
+    """A compiled path query, matched against nested dicts and lists.
+
+    Create queries with compile_query(), or use select() directly; both
+    cache compiled queries.
+
+    Parameters
+    ----------
+    steps : tuple
+        The steps of the query, as accepted by compile_query().
+
+    """
+
+    def __init__(self, steps):
+        self.steps = tuple(steps)
+        kinds = []
+        for step in self.steps:
+            if isinstance(step, str) and step == ANY_DEPTH:
+                kinds.append(_ANY_DEPTH)
+            elif isinstance(step, str) and step == ANY_KEY:
+                kinds.append(_ANY_KEY)
+            elif isinstance(step, slice):
+                kinds.append(_SLICE)
+            elif callable(step):
+                kinds.append(_PREDICATE)
+            else:
+                kinds.append(_EXACT)
+        self._kinds = tuple(kinds)
+        self._exact_only = all(kind == _EXACT for kind in kinds)
+        # per set of active states: how children move between states
+        self._plans = {}
+        self._closures = {}
+
+    def _closure(self, states):
+        # a ** step may match zero levels, so its next step is also active
+        states = frozenset(states)
+        closed = self._closures.get(states)
+        if closed is not None:
+            return closed
+        kinds = self._kinds
+        result = set()
+        for state in states:
+            while state not in result:
+                result.add(state)
+                if state < len(kinds) and kinds[state] == _ANY_DEPTH:
+                    state += 1
+                else:
+                    break
+        closed = self._closures[states] = frozenset(result)
+        return closed
+
+    def _plan(self, states):
+        plan = self._plans.get(states)
+        if plan is not None:
+            return plan
+        kinds = self._kinds
+        # states every child moves to, whatever its key or value
+        base = set()
+        exact = {}
+        dynamic = []
+        for state in sorted(states):
+            if state == len(kinds):
+                continue
+            kind = kinds[state]
+            if kind == _ANY_DEPTH:
+                base.add(state)
+            elif kind == _ANY_KEY:
+                base.add(state + 1)
+            elif kind == _EXACT:
+                exact.setdefault(self.steps[state], set()).add(state + 1)
+            else:
+                dynamic.append(state)
+        exact = {
+            key: self._closure(base | key_states)
+            for key, key_states in exact.items()
+        }
+        plan = (self._closure(base), exact, dynamic)
+        self._plans[states] = plan
+        return plan
+
+    def _dynamic_states(self, dynamic, key, value, node):
+        next_states = set()
+        for state in dynamic:
+            step = self.steps[state]
+            if self._kinds[state] == _SLICE:
+                if (
+                    isinstance(node, (list, tuple))
+                    and key in range(len(node))[step]
+                ):
+                    next_states.add(state + 1)
+                continue
+            try:
+                if step(value):
+                    next_states.add(state + 1)
+            except (KeyError, IndexError, TypeError):
+                pass
+        return next_states
+
+    def _select_exact(self, dict_obj):
+        # the common case of a plain path needs no walk at all
+        value = dict_obj
+        for key in self.steps:
+            value = _lookup(value, key)
+            if value is _MISSING:
+                return
+        yield self.steps, value
+
+    def select(self, dict_obj):
+        """Lazily yields the (path, value) pairs matching this query.
+
+        Parameters
+        ----------
+        dict_obj : dict
+            The nested dict to query. Lists and tuples in it are descended
+            into too, with their indices as path keys.
+
+        Yields
+        ------
+        path : tuple
+            The path of a matching value.
+        value : object
+            The matching value.
+
+        """
+        if self._exact_only:
+            yield from self._select_exact(dict_obj)
+            return
+        final = len(self._kinds)
+        stack = [((), dict_obj, self._closure((0,)))]
+        while stack:
+            path, node, states = stack.pop()
+            if final in states:
+                yield path, node
+            base, exact, dynamic = self._plan(states)
+            matched = []
+            if not base and not dynamic:
+                # only exact keys can match, so look them up directly
+                for key, next_states in exact.items():
+                    value = _lookup(node, key)
+                    if value is not _MISSING:
+                        matched.append((path + (key,), value, next_states))
+                stack.extend(reversed(matched))
+                continue
+            for key, value in _children(node):
+                next_states = exact.get(key, base) if exact else base
+                if dynamic:
+                    extra = self._dynamic_states(dynamic, key, value, node)
+                    if extra:
+                        next_states = self._closure(next_states | extra)
+                # prune subtrees no remaining step can match, and leaves
+                # not matching the whole query
+                if next_states and (
+                    final in next_states
+                    or isinstance(value, (dict, list, tuple))
+                ):
+                    matched.append((path + (key,), value, next_states))
+            stack.extend(reversed(matched))
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.steps)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(query, separator):
+    return _compile(query, separator)
+
+
+def _compile(query, separator):
+    if isinstance(query, str):
+        query = [_parse_token(token) for token in query.split(separator)]
+    return Query(query)
+
+
+def compile_query(query, separator="."):
+    """Compiles a path query, caching the result.
+
+    Parameters
+    ----------
+    query : tuple or str
+        A sequence of steps, each of which is one of:
+
+        - '*', matching any single key or list index;
+        - '**', matching any number of levels, including none;
+        - a slice, matching the list indices it selects;
+        - a callable, matching any key or index whose value it returns
+          True for; values it raises a KeyError, IndexError or TypeError
+          for are not matched;
+        - any other object, matching that exact key or list index.
+
+        Alternatively, a string of steps joined by the separator, where
+        '[i]' tokens denote list indices and '[start:stop:step]' tokens
+        denote slices.
+    separator : str, default '.'
+        The step separator of string queries.
+
+    Returns
+    -------
+    Query
+        The compiled query.
+
+    Example
+    -------
+    >>> compile_query('items.*.tags.[0:2]')
+    Query(('items', '*', 'tags', slice(0, 2, None)))
+
+    """
+    try:
+        return _compile_cached(query, separator)
+    except TypeError:  # unhashable queries, e.g. with slices before py3.12
+        return _compile(query, separator)
+
+
+def select(query, dict_obj, separator="."):
+    """Lazily yields the (path, value) pairs of a nested dict matching a query.
+
+    Subtrees that no step of the query can match are pruned, and queries
+    with no wildcards, slices or predicates are resolved by direct lookups.
+
+    Parameters
+    ----------
+    query : tuple, str or Query
+        The query to match; see compile_query() for the accepted syntax.
+    dict_obj : dict
+        The nested dict to query. Lists and tuples in it are descended into
+        too, with their indices as path keys.
+    separator : str, default '.'
+        The step separator of string queries.
+
+    Yields
+    ------
+    path : tuple
+        The path of a matching value.
+    value : object
+        The matching value.
+
+    Example
+    -------
+    >>> logs = {'a': {'status': 500, 'ms': 3}, 'b': {'status': 200, 'ms': 9}}
+    >>> list(select(('*', 'status'), logs))
+    [(('a', 'status'), 500), (('b', 'status'), 200)]
+    >>> list(select(('**', 'ms'), {'x': logs}))
+    [(('x', 'a', 'ms'), 3), (('x', 'b', 'ms'), 9)]
+    >>> failed = lambda req: req['status'] >= 500
+    >>> [path for path, _ in select((failed,), logs)]
+    [('a',)]
+    >>> list(select('rows.[1:]', {'rows': [4, 5, 6]}))
+    [(('rows', 1), 5), (('rows', 2), 6)]
+
+    """
+    if not isinstance(query, Query):
+        query = compile_query(query, separator)
+    return query.select(dict_obj)
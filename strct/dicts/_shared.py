@@ -0,0 +1,348 @@
+"""A frozen dict stored in shared memory, readable from many processes."""
+
+import json
+import struct
+import sys
+import zlib
+from collections.abc import Mapping
+from multiprocessing import resource_tracker, shared_memory
+
+_MAGIC = b"STRCTSFD"
+_HEADER = struct.Struct("<8sQQQ")
+_RECORD = struct.Struct("<BBII")  # key tag, value tag, key/value lengths
+_FLOAT64 = struct.Struct("<d")
+_SLOT_SIZE = 16  # a key hash and a record offset, both uint64
+
+_STR = ord("s")
+_INT = ord("i")
+_FLOAT = ord("f")
+_BOOL = ord("b")
+_NONE = ord("n")
+_TRUE = ord("t")
+_FALSE = ord("F")
+_JSON = ord("j")
+
+_json_decode = json.JSONDecoder().decode
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_exact(value):
+    # whether a JSON round-trip returns an equal value of the same types;
+    # tuples would come back as lists, and non-str dict keys as strs
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return True
+    if value_type is list:
+        return all(_is_json_exact(item) for item in value)
+    if value_type is dict:
+        return all(
+            type(key) is str and _is_json_exact(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+def _encode_key(key):
+    # keys equal in Python (1 == 1.0 == True) get the same canonical bytes,
+    # and the tag remembers the original type, for decoding
+    if isinstance(key, str):
+        return _STR, b"s" + key.encode("utf-8")
+    if isinstance(key, bool):
+        return _BOOL, b"n" + str(int(key)).encode("ascii")
+    if isinstance(key, int):
+        return _INT, b"n" + str(key).encode("ascii")
+    if isinstance(key, float):
+        if key.is_integer():
+            return _FLOAT, b"n" + str(int(key)).encode("ascii")
+        return _FLOAT, b"n" + key.hex().encode("ascii")
+    raise TypeError(
+        "SharedFrozenDict keys must be str, int or float objects; got "
+        "{!r}.".format(key)
+    )
+
+
+def _decode_key(tag, canonical):
+    text = canonical[1:].decode("utf-8")
+    if tag == _STR:
+        return text
+    if tag == _BOOL:
+        return bool(int(text))
+    if tag == _INT:
+        return int(text)
+    try:
+        return float(int(text))
+    except ValueError:
+        return float.fromhex(text)
+
+
+def _encode_value(value):
+    # common scalars skip JSON, which dominates lookup time otherwise
+    if value is None:
+        return _NONE, b""
+    if value is True:
+        return _TRUE, b""
+    if value is False:
+        return _FALSE, b""
+    value_type = type(value)
+    if value_type is str:
+        return _STR, value.encode("utf-8")
+    if value_type is int:
+        # str() refuses ints of more than 4300 digits
+        n_bytes = value.bit_length() // 8 + 1
+        return _INT, value.to_bytes(n_bytes, "little", signed=True)
+    if value_type is float:
+        return _FLOAT, _FLOAT64.pack(value)
+    if _is_json_exact(value):
+        try:
+            return _JSON, json.dumps(value).encode("utf-8")
+        except ValueError:
+            # nested ints of more than 4300 digits
+            pass
+    # the repr of a value holding a huge int would raise, so name its type
+    raise TypeError(
+        "SharedFrozenDict values must be None, bool, int, float or str "
+        "objects, or lists and str-keyed dicts of them; got a {} "
+        "value.".format(value_type.__name__)
+    )
+
+
+def _decode_value(tag, value_bytes):
+    if tag == _STR:
+        return str(value_bytes, "utf-8")
+    if tag == _INT:
+        return int.from_bytes(value_bytes, "little", signed=True)
+    if tag == _FLOAT:
+        return _FLOAT64.unpack(value_bytes)[0]
+    if tag == _NONE:
+        return None
+    if tag == _TRUE:
+        return True
+    if tag == _FALSE:
+        return False
+    return _json_decode(str(value_bytes, "utf-8"))
+
+
+def _attach(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    # before python 3.13, attaching registers the block with the resource
+    # tracker, which would unlink it when this process exits
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class SharedFrozenDict(Mapping):
+    """A read-only dict stored in a block of shared memory.
+
+    The mapping is serialized once, by create(), into an open-addressing
+    hash table (with linear probing, at most half full) followed by the
+    key-value records. Any process can then attach to the block by its
+    name, and lookups read the table and records in place, so the mapping
+    occupies the same physical memory in every process, and no per-process
+    copy is built. Keys must be str, int or float objects. Values must be
+    None, bool, int, float or str objects, or lists and str-keyed dicts of
+    them, which are stored as JSON; other values, such as tuples, raise a
+    TypeError rather than be read back changed. Values are decoded on each
+    access, with scalar values stored natively for faster decoding.
+
+    Instances are picklable, so they can be passed to worker processes,
+    which attach to the same block. Forked workers can also use the
+    instance they inherit. Call close() in every process when done, and
+    unlink() once, in the creating process, to free the block.
+
+    Parameters
+    ----------
+    shm : multiprocessing.shared_memory.SharedMemory
+        The shared memory block holding the serialized mapping. Use
+        create() or attach() instead of calling the constructor directly.
+
+    Example
+    -------
+    >>> shared = SharedFrozenDict.create({'a': [1, 2], 7: 'x', 2.5: None})
+    >>> other = SharedFrozenDict.attach(shared.name)
+    >>> other['a'], other[7], other[2.5]
+    ([1, 2], 'x', None)
+    >>> 'b' in other, len(other)
+    (False, 3)
+    >>> other.close()
+    >>> shared.close()
+    >>> shared.unlink()
+
+    """
+
+    def __init__(self, shm):
+        self._shm = shm
+        self.name = shm.name
+        buf = shm.buf
+        try:
+            magic, n_items, n_slots, data_len = _HEADER.unpack_from(buf)
+            if magic != _MAGIC:
+                raise ValueError(
+                    "Shared memory block {} holds no SharedFrozenDict.".format(
+                        shm.name
+                    )
+                )
+        except Exception:
+            shm.close()
+            raise
+        self._len = n_items
+        self._mask = n_slots - 1
+        self._data_start = _HEADER.size + _SLOT_SIZE * n_slots
+        self._data_end = self._data_start + data_len
+        self._buf = buf
+        self._slots = buf[_HEADER.size : self._data_start].cast("Q")
+
+    @classmethod
+    def create(cls, mapping, name=None):
+        """Serializes a mapping into a new shared memory block.
+
+        Parameters
+        ----------
+        mapping : mapping
+            The mapping to serialize.
+        name : str, optional
+            The name of the new shared memory block. A unique name is
+            generated by default.
+
+        Returns
+        -------
+        SharedFrozenDict
+            A dict reading the new block.
+
+        """
+        records = bytearray()
+        entries = []
+        for key, value in mapping.items():
+            tag, canonical = _encode_key(key)
+            value_tag, value_bytes = _encode_value(value)
+            entries.append((zlib.crc32(canonical), len(records)))
+            records += _RECORD.pack(
+                tag, value_tag, len(canonical), len(value_bytes)
+            )
+            records += canonical
+            records += value_bytes
+        n_slots = 8
+        while n_slots < 2 * len(entries):
+            n_slots *= 2
+        mask = n_slots - 1
+        slots = [0] * (2 * n_slots)
+        for key_hash, offset in entries:
+            ix = key_hash & mask
+            while slots[2 * ix + 1]:
+                ix = (ix + 1) & mask
+            slots[2 * ix] = key_hash
+            # offsets are stored plus one, so that zero marks an empty slot
+            slots[2 * ix + 1] = offset + 1
+        table_bytes = struct.pack("<{}Q".format(len(slots)), *slots)
+        header = _HEADER.pack(_MAGIC, len(entries), n_slots, len(records))
+        size = len(header) + len(table_bytes) + len(records)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        shm.buf[:size] = header + table_bytes + records
+        return cls(shm)
+
+    @classmethod
+    def attach(cls, name):
+        """Attaches to a shared memory block written by create().
+
+        Parameters
+        ----------
+        name : str
+            The name of the block, as given by the name attribute of the
+            dict that created it.
+
+        Returns
+        -------
+        SharedFrozenDict
+            A dict reading the block.
+
+        """
+        return cls(_attach(name))
+
+    def _find(self, key):
+        # returns the value tag and the value bytes of the given key, or
+        # None if it is missing
+        try:
+            _, canonical = _encode_key(key)
+        except TypeError:
+            return None
+        key_hash = zlib.crc32(canonical)
+        slots = self._slots
+        buf = self._buf
+        mask = self._mask
+        ix = key_hash & mask
+        while True:
+            offset = slots[2 * ix + 1]
+            if not offset:
+                return None
+            if slots[2 * ix] == key_hash:
+                start = self._data_start + offset - 1
+                _, tag, key_len, value_len = _RECORD.unpack_from(buf, start)
+                key_start = start + _RECORD.size
+                value_start = key_start + key_len
+                if bytes(buf[key_start:value_start]) == canonical:
+                    return tag, bytes(
+                        buf[value_start : value_start + value_len]
+                    )
+            ix = (ix + 1) & mask
+
+    def __getitem__(self, key):
+        found = self._find(key)
+        if found is None:
+            raise KeyError(key)
+        return _decode_value(*found)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __iter__(self):
+        buf = self._buf
+        start = self._data_start
+        while start < self._data_end:
+            tag, _, key_len, value_len = _RECORD.unpack_from(buf, start)
+            key_start = start + _RECORD.size
+            yield _decode_key(tag, bytes(buf[key_start : key_start + key_len]))
+            start = key_start + key_len + value_len
+
+    def __len__(self):
+        return self._len
+
+    def __repr__(self):
+        return "{}(name={!r}, len={})".format(
+            type(self).__name__, self.name, self._len
+        )
+
+    def __reduce__(self):
+        return (type(self).attach, (self.name,))
+
+    def close(self):
+        """Detaches this process from the shared memory block."""
+        if self._shm is None:
+            return
+        self._slots.release()
+        self._slots = self._buf = None
+        self._shm.close()
+        self._shm = None
+
+    def unlink(self):
+        """Frees the shared memory block, once all processes closed it.
+
+        Call it exactly once, from the process that created the block.
+        """
+        if self._shm is not None:
+            if sys.version_info < (3, 13):
+                # processes attaching to the block unregister it from the
+                # resource tracker, which they may share with this one, so
+                # register it again for unlink() to unregister
+                resource_tracker.register(self._shm._name, "shared_memory")
+            self._shm.unlink()
+            return
+        shm = shared_memory.SharedMemory(name=self.name)
+        shm.close()
+        shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
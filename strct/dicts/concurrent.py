@@ -0,0 +1,258 @@
+"""Thread-safe dicts for sharing mutable state between threads."""
+
+import copy
+import numbers
+import threading
+from collections.abc import MutableMapping
+
+from ._dict import (
+    _get_or_create_nested,
+    _increment_in,
+    add_to_dict_val_set,
+    append_to_dict_val_list,
+    increment_dict_val,
+)
+
+
+def _merge_values(old, new):
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in new.items():
+            if key in old:
+                old[key] = _merge_values(old[key], value)
+            else:
+                old[key] = copy.deepcopy(value)
+        return old
+    if isinstance(old, list) and isinstance(new, list):
+        old.extend(copy.deepcopy(new))
+        return old
+    if isinstance(old, set) and isinstance(new, set):
+        old |= new
+        return old
+    if (
+        isinstance(old, numbers.Number)
+        and isinstance(new, numbers.Number)
+        and not isinstance(old, bool)
+        and not isinstance(new, bool)
+    ):
+        return old + new
+    return copy.deepcopy(new)
+
+
+class ShardedDict(MutableMapping):
+    """A dict split into shards, each guarded by its own lock.
+
+    Each key is stored in the shard picked by its hash, and every operation
+    only holds the lock of that shard, so threads updating keys in different
+    shards do not wait for each other (lock striping). The read-modify-write
+    operations below are atomic, unlike their strct.dicts counterparts
+    applied to a plain dict shared between threads. Nested operations are
+    sharded by the top-level key of their path. Keys are iterated shard by
+    shard, not in insertion order.
+
+    Indexing and get() return the stored values themselves, not copies, and
+    mutating them bypasses the shard locks. Treat returned values as
+    read-only: change them through the atomic operations, merge() or
+    assignment, and use snapshot() to get copies that are safe to mutate.
+
+    Parameters
+    ----------
+    mapping : mapping or iterable, optional
+        Initial key-value pairs, or a mapping of them.
+    num_shards : int, default 16
+        The number of shards, and of locks.
+
+    Example
+    -------
+    >>> counts = ShardedDict()
+    >>> counts.increment('a')
+    >>> counts.increment('a', 2)
+    >>> counts.increment_nested(('b', 'x'), 5)
+    >>> counts.snapshot() == {'a': 3, 'b': {'x': 5}}
+    True
+
+    """
+
+    def __init__(self, mapping=(), num_shards=16):
+        if num_shards < 1:
+            raise ValueError("num_shards must be a positive integer.")
+        self.num_shards = num_shards
+        self._shards = [{} for _ in range(num_shards)]
+        self._locks = [threading.Lock() for _ in range(num_shards)]
+        self.update(mapping)
+
+    def _shard_ix(self, key):
+        return hash(key) % self.num_shards
+
+    # === atomic operations ===
+
+    def increment(self, key, value=1, zero_value=0):
+        """Atomically increments the value mapped by a key.
+
+        See increment_dict_val for the meaning of the arguments.
+        """
+        ix = self._shard_ix(key)
+        with self._locks[ix]:
+            increment_dict_val(self._shards[ix], key, value, zero_value)
+
+    def increment_nested(self, key_tuple, value=1, zero_value=0):
+        """Atomically increments a nested value, creating missing dicts.
+
+        See increment_nested_val for the meaning of the arguments.
+        """
+        ix = self._shard_ix(key_tuple[0])
+        with self._locks[ix]:
+            _increment_in(
+                _get_or_create_nested(self._shards[ix], key_tuple[:-1]),
+                key_tuple[-1],
+                value,
+                zero_value,
+            )
+
+    def put_nested(self, key_tuple, value):
+        """Atomically puts a nested value, creating missing dicts.
+
+        See put_nested_val for the meaning of the arguments.
+        """
+        ix = self._shard_ix(key_tuple[0])
+        with self._locks[ix]:
+            _get_or_create_nested(self._shards[ix], key_tuple[:-1])[
+                key_tuple[-1]
+            ] = value
+
+    def append(self, key, val):
+        """Atomically appends a value to the list mapped by a key.
+
+        See append_to_dict_val_list for the meaning of the arguments.
+        """
+        ix = self._shard_ix(key)
+        with self._locks[ix]:
+            append_to_dict_val_list(self._shards[ix], key, val)
+
+    def add(self, key, val):
+        """Atomically adds a value to the set mapped by a key.
+
+        See add_to_dict_val_set for the meaning of the arguments.
+        """
+        ix = self._shard_ix(key)
+        with self._locks[ix]:
+            add_to_dict_val_set(self._shards[ix], key, val)
+
+    def setdefault(self, key, default=None):
+        ix = self._shard_ix(key)
+        with self._locks[ix]:
+            return self._shards[ix].setdefault(key, default)
+
+    def pop(self, key, *args):
+        ix = self._shard_ix(key)
+        with self._locks[ix]:
+            return self._shards[ix].pop(key, *args)
+
+    # === snapshots and merging ===
+
+    def snapshot(self, consistent=False):
+        """Returns a deep copy of the contents as a plain dict.
+
+        Parameters
+        ----------
+        consistent : bool, default False
+            By default, each shard is copied while holding only its own
+            lock, so the snapshot is consistent per shard only. If True, all
+            locks are held together while copying, so the snapshot reflects
+            a single point in time, at the cost of blocking all writers.
+
+        Returns
+        -------
+        dict
+            A deep copy of all key-value pairs.
+
+        """
+        result = {}
+        if consistent:
+            for lock in self._locks:
+                lock.acquire()
+            try:
+                for shard in self._shards:
+                    result.update(copy.deepcopy(shard))
+            finally:
+                for lock in self._locks:
+                    lock.release()
+            return result
+        for shard, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                result.update(copy.deepcopy(shard))
+        return result
+
+    def merge(self, dict_obj):
+        """Atomically merges a dict into this one, key by key.
+
+        Useful for folding thread-local accumulators into a shared one.
+        Numbers are summed, lists are extended, sets are united and dicts
+        are merged recursively by the same rules; any other value, bools
+        included, replaces the existing one. Merged-in values are deep
+        copied, so the given dict shares no mutable objects with this one.
+
+        Parameters
+        ----------
+        dict_obj : mapping
+            The dict to merge in. It is not modified.
+
+        Example
+        -------
+        >>> shared = ShardedDict({'n': 1, 'tags': {'a'}})
+        >>> shared.merge({'n': 2, 'tags': {'b'}, 'by_day': {'mon': 4}})
+        >>> shared.snapshot() == {
+        ...     'n': 3, 'tags': {'a', 'b'}, 'by_day': {'mon': 4}}
+        True
+
+        """
+        for key, value in dict_obj.items():
+            ix = self._shard_ix(key)
+            with self._locks[ix]:
+                shard = self._shards[ix]
+                if key in shard:
+                    shard[key] = _merge_values(shard[key], value)
+                else:
+                    shard[key] = copy.deepcopy(value)
+
+    # === mapping methods ===
+
+    def __getitem__(self, key):
+        ix = self._shard_ix(key)
+        with self._locks[ix]:
+            return self._shards[ix][key]
+
+    def get(self, key, default=None):
+        ix = self._shard_ix(key)
+        with self._locks[ix]:
+            return self._shards[ix].get(key, default)
+
+    def __setitem__(self, key, value):
+        ix = self._shard_ix(key)
+        with self._locks[ix]:
+            self._shards[ix][key] = value
+
+    def __delitem__(self, key):
+        ix = self._shard_ix(key)
+        with self._locks[ix]:
+            del self._shards[ix][key]
+
+    def __contains__(self, key):
+        ix = self._shard_ix(key)
+        with self._locks[ix]:
+            return key in self._shards[ix]
+
+    def __iter__(self):
+        # iterates over a copy of the keys, so it is safe under mutation
+        keys = []
+        for shard, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                keys.extend(shard)
+        return iter(keys)
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def __repr__(self):
+        return "{}({!r}, num_shards={})".format(
+            type(self).__name__, self.snapshot(), self.num_shards
+        )
@@ -1,6 +1,13 @@
 """General data-structure related utility functions."""
 
-from ._hash import (  # noqa: F401
-    json_based_stable_hash,
-    stable_hash,
-)
+from .._lazy import lazy_attributes
+
+_MODULE_ATTRS = {
+    "._hash": (
+        "json_based_stable_hash",
+        "stable_hash",
+    ),
+}
+__all__ = sorted(name for names in _MODULE_ATTRS.values() for name in names)
+__getattr__, __dir__ = lazy_attributes(__name__, _MODULE_ATTRS)
+del lazy_attributes
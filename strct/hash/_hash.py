@@ -27,15 +27,20 @@ def _stable_hash_primitive(primitive):
 
 def _recursive_stable_hash(obj):
     try:  # assume it's a dict
+        items = obj.items
+    except AttributeError:
+        pass  # go on to assume it's an iterable
+    else:
+        own_stable_hash = getattr(obj, "__stable_hash__", None)
+        if own_stable_hash is not None:
+            return own_stable_hash()
         item_hashes = []
-        for item in obj.items():
+        for item in items():
             try:
                 item_hashes.append(_recursive_stable_hash(item))
             except TypeError:
                 raise TypeError("dict includes unhashable values.") from None
         return hash(frozenset(item_hashes))
-    except AttributeError:
-        pass  # go on to assume it's an iterable
     try:  # assume it's an iterable
         if not isinstance(obj, (str, bytes)):
             return hash(frozenset([_recursive_stable_hash(i) for i in obj]))
@@ -60,6 +65,9 @@ def stable_hash(obj):
     float, str, and may only contain values of only the following built-in
     types: bool, int, float, complex, str, list, tuple, dict.
 
+    Mappings defining a __stable_hash__() method, such as FrozenNestedDict,
+    are hashed by calling it, which lets them cache their hash value.
+
     Parameters
     ---------
     obj : bool/int/float/complex/str/dict/list/tuple
@@ -0,0 +1,267 @@
+"""Opt-in instrumentation of the public strct functions.
+
+Instrumentation is off by default, and no wrappers are installed until it is
+turned on, so it costs nothing while disabled. It can be turned on by
+calling enable(), or by setting the STRCT_INSTRUMENT environment variable to
+a non-empty value other than '0' before strct is imported.
+
+While enabled, every public function of strct.dicts, strct.hash, strct.lists
+and strct.sortedlists is replaced, both in its subpackage and in the module
+defining it, with a wrapper recording its call count, cumulative time, input
+sizes and raised exceptions. Since the functions are also replaced where
+they are defined, calls between strct functions are recorded too; for
+example, safe_nested_val calls get_nested_val and catches the KeyError it
+raises on a missing path, so the KeyError count of get_nested_val shows how
+often safe_nested_val takes its except branch. Recursive calls are recorded
+once, by their outer-most call.
+
+Functions imported by name (e.g. `from strct.dicts import get_nested_val`)
+before enable() is called keep referring to the uninstrumented function.
+
+Example
+-------
+>>> import strct.dicts
+>>> from strct import instrument
+>>> instrument.enable()
+>>> strct.dicts.safe_nested_val(('a', 'b'), {'a': {}})
+>>> instrument.stats()['strct.dicts.get_nested_val']['exceptions']
+{'KeyError': 1}
+>>> instrument.disable()
+"""
+
+import functools
+import importlib
+import inspect
+import threading
+import time
+
+INSTRUMENTED_PACKAGES = (
+    "strct.dicts",
+    "strct.hash",
+    "strct.lists",
+    "strct.sortedlists",
+)
+
+_lock = threading.Lock()
+_stats = {}
+_patches = []  # (namespace, attribute name, original) triples
+_callback = None
+
+
+class _FunctionStats:
+    __slots__ = ("calls", "total_time", "total_size", "max_size", "exceptions")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.total_size = 0
+        self.max_size = 0
+        self.exceptions = {}
+
+    def snapshot(self):
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "total_size": self.total_size,
+            "max_size": self.max_size,
+            "exceptions": dict(self.exceptions),
+        }
+
+
+def _input_size(args):
+    # the length of the first sized positional argument: the depth of a keys
+    # tuple, or the length of a dict or a list
+    for arg in args:
+        try:
+            return len(arg)
+        except TypeError:
+            continue
+    return 0
+
+
+def _wrap(func, stats):
+    local = threading.local()
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if getattr(local, "active", False):
+            return func(*args, **kwargs)
+        local.active = True
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except BaseException as exc:
+            name = type(exc).__name__
+            with _lock:
+                stats.exceptions[name] = stats.exceptions.get(name, 0) + 1
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            local.active = False
+            size = _input_size(args)
+            with _lock:
+                stats.calls += 1
+                stats.total_time += elapsed
+                stats.total_size += size
+                if size > stats.max_size:
+                    stats.max_size = size
+
+    return wrapper
+
+
+def _public_functions(package):
+    for name in package.__all__:
+        obj = getattr(package, name)
+        if (
+            not name.startswith("_")
+            and inspect.isfunction(obj)
+            and obj.__module__.startswith("strct.")
+        ):
+            yield name, obj
+
+
+def is_enabled():
+    """Returns True if instrumentation is enabled."""
+    return bool(_patches)
+
+
+def enable(callback=None):
+    """Installs instrumentation wrappers on all public strct functions.
+
+    Calling it while instrumentation is enabled only replaces the callback.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Called with the dict returned by stats() whenever flush() is called,
+        and once more when instrumentation is disabled.
+
+    """
+    global _callback
+    _callback = callback
+    if _patches:
+        return
+    for package_name in INSTRUMENTED_PACKAGES:
+        package = importlib.import_module(package_name)
+        for name, func in _public_functions(package):
+            stats = _stats.setdefault(
+                "{}.{}".format(package_name, name), _FunctionStats()
+            )
+            wrapper = _wrap(func, stats)
+            module = inspect.getmodule(func)
+            for namespace in (package, module):
+                if getattr(namespace, name, None) is func:
+                    _patches.append((namespace, name, func))
+                    setattr(namespace, name, wrapper)
+
+
+def disable():
+    """Removes all instrumentation wrappers, restoring the originals.
+
+    The configured callback, if any, is called with the final statistics.
+    Recorded statistics are kept until reset() is called.
+
+    """
+    global _callback
+    if not _patches:
+        return
+    while _patches:
+        namespace, name, func = _patches.pop()
+        setattr(namespace, name, func)
+    flush()
+    _callback = None
+
+
+def reset():
+    """Clears all recorded statistics."""
+    with _lock:
+        for function_stats in _stats.values():
+            function_stats.__init__()
+
+
+def stats():
+    """Returns the statistics recorded for each called function.
+
+    Returns
+    -------
+    dict
+        Maps the full name of each function called while instrumented, e.g.
+        'strct.dicts.get_nested_val', to a dict with the keys 'calls',
+        'total_time' (in seconds), 'total_size' and 'max_size' (sums and
+        maximum of the length of the first sized positional argument of
+        each call) and 'exceptions' (mapping exception type names to the
+        number of calls raising them).
+
+    """
+    with _lock:
+        return {
+            name: function_stats.snapshot()
+            for name, function_stats in _stats.items()
+            if function_stats.calls
+        }
+
+
+def flush():
+    """Calls the callback given to enable(), if any, with stats()."""
+    if _callback is not None:
+        _callback(stats())
+
+
+def _escape(label):
+    return label.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def prometheus_text():
+    """Returns the recorded statistics in the Prometheus text format.
+
+    Returns
+    -------
+    str
+        The exposition text of the strct_calls_total,
+        strct_call_seconds_total, strct_input_size_total,
+        strct_input_size_max and strct_exceptions_total metrics, labeled by
+        function (and exception type).
+
+    """
+    snapshot = stats()
+    metrics = (
+        ("calls_total", "counter", "Number of calls.", "calls"),
+        (
+            "call_seconds_total",
+            "counter",
+            "Cumulative call time in seconds.",
+            "total_time",
+        ),
+        (
+            "input_size_total",
+            "counter",
+            "Sum of the input sizes of all calls.",
+            "total_size",
+        ),
+        (
+            "input_size_max",
+            "gauge",
+            "Largest input size of a call.",
+            "max_size",
+        ),
+    )
+    lines = []
+    for metric, metric_type, help_text, key in metrics:
+        lines.append("# HELP strct_{} {}".format(metric, help_text))
+        lines.append("# TYPE strct_{} {}".format(metric, metric_type))
+        for name, function_stats in sorted(snapshot.items()):
+            lines.append(
+                'strct_{}{{function="{}"}} {}'.format(
+                    metric, _escape(name), function_stats[key]
+                )
+            )
+    lines.append("# HELP strct_exceptions_total Number of calls raising.")
+    lines.append("# TYPE strct_exceptions_total counter")
+    for name, function_stats in sorted(snapshot.items()):
+        for exc_name, count in sorted(function_stats["exceptions"].items()):
+            lines.append(
+                'strct_exceptions_total{{function="{}",exception="{}"}} {}'
+                "".format(_escape(name), _escape(exc_name), count)
+            )
+    return "\n".join(lines) + "\n"
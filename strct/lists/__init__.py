@@ -1,7 +1,14 @@
 """List-related utility functions."""
 
-from ._list import (  # noqa: F401
-    all_but,
-    order_preserving_single_element_shift,
-    order_preserving_single_index_shift,
-)
+from .._lazy import lazy_attributes
+
+_MODULE_ATTRS = {
+    "._list": (
+        "all_but",
+        "order_preserving_single_element_shift",
+        "order_preserving_single_index_shift",
+    ),
+}
+__all__ = sorted(name for names in _MODULE_ATTRS.values() for name in names)
+__getattr__, __dir__ = lazy_attributes(__name__, _MODULE_ATTRS)
+del lazy_attributes
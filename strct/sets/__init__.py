@@ -1,5 +1,13 @@
 """Set-related utility functions."""
 
-from ._set import (  # noqa: F401
-    get_priority_elem_in_set,
-)
+from .._lazy import lazy_attributes
+
+_MODULE_ATTRS = {
+    "._set": (
+        "PriorityResolver",
+        "get_priority_elem_in_set",
+    ),
+}
+__all__ = sorted(name for names in _MODULE_ATTRS.values() for name in names)
+__getattr__, __dir__ = lazy_attributes(__name__, _MODULE_ATTRS)
+del lazy_attributes
@@ -1,5 +1,7 @@
 """Dict-related utility functions."""
 
+from collections.abc import Set as AbstractSet
+
 
 def get_priority_elem_in_set(obj_set, priority_list):
     """Returns the highest priority element in a set.
@@ -32,3 +34,95 @@ def get_priority_elem_in_set(obj_set, priority_list):
         if obj in obj_set:
             return obj
     return None
+
+
+class PriorityResolver:
+    """Resolves the highest priority element of many sets by a fixed list.
+
+    Ranks of all objects in the priority list are precomputed, so each set
+    is resolved by iterating over either the set or the priority list,
+    whichever is smaller, instead of always scanning the priority list.
+    Unhashable objects can't be ranked, so priority lists, and lists to
+    resolve, containing any fall back to the scan of
+    get_priority_elem_in_set, with the same results.
+
+    Parameters
+    ---------
+    priority_list : list
+        A list of objects in descending order of priority.
+
+    Example:
+    --------
+    >>> resolver = PriorityResolver([4, 8, 1, 3])
+    >>> print(resolver.resolve({3, 2, 7, 8}))
+    8
+    >>> resolver.resolve_many([{3, 2}, {5}, [1, 4]])
+    [3, None, 4]
+
+    """
+
+    def __init__(self, priority_list):
+        self.priority_list = list(priority_list)
+        self._rank = {}
+        try:
+            for rank, obj in enumerate(self.priority_list):
+                self._rank.setdefault(obj, rank)
+        except TypeError:  # an unhashable object
+            self._rank = None
+
+    def resolve(self, obj_set):
+        """Returns the highest priority element in a set.
+
+        Parameters
+        ---------
+        obj_set : set, list
+            A set or list of objects.
+
+        Returns
+        -------
+        object
+            The highest priority object in the given set. None if no object
+            in the given set appears in the priority list.
+
+        """
+        rank = self._rank
+        if rank is None or (
+            isinstance(obj_set, AbstractSet)
+            and len(self.priority_list) < len(obj_set)
+        ):
+            return get_priority_elem_in_set(obj_set, self.priority_list)
+        best = None
+        best_rank = len(self.priority_list)
+        try:
+            for obj in obj_set:
+                obj_rank = rank.get(obj, best_rank)
+                if obj_rank < best_rank:
+                    best, best_rank = obj, obj_rank
+        except TypeError:  # an unhashable object in a list
+            return get_priority_elem_in_set(obj_set, self.priority_list)
+        return best
+
+    def resolve_many(self, sets, executor=None, chunksize=1024):
+        """Returns the highest priority element in each of the given sets.
+
+        Parameters
+        ---------
+        sets : iterable
+            An iterable of sets or lists of objects.
+        executor : concurrent.futures.Executor, optional
+            If given, sets are resolved in parallel by mapping over them with
+            this executor. For a ProcessPoolExecutor, the resolver and all
+            set elements must be picklable.
+        chunksize : int, default 1024
+            The number of sets sent to each worker process at a time. Only
+            used by ProcessPoolExecutor executors.
+
+        Returns
+        -------
+        list
+            The highest priority object in each set, in the given order.
+
+        """
+        if executor is None:
+            return list(map(self.resolve, sets))
+        return list(executor.map(self.resolve, sets, chunksize=chunksize))
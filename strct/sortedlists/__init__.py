@@ -1,9 +1,23 @@
 """Sortedlist-related utility functions."""
 
-from .sortedlist import (  # noqa: F401
-    # sorted lists
-    find_point_in_section_list,
-    find_range_in_section_list,
-    find_range_ix_in_point_list,
-    find_range_ix_in_section_list,
-)
+from .._lazy import lazy_attributes
+
+_MODULE_ATTRS = {
+    ".intervaltree": ("IntervalTree",),
+    ".ondisk": ("OnDiskSectionList",),
+    ".pointranges": (
+        "WeightedPointList",
+        "count_in_ranges",
+        "sum_in_ranges",
+    ),
+    ".sortedlist": (
+        "find_point_in_section_list",
+        "find_range_in_section_list",
+        "find_range_ix_in_point_list",
+        "find_range_ix_in_section_list",
+    ),
+}
+_SUBMODULES = ("intervaltree", "ondisk", "pointranges", "sortedlist")
+__all__ = sorted(name for names in _MODULE_ATTRS.values() for name in names)
+__getattr__, __dir__ = lazy_attributes(__name__, _MODULE_ATTRS, _SUBMODULES)
+del lazy_attributes
@@ -0,0 +1,336 @@
+"""A dynamic interval tree for overlap and stabbing queries."""
+
+
+class _Node:
+    __slots__ = ("key", "count", "max_end", "height", "left", "right")
+
+    def __init__(self, key, count=1):
+        self.key = key
+        self.count = count
+        self.max_end = key[1]
+        self.height = 1
+        self.left = None
+        self.right = None
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _update(node):
+    left, right = node.left, node.right
+    node.height = 1 + max(_height(left), _height(right))
+    max_end = node.key[1]
+    if left is not None and left.max_end > max_end:
+        max_end = left.max_end
+    if right is not None and right.max_end > max_end:
+        max_end = right.max_end
+    node.max_end = max_end
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _insert(node, key):
+    if node is None:
+        return _Node(key)
+    if key == node.key:
+        node.count += 1
+        return node
+    if key < node.key:
+        node.left = _insert(node.left, key)
+    else:
+        node.right = _insert(node.right, key)
+    return _rebalance(node)
+
+
+def _pop_min(node):
+    # returns (subtree without its minimal node, the minimal node)
+    if node.left is None:
+        return node.right, node
+    node.left, min_node = _pop_min(node.left)
+    return _rebalance(node), min_node
+
+
+def _remove(node, key):
+    if node is None:
+        raise KeyError(key)
+    if key < node.key:
+        node.left = _remove(node.left, key)
+    elif key > node.key:
+        node.right = _remove(node.right, key)
+    elif node.count > 1:
+        node.count -= 1
+        return node
+    elif node.left is None:
+        return node.right
+    elif node.right is None:
+        return node.left
+    else:
+        right, successor = _pop_min(node.right)
+        successor.left = node.left
+        successor.right = right
+        node = successor
+    return _rebalance(node)
+
+
+def _build(nodes, lo, hi):
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    node = nodes[mid]
+    node.left = _build(nodes, lo, mid)
+    node.right = _build(nodes, mid + 1, hi)
+    _update(node)
+    return node
+
+
+class IntervalTree:
+    """A mutable collection of possibly-overlapping closed intervals.
+
+    Intervals are kept in an AVL tree ordered by (start, end), where every
+    node is augmented with the maximal end point in its subtree. This allows
+    overlap and stabbing queries to prune every subtree that cannot contain
+    a match, and so to run in O(log n + k) for k reported intervals in the
+    common case, while additions and removals take O(log n). Unlike the
+    section-list functions in strct.sortedlists, intervals need not be
+    disjoint or contiguous.
+
+    Parameters
+    ----------
+    intervals : iterable, optional
+        (start, end) pairs to initialize the tree with. They are sorted and
+        bulk-loaded into a perfectly balanced tree in O(n log n).
+
+    Example
+    -------
+    >>> tree = IntervalTree([(5, 8), (1, 10), (9, 12)])
+    >>> tree.overlap(7, 9)
+    [(1, 10), (5, 8), (9, 12)]
+    >>> tree.at(11)
+    [(9, 12)]
+    >>> tree.remove(9, 12)
+    >>> tree.at(11)
+    []
+
+    """
+
+    def __init__(self, intervals=()):
+        self._root = None
+        self._len = 0
+        self._bulk_load(sorted((start, end) for start, end in intervals))
+
+    @classmethod
+    def from_sorted(cls, intervals):
+        """Builds a tree from intervals already sorted by (start, end).
+
+        Bulk-loading skips sorting, and so takes O(n).
+
+        Parameters
+        ----------
+        intervals : iterable
+            (start, end) pairs, sorted by start and then by end.
+
+        Returns
+        -------
+        IntervalTree
+            A new tree holding the given intervals.
+
+        """
+        tree = cls()
+        tree._bulk_load(intervals)
+        return tree
+
+    def _bulk_load(self, sorted_intervals):
+        nodes = []
+        for start, end in sorted_intervals:
+            if end < start:
+                raise ValueError(
+                    "Interval start {} is after its end {}.".format(start, end)
+                )
+            key = (start, end)
+            if nodes and nodes[-1].key == key:
+                nodes[-1].count += 1
+            elif nodes and nodes[-1].key > key:
+                raise ValueError("Intervals are not sorted.")
+            else:
+                nodes.append(_Node(key))
+            self._len += 1
+        self._root = _build(nodes, 0, len(nodes))
+
+    def add(self, start, end):
+        """Adds the closed interval [start, end] to the tree.
+
+        Parameters
+        ----------
+        start : float
+            The start of the interval.
+        end : float
+            The end of the interval. Must not be smaller than start.
+
+        """
+        if end < start:
+            raise ValueError(
+                "Interval start {} is after its end {}.".format(start, end)
+            )
+        self._root = _insert(self._root, (start, end))
+        self._len += 1
+
+    def remove(self, start, end):
+        """Removes one occurrence of the interval [start, end] from the tree.
+
+        Raises KeyError if the interval is not in the tree.
+
+        Parameters
+        ----------
+        start : float
+            The start of the interval.
+        end : float
+            The end of the interval.
+
+        """
+        self._root = _remove(self._root, (start, end))
+        self._len -= 1
+
+    def overlap(self, start, end):
+        """Returns all intervals overlapping the closed range [start, end].
+
+        Parameters
+        ----------
+        start : float
+            The start of the queried range.
+        end : float
+            The end of the queried range.
+
+        Returns
+        -------
+        list
+            (start, end) pairs of all overlapping intervals, sorted.
+
+        """
+        found = []
+        stack = []
+        node = self._root
+        while True:
+            # subtrees whose intervals all end before the range are skipped
+            while node is not None and node.max_end >= start:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return found
+            node = stack.pop()
+            key = node.key
+            if key[0] > end:
+                return found
+            if key[1] >= start:
+                if node.count == 1:
+                    found.append(key)
+                else:
+                    found.extend([key] * node.count)
+            node = node.right
+
+    def at(self, point):
+        """Returns all intervals containing the given point.
+
+        Parameters
+        ----------
+        point : float
+            The point to stab the intervals with.
+
+        Returns
+        -------
+        list
+            (start, end) pairs of all intervals containing the point, sorted.
+
+        """
+        return self.overlap(point, point)
+
+    def overlap_many(self, ranges):
+        """Returns the intervals overlapping each of the given ranges.
+
+        Parameters
+        ----------
+        ranges : iterable
+            (start, end) pairs of closed ranges to query.
+
+        Returns
+        -------
+        list
+            A list with a sorted list of overlapping intervals per range.
+
+        """
+        overlap = self.overlap
+        return [overlap(start, end) for start, end in ranges]
+
+    def at_many(self, points):
+        """Returns the intervals containing each of the given points.
+
+        Parameters
+        ----------
+        points : iterable
+            The points to stab the intervals with.
+
+        Returns
+        -------
+        list
+            A list with a sorted list of containing intervals per point.
+
+        """
+        overlap = self.overlap
+        return [overlap(point, point) for point in points]
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            for _ in range(node.count):
+                yield node.key
+            node = node.right
+
+    def __contains__(self, interval):
+        key = tuple(interval)
+        node = self._root
+        while node is not None:
+            if key == node.key:
+                return True
+            node = node.left if key < node.key else node.right
+        return False
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self))
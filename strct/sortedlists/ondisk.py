@@ -0,0 +1,195 @@
+"""A memory-mapped, on-disk sorted section list."""
+
+import array
+import bisect
+import mmap
+import os
+
+_ITER_CHUNK = 4096
+
+
+class OnDiskSectionList:
+    """A sorted list of section boundaries stored in a memory-mapped file.
+
+    Boundaries are stored as a raw array of fixed-size native values (as
+    produced by array.array.tofile or numpy.ndarray.tofile), so files can
+    also be opened with numpy.memmap. Lookups binary search the mapped
+    buffer directly, so objects of this class can be given as the section or
+    point list of every function in strct.sortedlists without loading the
+    boundaries into memory.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The path of the boundaries file.
+    typecode : str, default 'd'
+        The array module typecode of stored values; e.g. 'd' for 64-bit
+        floats or 'q' for 64-bit signed ints.
+    mode : str, default 'r'
+        'r' opens an existing file for reading only. 'a' opens the file for
+        append-only growth, creating it if it does not exist.
+
+    Example
+    -------
+    >>> import os, tempfile
+    >>> from strct.sortedlists import find_point_in_section_list
+    >>> path = os.path.join(tempfile.mkdtemp(), 'bounds.bin')
+    >>> seclist = OnDiskSectionList.from_iterable(path, [5, 8, 30], 'q')
+    >>> seclist.append(31)
+    >>> len(seclist)
+    4
+    >>> find_point_in_section_list(27, seclist)
+    8
+    >>> seclist.close()
+
+    """
+
+    def __init__(self, path, typecode="d", mode="r"):
+        if mode not in ("r", "a"):
+            raise ValueError("mode must be either 'r' or 'a'.")
+        self._itemsize = array.array(typecode).itemsize
+        self.path = path
+        self.typecode = typecode
+        self.mode = mode
+        if mode == "a" and not os.path.exists(path):
+            open(path, "wb").close()
+        self._file = open(path, "rb" if mode == "r" else "r+b")  # noqa: SIM115
+        self._mmap = None
+        self._view = None
+        try:
+            self._map()
+        except Exception:
+            self._file.close()
+            raise
+
+    @classmethod
+    def from_iterable(cls, path, values, typecode="d"):
+        """Writes the given sorted values to a new file and opens it.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The path of the boundaries file. Overwritten if it exists.
+        values : iterable
+            Sorted section boundaries.
+        typecode : str, default 'd'
+            The array module typecode of stored values.
+
+        Returns
+        -------
+        OnDiskSectionList
+            The new section list, opened in append mode.
+
+        """
+        open(path, "wb").close()
+        section_list = cls(path, typecode=typecode, mode="a")
+        section_list.extend(values)
+        return section_list
+
+    def _map(self):
+        size = os.fstat(self._file.fileno()).st_size
+        if size % self._itemsize:
+            raise ValueError(
+                "File size {} is not a multiple of the item size {}.".format(
+                    size, self._itemsize
+                )
+            )
+        if size == 0:  # empty files can't be memory-mapped
+            self._view = memoryview(b"").cast(self.typecode)
+            return
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap).cast(self.typecode)
+
+    def _unmap(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def extend(self, values):
+        """Appends the given sorted values to the end of the list.
+
+        Parameters
+        ----------
+        values : iterable
+            Sorted values, the first of which is no smaller than the current
+            last value in the list.
+
+        """
+        if self.mode != "a":
+            raise OSError("Section list was not opened in append mode.")
+        new_values = array.array(self.typecode, values)
+        if not new_values:
+            return
+        prev = self[-1] if len(self) else new_values[0]
+        for value in new_values:
+            if value < prev:
+                raise ValueError("Appended values must keep the list sorted.")
+            prev = value
+        self._unmap()
+        self._file.seek(0, os.SEEK_END)
+        new_values.tofile(self._file)
+        self._file.flush()
+        self._map()
+
+    def append(self, value):
+        """Appends the given value to the end of the list.
+
+        Each call remaps the file, so use extend() to add many values.
+
+        Parameters
+        ----------
+        value : int or float
+            A value no smaller than the current last value in the list.
+
+        """
+        self.extend([value])
+
+    def bisect_left(self, value):
+        """Returns the leftmost insertion index of value in the list."""
+        return bisect.bisect_left(self._view, value)
+
+    def bisect_right(self, value):
+        """Returns the rightmost insertion index of value in the list."""
+        return bisect.bisect_right(self._view, value)
+
+    bisect = bisect_right
+
+    def __len__(self):
+        return len(self._view)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view[index].tolist()
+        return self._view[index]
+
+    def __iter__(self):
+        # copies the values chunk by chunk, instead of iterating a view that
+        # appending would release by remapping the file
+        ix = 0
+        while ix < len(self._view):
+            chunk = self._view[ix : ix + _ITER_CHUNK].tolist()
+            ix += len(chunk)
+            yield from chunk
+
+    def __contains__(self, value):
+        ix = self.bisect_left(value)
+        return ix < len(self) and self._view[ix] == value
+
+    def close(self):
+        """Unmaps and closes the underlying file."""
+        self._unmap()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return "{}({!r}, typecode={!r}, mode={!r})".format(
+            type(self).__name__, self.path, self.typecode, self.mode
+        )
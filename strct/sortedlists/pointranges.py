@@ -0,0 +1,156 @@
+"""Vectorized range queries over sorted point lists.
+
+The functions in this module require numpy, which is imported only when
+they are first called.
+"""
+
+from .._optional import import_numpy
+
+
+def _numpy():
+    return import_numpy("range queries over point lists")
+
+
+class WeightedPointList:
+    """A sorted point array with cached prefix sums of per-point weights.
+
+    Building one takes a single O(n) pass; any number of range sums can then
+    be computed over it in O(log n) per range with sum_in_ranges. Lists and
+    SortedLists are converted to a numpy array once, on construction, so
+    also build one, without weights, to repeatedly count points in ranges
+    with count_in_ranges.
+
+    Parameters
+    ----------
+    point_list : sortedcontainers.SortedList, list or numpy.ndarray
+        A sorted list of points. numpy arrays, including memory-mapped ones,
+        are used without copying.
+    weights : sequence of numbers, optional
+        The weight of each point, in the order of point_list. Required for
+        use with sum_in_ranges.
+
+    Example
+    -------
+    >>> wpl = WeightedPointList([5, 8, 15], [1.0, 2.0, 4.0])
+    >>> sum_in_ranges([3, 6], [8, 20], wpl).tolist()
+    [3.0, 6.0]
+    >>> points = WeightedPointList([5, 8, 15])
+    >>> count_in_ranges([3, 6], [8, 20], points).tolist()
+    [2, 2]
+
+    """
+
+    def __init__(self, point_list, weights=None):
+        np = _numpy()
+        self.points = np.asarray(point_list)
+        self.prefix_sums = None
+        if weights is None:
+            return
+        weights = np.asarray(weights)
+        if weights.shape != self.points.shape:
+            raise ValueError(
+                "Got {} weights for {} points.".format(
+                    len(weights), len(self.points)
+                )
+            )
+        # accumulate in a wide dtype, so small integer weights don't overflow
+        dtype = weights.dtype
+        if dtype.kind in "biu":
+            dtype = np.result_type(dtype, np.int64)
+        elif dtype.kind in "fc":
+            dtype = np.result_type(dtype, np.float64)
+        self.prefix_sums = np.zeros(len(weights) + 1, dtype=dtype)
+        np.cumsum(weights, dtype=dtype, out=self.prefix_sums[1:])
+
+    def __len__(self):
+        return len(self.points)
+
+
+def _range_ixs(starts, ends, point_list):
+    np = _numpy()
+    points = getattr(point_list, "points", None)
+    if points is None:
+        points = np.asarray(point_list)
+    start_ixs = np.searchsorted(points, starts, side="left")
+    end_ixs = np.searchsorted(points, ends, side="right")
+    # ranges with start > end contain no points
+    return start_ixs, np.maximum(start_ixs, end_ixs)
+
+
+def count_in_ranges(starts, ends, point_list):
+    """Returns the number of points inside each of the given closed ranges.
+
+    Parameters
+    ----------
+    starts : sequence of float
+        The starts of the ranges.
+    ends : sequence of float
+        The ends of the ranges, in the order of starts.
+    point_list : sortedcontainers.SortedList, list, numpy.ndarray or
+    WeightedPointList
+        A sorted list of points. Lists and SortedLists are copied into a
+        numpy array on every call; to query the same points repeatedly,
+        pass a numpy array or a WeightedPointList, which are used without
+        copying.
+
+    Returns
+    -------
+    numpy.ndarray
+        The number of points inside each range.
+
+    Example
+    -------
+    >>> point_list = [5, 8, 15]
+    >>> count_in_ranges([3, 3, 6], [4, 8, 321], point_list).tolist()
+    [0, 2, 2]
+
+    """
+    start_ixs, end_ixs = _range_ixs(starts, ends, point_list)
+    return end_ixs - start_ixs
+
+
+def sum_in_ranges(starts, ends, point_list, weights=None):
+    """Returns the sum of point weights inside each of the given ranges.
+
+    Parameters
+    ----------
+    starts : sequence of float
+        The starts of the closed ranges.
+    ends : sequence of float
+        The ends of the closed ranges, in the order of starts.
+    point_list : sortedcontainers.SortedList, list, numpy.ndarray or
+    WeightedPointList
+        A sorted list of points. To query the same weighted points
+        repeatedly, pass a WeightedPointList, so that the points are
+        converted to a numpy array, and their prefix sums are computed, only
+        once.
+    weights : sequence of numbers, optional
+        The weight of each point. Required unless point_list is a
+        WeightedPointList.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sum of weights of the points inside each range.
+
+    Example
+    -------
+    >>> point_list = [5, 8, 15]
+    >>> sum_in_ranges([3, 6], [8, 321], point_list, [1, 2, 4]).tolist()
+    [3, 6]
+
+    """
+    if not isinstance(point_list, WeightedPointList):
+        if weights is None:
+            raise ValueError(
+                "weights must be given unless point_list is a "
+                "WeightedPointList."
+            )
+        point_list = WeightedPointList(point_list, weights)
+    elif weights is not None:
+        raise ValueError("weights can't be given with a WeightedPointList.")
+    elif point_list.prefix_sums is None:
+        raise ValueError("The given WeightedPointList has no weights.")
+    start_ixs, end_ixs = _range_ixs(starts, ends, point_list)
+    prefix_sums = point_list.prefix_sums
+    return prefix_sums[end_ixs] - prefix_sums[start_ixs]
@@ -1,5 +1,47 @@
 """Sortedlist-related utility functions."""
 
+import bisect
+
+
+def _bisect_left(sorted_seq, value):
+    """Returns the leftmost insertion index of value in a sorted sequence.
+
+    sortedcontainers.SortedList objects are searched with their own
+    bisect_left method, numpy arrays (including memory-mapped ones) with
+    searchsorted, and any other sorted sequence with the bisect module, so
+    no sequence is ever copied.
+    """
+    try:
+        return sorted_seq.bisect_left(value)
+    except AttributeError:
+        pass
+    try:
+        return int(sorted_seq.searchsorted(value, side="left"))
+    except AttributeError:
+        return bisect.bisect_left(sorted_seq, value)
+
+
+def _bisect_right(sorted_seq, value):
+    """Returns the rightmost insertion index of value in a sorted sequence.
+
+    Dispatches on the type of the given sequence just like _bisect_left.
+    """
+    try:
+        return sorted_seq.bisect_right(value)
+    except AttributeError:
+        pass
+    try:
+        return int(sorted_seq.searchsorted(value, side="right"))
+    except AttributeError:
+        return bisect.bisect_right(sorted_seq, value)
+
+
+def _section_ix(point, section_list):
+    # assumes section_list[0] <= point <= section_list[-1]
+    if point == section_list[-1]:
+        return len(section_list) - 2
+    return _bisect_right(section_list, point) - 1
+
 
 def find_point_in_section_list(point, section_list):
     """Returns the start of the section the given point belongs to.
@@ -15,8 +57,8 @@ def find_point_in_section_list(point, section_list):
     ---------
     point : float
         The point for which to match a section.
-    section_list : sortedcontainers.SortedList
-        A list of start points of consecutive sections.
+    section_list : sortedcontainers.SortedList, list or numpy.ndarray
+        A sorted list of start points of consecutive sections.
 
     Returns
     -------
@@ -40,18 +82,7 @@ def find_point_in_section_list(point, section_list):
     """
     if point < section_list[0] or point > section_list[-1]:
         return None
-    if point in section_list:
-        if point == section_list[-1]:
-            return section_list[-2]
-        ind = section_list.bisect(point) - 1
-        if ind == 0:
-            return section_list[0]
-        return section_list[ind]
-    try:
-        ind = section_list.bisect(point)
-        return section_list[ind - 1]
-    except IndexError:
-        return None
+    return section_list[_section_ix(point, section_list)]
 
 
 def find_range_ix_in_section_list(start, end, section_list):
@@ -69,8 +100,8 @@ def find_range_ix_in_section_list(start, end, section_list):
         The start of the desired range.
     end : float
         The end of the desired range.
-    section_list : sortedcontainers.SortedList
-        A list of start points of consecutive sections.
+    section_list : sortedcontainers.SortedList, list or numpy.ndarray
+        A sorted list of start points of consecutive sections.
 
     Returns
     -------
@@ -98,17 +129,14 @@ def find_range_ix_in_section_list(start, end, section_list):
     if start > section_list[-1] or end < section_list[0]:
         return [0, 0]
     if start < section_list[0]:
-        start_section = section_list[0]
+        start_ix = 0
     else:
-        start_section = find_point_in_section_list(start, section_list)
+        start_ix = _section_ix(start, section_list)
     if end > section_list[-1]:
-        end_section = section_list[-2]
+        end_ix = len(section_list) - 2
     else:
-        end_section = find_point_in_section_list(end, section_list)
-    return [
-        section_list.index(start_section),
-        section_list.index(end_section) + 1,
-    ]
+        end_ix = _section_ix(end, section_list)
+    return [start_ix, end_ix + 1]
 
 
 def find_range_in_section_list(start, end, section_list):
@@ -126,8 +154,8 @@ def find_range_in_section_list(start, end, section_list):
         The start of the desired range.
     end : float
         The end of the desired range.
-    section_list : sortedcontainers.SortedList
-        A list of start points of consecutive sections.
+    section_list : sortedcontainers.SortedList, list or numpy.ndarray
+        A sorted list of start points of consecutive sections.
 
     Returns
     -------
@@ -165,8 +193,8 @@ def find_range_ix_in_point_list(start, end, point_list):
         The start of the desired range.
     end : float
         The end of the desired range.
-    point_list : sortedcontainers.SortedList
-        A list of points.
+    point_list : sortedcontainers.SortedList, list or numpy.ndarray
+        A sorted list of points.
 
     Returns
     -------
@@ -191,4 +219,4 @@ def find_range_ix_in_point_list(start, end, point_list):
     [1, 3]
 
     """
-    return [point_list.bisect_left(start), point_list.bisect_right(end)]
+    return [_bisect_left(point_list, start), _bisect_right(point_list, end)]
@@ -0,0 +1,53 @@
+"""Test the BiDict class."""
+
+import pytest
+
+from strct.dicts import BiDict, reverse_dict, reverse_dict_partial
+
+
+def test_raise_policy():
+    bdict = BiDict({"a": 1, "b": 3})
+    assert bdict.inverse[1] == "a"
+    bdict["c"] = 4
+    bdict["a"] = 2
+    assert dict(bdict.inverse) == reverse_dict_partial(bdict)
+    assert 1 not in bdict.inverse
+    with pytest.raises(ValueError):
+        bdict["d"] = 3
+    assert "d" not in bdict
+    bdict["b"] = 3
+    del bdict["c"]
+    assert dict(bdict) == {"a": 2, "b": 3}
+    assert dict(bdict.inverse) == {2: "a", 3: "b"}
+    with pytest.raises(ValueError):
+        BiDict({"a": 1, "b": 1})
+    with pytest.raises(ValueError):
+        BiDict(on_dup="ignore")
+
+
+def test_overwrite_policy():
+    bdict = BiDict([("a", 1), ("b", 3), ("c", 1)], on_dup="overwrite")
+    assert dict(bdict) == {"b": 3, "c": 1}
+    bdict["d"] = 3
+    assert dict(bdict) == {"c": 1, "d": 3}
+    assert dict(bdict.inverse) == {1: "c", 3: "d"}
+    bdict.update({"c": 5})
+    assert dict(bdict.inverse) == {5: "c", 3: "d"}
+
+
+def test_multi_policy():
+    dicti = {"a": 1, "b": 3, "c": 1}
+    bdict = BiDict(dicti, on_dup="multi")
+    assert dict(bdict.inverse) == reverse_dict(dicti)
+    bdict["d"] = 1
+    bdict["a"] = 3
+    assert bdict.inverse[1] == ["c", "d"]
+    assert bdict.inverse[3] == ["a", "b"]
+    del bdict["b"]
+    del bdict["a"]
+    assert 3 not in bdict.inverse
+    assert len(bdict.inverse) == 1
+    copied = bdict.copy()
+    copied["e"] = 1
+    assert bdict.inverse[1] == ["c", "d"]
+    assert copied.inverse[1] == ["c", "d", "e"]
@@ -0,0 +1,151 @@
+"""Testing the bounded LRUDict, TTLDict and LFUDict."""
+
+import pytest
+
+from strct.dicts import LFUDict, LRUDict, TTLDict
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize("cls", [LRUDict, LFUDict])
+def test_invalid_maxsize(cls):
+    with pytest.raises(ValueError):
+        cls(0)
+    with pytest.raises(ValueError):
+        cls(None)
+
+
+def test_ttl_invalid_args():
+    with pytest.raises(ValueError):
+        TTLDict(0)
+    with pytest.raises(ValueError):
+        TTLDict(1, maxsize=0)
+
+
+def test_lru_eviction_order():
+    evicted = []
+    cache = LRUDict(3, on_evict=lambda k, v: evicted.append((k, v)))
+    for key in "abc":
+        cache[key] = key.upper()
+    assert cache.get("a") == "A"
+    cache["b"] = "B2"
+    cache["d"] = "D"
+    assert evicted == [("c", "C")]
+    assert list(cache) == ["a", "b", "d"]
+    cache["e"] = "E"
+    assert evicted == [("c", "C"), ("a", "A")]
+    assert cache.cache_info() == {
+        "hits": 1,
+        "misses": 0,
+        "evictions": 2,
+        "maxsize": 3,
+        "currsize": 3,
+    }
+
+
+def test_lru_stats_and_mapping_methods():
+    cache = LRUDict(2)
+    cache.update({"a": 1, "b": 2})
+    assert cache.get("x") is None
+    with pytest.raises(KeyError):
+        cache["x"]
+    assert "a" in cache
+    assert cache.hits == 0
+    assert cache.misses == 2
+    # listing items neither counts nor reorders
+    assert cache.items() == [("a", 1), ("b", 2)]
+    assert cache.values() == [1, 2]
+    assert cache.hits == 0
+    assert cache == {"a": 1, "b": 2}
+    assert cache.pop("a") == 1
+    del cache["b"]
+    assert len(cache) == 0
+    assert repr(cache) == "LRUDict({}, maxsize=2)"
+
+
+def test_ttl_expiry():
+    clock = _Clock()
+    expired = []
+    cache = TTLDict(10, on_evict=lambda k, v: expired.append(k), timer=clock)
+    cache["a"] = 1
+    clock.now = 4
+    cache["b"] = 2
+    clock.now = 9
+    assert cache["a"] == 1
+    clock.now = 10
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert expired == ["a"]
+    assert cache.cache_info()["misses"] == 1
+    assert len(cache) == 1
+    # setting a key again restarts its life
+    cache["b"] = 3
+    clock.now = 19
+    assert cache == {"b": 3}
+    clock.now = 20
+    assert len(cache) == 0
+    assert expired == ["a", "b"]
+
+
+def test_ttl_maxsize():
+    clock = _Clock()
+    cache = TTLDict(10, maxsize=2, timer=clock)
+    for i in range(4):
+        cache[i] = i
+    assert dict(cache) == {2: 2, 3: 3}
+    assert cache.evictions == 2
+
+
+def test_lfu_eviction_order():
+    evicted = []
+    cache = LFUDict(3, on_evict=lambda k, v: evicted.append(k))
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+    for _ in range(3):
+        cache["a"]
+    cache["b"]
+    assert cache.frequency("a") == 4
+    cache["d"] = 4
+    assert evicted == ["c"]
+    # ties are broken by recency
+    cache["e"] = 5
+    assert evicted == ["c", "d"]
+    cache["e"] = 6
+    cache["b"] = 7
+    cache["f"] = 8
+    assert evicted == ["c", "d", "e"]
+    assert sorted(cache.items()) == [("a", 1), ("b", 7), ("f", 8)]
+
+
+def test_lfu_delete_then_evict():
+    cache = LFUDict(2)
+    cache["a"] = 1
+    cache["a"]
+    cache["b"] = 2
+    del cache["b"]
+    cache["c"] = 3
+    cache["c"]
+    cache["c"]
+    del cache["a"]
+    cache["d"] = 4
+    cache["e"] = 5
+    assert dict(cache) == {"c": 3, "e": 5}
+    assert cache.evictions == 1
+
+
+@pytest.mark.parametrize(
+    "cache", [LRUDict(100), LFUDict(100), TTLDict(60, maxsize=100)]
+)
+def test_never_exceeds_maxsize(cache):
+    for i in range(1000):
+        cache[i % 317] = i
+        cache.get(i % 7)
+        assert len(cache) <= 100
+    assert cache.evictions > 0
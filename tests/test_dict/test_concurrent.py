@@ -0,0 +1,105 @@
+"""Testing the thread-safe ShardedDict."""
+
+import threading
+
+import pytest
+
+import strct.dicts
+from strct.dicts.concurrent import ShardedDict
+
+
+def _run_threads(target, num_threads=8):
+    threads = [
+        threading.Thread(target=target, args=(i,)) for i in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_submodule_attribute():
+    assert strct.dicts.concurrent.ShardedDict is ShardedDict
+
+
+def test_no_lost_updates():
+    sdict = ShardedDict(num_shards=4)
+
+    def work(thread_ix):
+        for i in range(2000):
+            sdict.increment(i % 10)
+            sdict.increment_nested(("nested", i % 3), 2)
+            sdict.append("log", thread_ix)
+            sdict.add(("seen", i % 5), thread_ix)
+
+    _run_threads(work)
+    snapshot = sdict.snapshot(consistent=True)
+    assert all(snapshot[i] == 1600 for i in range(10))
+    assert snapshot["nested"] == {0: 10672, 1: 10672, 2: 10656}
+    assert sorted(snapshot["log"]) == sorted(list(range(8)) * 2000)
+    assert snapshot[("seen", 0)] == set(range(8))
+
+
+def test_increment_adds_value_after_existing():
+    sdict = ShardedDict()
+    sdict.increment("s", "b", zero_value="a")
+    sdict.increment("s", "c")
+    sdict.increment("l", [2], zero_value=[1])
+    assert sdict["s"] == "abc"
+    assert sdict["l"] == [1, 2]
+
+
+def test_mapping_methods():
+    sdict = ShardedDict({"a": 1, "b": 2}, num_shards=3)
+    sdict["c"] = 3
+    del sdict["a"]
+    assert "a" not in sdict
+    assert sdict["b"] == 2
+    assert sdict.get("z", 7) == 7
+    assert sorted(sdict) == ["b", "c"]
+    assert len(sdict) == 2
+    assert sdict.pop("b") == 2
+    assert sdict.setdefault("c", 5) == 3
+    assert dict(sdict) == {"c": 3}
+    sdict.put_nested(("x", "y", "z"), 4)
+    assert sdict["x"] == {"y": {"z": 4}}
+    with pytest.raises(KeyError):
+        sdict["nope"]
+    with pytest.raises(ValueError):
+        ShardedDict(num_shards=0)
+
+
+def test_snapshot_is_a_copy():
+    sdict = ShardedDict()
+    sdict.append("l", 1)
+    snapshot = sdict.snapshot()
+    sdict.append("l", 2)
+    assert snapshot == {"l": [1]}
+
+
+def test_merge():
+    sdict = ShardedDict({"n": 1, "l": [1], "d": {"x": 1}, "s": "old"})
+    local = {"n": 2, "l": [2], "d": {"x": 1, "y": [3]}, "s": "new", "m": {}}
+    sdict.merge(local)
+    assert sdict.snapshot() == {
+        "n": 3,
+        "l": [1, 2],
+        "d": {"x": 2, "y": [3]},
+        "s": "new",
+        "m": {},
+    }
+    sdict.merge({"d": {"y": [4]}})
+    assert local["d"]["y"] == [3]
+    nested = [{"a": 1}]
+    sdict.merge({"l": nested})
+    nested[0]["a"] = 2
+    assert sdict.snapshot()["l"] == [1, 2, {"a": 1}]
+
+    flags = ShardedDict({"on": True})
+    flags.merge({"on": True})
+    assert flags["on"] is True
+
+    shared = ShardedDict()
+    _run_threads(lambda i: shared.merge({"total": i, "ids": {i}}))
+    assert shared["total"] == sum(range(8))
+    assert shared["ids"] == set(range(8))
@@ -1,8 +1,12 @@
 """Testing some dict-related strct functions."""
 
+import io
+import math
+
 import pytest
 
 from strct.dicts import (
+    CaseInsensitiveDict,
     add_many_to_dict_val_list,
     add_many_to_dict_val_set,
     add_to_dict_val_set,
@@ -21,10 +25,15 @@ from strct.dicts import (
     get_nested_val,
     in_nested_dicts,
     increment_dict_val,
+    increment_nested_many,
     increment_nested_val,
     key_tuple_value_nested_generator,
     key_value_nested_generator,
+    log_norm_dict,
     norm_int_dict,
+    normalize_inplace,
+    pformat_dist_dict_chunks,
+    pformat_int_dict_chunks,
     pprint_dist_dict,
     pprint_int_dict,
     put_nested_val,
@@ -33,6 +42,7 @@ from strct.dicts import (
     reverse_list_valued_dict,
     safe_alternative_nested_val,
     safe_nested_val,
+    softmax_dict,
     subdict_by_keys,
     sum_dicts,
     sum_num_dicts,
@@ -76,6 +86,29 @@ def test_increment_nested_val():
     assert dic1["b"]["z"] == 17
 
 
+def test_increment_nested_val_creates_levels():
+    dic1 = {}
+    increment_nested_val(dic1, ("t", "e", 200), 2)
+    increment_nested_val(dic1, ("t", "e", 200), 3)
+    increment_nested_val(dic1, ("t", "f"), [1], zero_value=[])
+    assert dic1 == {"t": {"e": {200: 5}, "f": [1]}}
+
+
+def test_increment_nested_many():
+    dic1 = get_nested_dict_1()
+    updates = [
+        (("a",), 1),
+        (("b", "g"), 4),
+        (("b", "z"), 17),
+        (["b", "g"], 1),
+        (("c", "d", "e"), 3),
+    ]
+    increment_nested_many(dic1, updates)
+    assert dic1 == {"a": 2, "b": {"g": 7, "z": 17}, "c": {"d": {"e": 3}}}
+    increment_nested_many(dic1, iter([(("c", "d", "e"), 1)]))
+    assert dic1["c"]["d"]["e"] == 4
+
+
 def test_get_first_val():
     dict_obj = {"a": 1, "c": 2}
     assert get_first_val(("a", "b", "c"), dict_obj) == 1
@@ -142,6 +175,26 @@ def test_any_path_in_dict():
     assert any_path_in_dict(("a", ("x", "y")), dict_obj) is False
 
 
+def test_path_checks_with_none_values():
+    dict_obj = {"a": {"n": None, "l": [None, {"b": None}]}}
+    assert in_nested_dicts(("a", "n"), dict_obj) is True
+    assert in_nested_dicts(("a", "l", 1, "b"), dict_obj) is True
+    assert in_nested_dicts(("a", "l", 2), dict_obj) is False
+    assert in_nested_dicts(("a", "n", "x"), dict_obj) is False
+    assert in_nested_dicts(("a", ["n"]), dict_obj) is False
+    assert in_nested_dicts((), dict_obj) is False
+    assert any_path_in_dict((("x", "a"), ("y", "n")), dict_obj) is True
+    assert any_path_in_dict(("a", "l", (5, 0)), dict_obj) is True
+    assert any_path_in_dict(("a", ("n", "l"), "b"), dict_obj) is False
+    assert any_path_in_dict((), dict_obj) is False
+
+
+def test_path_checks_on_dict_subclasses():
+    dict_obj = CaseInsensitiveDict.from_dict({"A": {"B": None}})
+    assert in_nested_dicts(("a", "b"), dict_obj) is True
+    assert any_path_in_dict((("x", "a"), "B"), dict_obj) is True
+
+
 def test_subdict_by_keys():
     dict_obj = {"a": 1, "b": 2, "c": 3, "d": 4}
     subdict = subdict_by_keys(dict_obj, ["b", "d", "e"])
@@ -208,6 +261,15 @@ def test_unite_dicts():
     dict_obj2 = {"a": 8, "c": 5}
     united = unite_dicts(dict_obj, dict_obj2)
     assert united == {"a": 8, "b": 1, "c": 5}
+    assert united is not dict_obj
+    assert dict_obj == {"a": 2, "b": 1}
+    assert unite_dicts() == {}
+    assert unite_dicts(dict_obj) == dict_obj
+    assert unite_dicts(dict_obj, [("c", 5)], {"b": 3}) == {
+        "a": 2,
+        "b": 3,
+        "c": 5,
+    }
 
 
 def test_deep_merge_dict():
@@ -223,6 +285,22 @@ def test_norm_int_dict():
     assert result == {"a": 0.3, "b": 0.5, "c": 0.2}
 
 
+def test_normalize_inplace():
+    dict_obj = {"a": 3, "b": 5, "c": 2}
+    assert normalize_inplace(dict_obj) is None
+    assert dict_obj == {"a": 0.3, "b": 0.5, "c": 0.2}
+
+
+def test_log_norm_dict_and_softmax_dict():
+    dict_obj = {"a": 10**400, "b": 3 * 10**400, "c": 0}
+    log_norm = log_norm_dict(dict_obj)
+    assert log_norm["a"] == pytest.approx(math.log(0.25))
+    assert log_norm["c"] == -math.inf
+    probs = softmax_dict(log_norm)
+    assert probs == pytest.approx({"a": 0.25, "b": 0.75, "c": 0.0})
+    assert softmax_dict({"a": -1e6, "b": -1e6}) == {"a": 0.5, "b": 0.5}
+
+
 def test_sum_num_dicts():
     dict1 = {"a": 3, "b": 2}
     dict2 = {"a": 7, "c": 8}
@@ -279,6 +357,80 @@ def test_key_tuple_value_nested_generator():
     ]
 
 
+def get_deep_dict(depth):
+    deep = leaf = {}
+    for i in range(depth - 1):
+        leaf[i] = {}
+        leaf = leaf[i]
+    leaf["x"] = 1
+    return deep
+
+
+def test_nested_generators_depth():
+    deep = get_deep_dict(3000)
+    assert list(key_value_nested_generator(deep)) == [("x", 1)]
+    ((path, val),) = key_tuple_value_nested_generator(deep)
+    assert len(path) == 3000
+    assert val == 1
+    ((path, val),) = key_tuple_value_nested_generator(deep, max_depth=2)
+    assert path == (0, 1)
+    assert val is deep[0][1]
+
+
+def test_nested_generators_5000_deep():
+    deep = get_deep_dict(5000)
+    assert list(key_value_nested_generator(deep)) == [("x", 1)]
+    for paths_as in ("tuple", "list", "str"):
+        ((path, val),) = key_tuple_value_nested_generator(
+            deep, paths_as=paths_as
+        )
+        assert val == 1
+    assert len(path.split(".")) == 5000
+    ((path, val),) = key_tuple_value_nested_generator(deep, prefix=(0, 1))
+    assert len(path) == 5000
+
+
+def test_nested_generators_options():
+    dicti = {"a": 1, "b": {"c": 3, "d": {"e": 5}}, "f": {}}
+    assert list(key_value_nested_generator(dicti, max_depth=2)) == [
+        ("a", 1),
+        ("c", 3),
+        ("d", {"e": 5}),
+    ]
+    assert list(key_value_nested_generator(dicti, prefix=("b", "d"))) == [
+        ("e", 5),
+    ]
+    assert list(key_value_nested_generator(dicti, prefix=("b", "c"))) == [
+        ("c", 3),
+    ]
+    assert list(key_value_nested_generator(dicti, prefix=("z",))) == []
+    assert list(
+        key_tuple_value_nested_generator(dicti, prefix=("b",), paths_as="list")
+    ) == [(["b", "c"], 3), (["b", "d", "e"], 5)]
+    assert list(
+        key_tuple_value_nested_generator(
+            dicti, prefix=("b", "d"), max_depth=2, paths_as="str"
+        )
+    ) == [("b.d", {"e": 5})]
+    assert dict(
+        key_tuple_value_nested_generator(dicti, paths_as="str", separator="/")
+    ) == {"a": 1, "b/c": 3, "b/d/e": 5}
+    with pytest.raises(ValueError):
+        key_tuple_value_nested_generator(dicti, paths_as="set")
+
+
+def test_nested_generators_cycles():
+    shared = {"x": 1}
+    dag = {"a": shared, "b": shared}
+    assert list(key_value_nested_generator(dag)) == [("x", 1), ("x", 1)]
+    cyclic = {"a": {"b": {}}}
+    cyclic["a"]["b"]["c"] = cyclic
+    with pytest.raises(ValueError):
+        list(key_value_nested_generator(cyclic))
+    with pytest.raises(ValueError):
+        list(key_tuple_value_nested_generator(cyclic, prefix=("a",)))
+
+
 def test_sum_dicts_normalize():
     dict1 = {"a": 3, "b": 2}
     dict2 = {"a": 7, "c": 8}
@@ -306,3 +458,67 @@ def test_pprint_dist_dict(capsys):
     pprint_dist_dict({"a": 0.7, "b": 0.3}, descending=True)
     captured = capsys.readouterr()
     assert "a" in captured.out
+
+
+def test_pprint_int_dict_file_and_truncation():
+    dict_obj = {"a": 3, "b": 1, "c": 7, "d": 5}
+    out = io.StringIO()
+    pprint_int_dict(dict_obj, file=out)
+    assert out.getvalue() == "{\n    b: 1\n    a: 3\n    d: 5\n    c: 7\n}\n"
+    out = io.StringIO()
+    pprint_int_dict(dict_obj, indent=2, descending=True, top_n=2, file=out)
+    assert out.getvalue() == "{\n  c: 7\n  d: 5\n  ...\n}\n"
+    out = io.StringIO()
+    pprint_int_dict(dict_obj, head=1, tail=1, file=out)
+    assert out.getvalue() == "{\n    b: 1\n    ...\n    c: 7\n}\n"
+    out = io.StringIO()
+    pprint_int_dict(dict_obj, descending=True, tail=2, file=out)
+    assert out.getvalue() == "{\n    ...\n    a: 3\n    b: 1\n}\n"
+    out = io.StringIO()
+    pprint_int_dict(dict_obj, head=3, tail=3, file=out)
+    assert "..." not in out.getvalue()
+    with pytest.raises(ValueError):
+        pprint_int_dict(dict_obj, top_n=1, head=1)
+
+
+def _printed_lines(dict_obj, **kwargs):
+    out = io.StringIO()
+    pprint_int_dict(dict_obj, file=out, **kwargs)
+    return out.getvalue().splitlines()[1:-1]
+
+
+def test_pprint_int_dict_truncation_ties():
+    dict_obj = {"a": 1, "b": 1, "c": 1}
+    assert _printed_lines(dict_obj, descending=True) == [
+        "    c: 1",
+        "    b: 1",
+        "    a: 1",
+    ]
+    assert _printed_lines(dict_obj, descending=True, head=2) == [
+        "    c: 1",
+        "    b: 1",
+        "    ...",
+    ]
+    # truncated output is always a part of the full output
+    dict_obj = {"k{}".format(i): i % 4 for i in range(20)}
+    for descending in (False, True):
+        full = _printed_lines(dict_obj, descending=descending)
+        head_tail = _printed_lines(
+            dict_obj, descending=descending, head=3, tail=4
+        )
+        assert head_tail == full[:3] + ["    ..."] + full[-4:]
+        top = _printed_lines(dict_obj, descending=descending, top_n=5)
+        expected = full[:5] if descending else full[-5:]
+        assert [line for line in top if line != "    ..."] == expected
+
+
+def test_pformat_chunks():
+    dict_obj = {i: i for i in range(10)}
+    chunks = list(pformat_int_dict_chunks(dict_obj, chunk_size=4))
+    assert len(chunks) == 3
+    assert all(chunk.endswith("\n") for chunk in chunks)
+    out = io.StringIO()
+    pprint_int_dict(dict_obj, file=out)
+    assert "".join(chunks) == out.getvalue()
+    chunks = list(pformat_dist_dict_chunks({"a": 0.7, "b": 0.3}, top_n=1))
+    assert chunks == ["{\n    ...\n    a: 70.00 %\n}\n"]
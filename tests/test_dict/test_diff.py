@@ -0,0 +1,77 @@
+"""Test the diff_nested and apply_patch functions."""
+
+import copy
+
+from strct.dicts import apply_patch, diff_nested
+from strct.hash import json_based_stable_hash
+
+
+def get_doc():
+    return {
+        "a": 1,
+        "b": {"c": [1, 2], "d": {"e": "x", "f": 2.5}},
+        "g": {"h": True},
+    }
+
+
+def test_diff_nested():
+    old = get_doc()
+    new = copy.deepcopy(old)
+    new["a"] = 1.0
+    new["b"]["d"]["e"] = "y"
+    del new["b"]["c"]
+    new["g"] = 3
+    new["i"] = {"j": 1}
+    patch = diff_nested(old, new)
+    assert patch == {
+        "added": {("i",): {"j": 1}},
+        "removed": {("b", "c"): [1, 2]},
+        "changed": {
+            ("a",): (1, 1.0),
+            ("b", "d", "e"): ("x", "y"),
+            ("g",): ({"h": True}, 3),
+        },
+    }
+    assert diff_nested(old, copy.deepcopy(old)) == {
+        "added": {},
+        "removed": {},
+        "changed": {},
+    }
+
+
+def test_diff_skips_shared_and_hashed_subtrees():
+    class NoItems(dict):
+        def items(self):
+            raise AssertionError("subtree should have been skipped")
+
+    shared = NoItems(x=1)
+    old = {"a": shared, "b": 1}
+    new = {"a": shared, "b": 2}
+    assert diff_nested(old, new)["changed"] == {("b",): (1, 2)}
+    old = {"a": {"x": 1}, "b": 1}
+    new = {"a": NoItems(x=1), "b": 1}
+    cache = {}
+    patch = diff_nested(old, new, lambda d: sorted(dict.items(d)), cache)
+    assert patch["changed"] == {}
+    assert len(cache) == 2
+    old = {"a": {"x": 1}}
+    new = {"a": {"x": 2}}
+    patch = diff_nested(old, new, json_based_stable_hash)
+    assert patch["changed"] == {("a", "x"): (1, 2)}
+
+
+def test_apply_patch():
+    old = get_doc()
+    new = copy.deepcopy(old)
+    new["b"]["d"]["f"] = 3.5
+    del new["a"]
+    new["b"]["k"] = {"l": 1}
+    patched = apply_patch(old, diff_nested(old, new))
+    assert patched == new
+    assert old == get_doc()
+    assert patched["g"] is old["g"]
+    assert patched["b"]["c"] is old["b"]["c"]
+    assert patched["b"] is not old["b"]
+    later = apply_patch(patched, {"added": {("m", "n"): 1}})
+    assert later["m"] == {"n": 1}
+    assert diff_nested(patched, later)["added"] == {("m",): {"n": 1}}
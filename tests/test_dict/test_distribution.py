@@ -0,0 +1,53 @@
+"""Test the Distribution class."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from strct.dicts import Distribution, norm_int_dict  # noqa: E402
+
+
+def test_probabilities():
+    counts = {"a": 3, "b": 5, "c": 2, "d": 0}
+    dist = Distribution.from_dict(counts)
+    assert dist.to_dict() == pytest.approx(norm_int_dict(counts))
+    assert dist["b"] == pytest.approx(0.5)
+    assert "d" in dist
+    assert len(dist) == 4
+    with pytest.raises(ValueError):
+        Distribution(["a"], [1, 2])
+    with pytest.raises(ValueError):
+        Distribution(["a", "b"], [0, 0])
+    with pytest.raises(ValueError):
+        Distribution(["a", "b"], [-1, 2])
+
+
+def test_sampling():
+    dist = Distribution(["a", ("t", 1), "c", "d"], [0.1, 0.2, 0.7, 0.0])
+    samples = dist.sample(size=100000, rng=1)
+    assert samples.shape == (100000,)
+    freqs = {key: float(np.mean(samples == key)) for key in ("a", "c", "d")}
+    assert freqs["a"] == pytest.approx(0.1, abs=0.01)
+    assert freqs["c"] == pytest.approx(0.7, abs=0.01)
+    assert freqs["d"] == 0
+    indices = dist.sample_indices(size=100000, rng=np.random.default_rng(2))
+    assert np.mean(indices == 1) == pytest.approx(0.2, abs=0.01)
+    assert dist.sample(rng=3) in dist
+    assert Distribution(["x"], [5]).sample(size=3).tolist() == ["x"] * 3
+
+
+def test_entropy_and_kl():
+    uniform = Distribution("abcd", [1, 1, 1, 1])
+    assert uniform.entropy() == pytest.approx(math.log(4))
+    assert uniform.entropy(base=2) == pytest.approx(2)
+    skewed = Distribution("dcba", [1, 1, 2, 4])
+    expected = sum(
+        0.25 * math.log(0.25 / q) for q in (0.5, 0.25, 0.125, 0.125)
+    )
+    assert uniform.kl_divergence(skewed) == pytest.approx(expected)
+    assert uniform.kl_divergence(uniform) == pytest.approx(0)
+    partial = Distribution("ab", [1, 1])
+    assert partial.kl_divergence(uniform, base=2) == pytest.approx(1)
+    assert uniform.kl_divergence(partial) == math.inf
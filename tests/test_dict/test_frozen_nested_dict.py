@@ -0,0 +1,168 @@
+"""Testing the persistent FrozenNestedDict."""
+
+import copy
+import pickle
+import random
+
+import pytest
+
+from strct.dicts import FrozenNestedDict
+from strct.hash import stable_hash
+
+
+class _CollidingKey:
+    """A key whose instances all share the same hash."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 7
+
+    def __eq__(self, other):
+        return isinstance(other, _CollidingKey) and other.name == self.name
+
+    def __repr__(self):
+        return "_CollidingKey({!r})".format(self.name)
+
+
+def test_random_updates_match_dict():
+    rand = random.Random(0)
+    fdict = FrozenNestedDict()
+    expected = {}
+    versions = []
+    for _ in range(3000):
+        key = rand.randrange(500)
+        if key in expected and rand.random() < 0.3:
+            fdict = fdict.delete(key)
+            del expected[key]
+        else:
+            fdict = fdict.set(key, key * 2)
+            expected[key] = key * 2
+        versions.append((fdict, dict(expected)))
+    assert fdict == expected
+    assert len(fdict) == len(expected)
+    # older versions are untouched
+    for version, version_expected in versions[::100]:
+        assert version.to_dict() == version_expected
+    with pytest.raises(KeyError):
+        fdict.delete(1000)
+
+
+def test_colliding_keys():
+    keys = [_CollidingKey(i) for i in range(5)]
+    fdict = FrozenNestedDict((key, i) for i, key in enumerate(keys))
+    assert len(fdict) == 5
+    assert fdict[_CollidingKey(3)] == 3
+    fdict = fdict.set(_CollidingKey(3), 30).delete(_CollidingKey(0))
+    assert dict(fdict) == {key: i for i, key in enumerate(keys) if i} | {
+        keys[3]: 30
+    }
+    for i in range(1, 5):
+        fdict = fdict.delete(keys[i])
+    assert len(fdict) == 0
+    assert fdict == {}
+
+
+def test_nested_updates_share_structure():
+    fdict = FrozenNestedDict(
+        {"a": {"b": {"c": 1}, "x": {"y": 2}}, "z": {"w": 3}}
+    )
+    assert isinstance(fdict["a"]["b"], FrozenNestedDict)
+    new_fdict = fdict.set_in(("a", "b", "c"), 10)
+    assert fdict.get_in(("a", "b", "c")) == 1
+    assert new_fdict.get_in(("a", "b", "c")) == 10
+    assert new_fdict["z"] is fdict["z"]
+    assert new_fdict["a"]["x"] is fdict["a"]["x"]
+    assert fdict.set_in(("a", "b", "c"), 1) is fdict
+    new_fdict = new_fdict.set_in(("q", "r"), {"s": 4})
+    assert new_fdict.get_in(("q", "r", "s")) == 4
+    with pytest.raises(TypeError):
+        fdict.set_in(("a", "b", "c", "d"), 5)
+    with pytest.raises(ValueError):
+        fdict.set_in((), 5)
+
+
+def test_update_and_delete_in():
+    fdict = FrozenNestedDict({"hits": {"a": 1}})
+    fdict = fdict.update_in(("hits", "a"), lambda x: x + 1)
+    fdict = fdict.update_in(("hits", "b"), lambda x: x + 1, default=0)
+    assert fdict.to_dict() == {"hits": {"a": 2, "b": 1}}
+    fdict = fdict.delete_in(("hits", "a"))
+    assert fdict.to_dict() == {"hits": {"b": 1}}
+    with pytest.raises(KeyError):
+        fdict.delete_in(("hits", "a"))
+    with pytest.raises(KeyError):
+        fdict.delete_in(("hits", "b", "c"))
+
+
+def test_merge():
+    base = {"a": 1, "b": 2, "c": {"d": 4, "h": {"i": 9}}, "e": 5}
+    priority = {"a": {"g": 7}, "c": {"d": 3, "h": {"j": 1}}, "f": 6}
+    fbase = FrozenNestedDict(base)
+    merged = fbase.merge(priority)
+    assert merged.to_dict() == {
+        "a": {"g": 7},
+        "b": 2,
+        "c": {"d": 3, "h": {"i": 9, "j": 1}},
+        "e": 5,
+        "f": 6,
+    }
+    assert fbase.to_dict() == base
+    assert fbase.merge(FrozenNestedDict(priority)) == merged
+
+
+def test_hash_and_equality():
+    fdict1 = FrozenNestedDict({"a": {"b": 1}, "c": (1, 2)})
+    fdict2 = FrozenNestedDict({"c": (1, 2)}).set_in(("a", "b"), 1)
+    assert fdict1 == fdict2
+    assert hash(fdict1) == hash(fdict2)
+    assert {fdict1: 1}[fdict2] == 1
+    assert fdict1 == {"a": {"b": 1}, "c": (1, 2)}
+    assert fdict1 != fdict1.set("c", 3)
+    assert fdict1 != FrozenNestedDict({"a": {"b": 1}})
+
+
+def test_list_and_set_values_are_frozen():
+    fdict = FrozenNestedDict({"a": [1, {"b": [2]}], "s": {3}})
+    assert fdict["a"] == (1, FrozenNestedDict({"b": (2,)}))
+    assert fdict["s"] == frozenset({3})
+    assert fdict.set_in(("c",), [4])["c"] == (4,)
+    assert hash(fdict) == hash(FrozenNestedDict(fdict.to_dict()))
+
+
+def test_to_dict_converts_frozen_values_back():
+    plain = {"a": [1, {"b": [2]}], "s": {3, (4, 5)}}
+    fdict = FrozenNestedDict(plain)
+    assert fdict.to_dict() == plain
+    assert FrozenNestedDict({"a": [1]}).to_dict() == {"a": [1]}
+    # tuples and frozensets are returned as lists and sets
+    fdict = FrozenNestedDict({"t": (1, 2), "f": frozenset({3})})
+    assert fdict.to_dict() == {"t": [1, 2], "f": {3}}
+    assert type(fdict.to_dict()["f"]) is set
+
+
+def test_unhashable_values():
+    fdict = FrozenNestedDict({"a": bytearray(b"x")})
+    with pytest.raises(TypeError):
+        hash(fdict)
+
+
+def test_stable_hash():
+    plain = {"a": {"b": 1, "c": [1, 2]}, "d": "x"}
+    fdict = FrozenNestedDict(plain)
+    assert stable_hash(fdict) == stable_hash(plain)
+    # the hash of the unchanged subtree is cached and reused
+    assert fdict["a"]._stable_hash is not None
+    new_fdict = fdict.set("d", "y")
+    assert stable_hash(new_fdict) == stable_hash({**plain, "d": "y"})
+
+
+def test_copy_and_pickle():
+    fdict = FrozenNestedDict({"a": {"b": 1}})
+    assert copy.copy(fdict) is fdict
+    assert copy.deepcopy(fdict) is fdict
+    unpickled = pickle.loads(pickle.dumps(fdict))  # noqa: S301
+    assert unpickled == fdict
+    assert isinstance(unpickled["a"], FrozenNestedDict)
+    assert repr(fdict) == "FrozenNestedDict({'a': {'b': 1}})"
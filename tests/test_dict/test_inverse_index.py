@@ -0,0 +1,87 @@
+"""Test the InverseIndex class and the build_inverse_index function."""
+
+import os
+
+import pytest
+
+from strct.dicts import (
+    InverseIndex,
+    build_inverse_index,
+    reverse_dict,
+    reverse_list_valued_dict,
+)
+
+
+def test_matches_reverse_dict():
+    dicti = {"a": 1, "d": 3, "c": 1, "b": 1, "e": 4}
+    index = build_inverse_index(dicti)
+    assert dict(index) == reverse_dict(dicti)
+    assert index[1] == ["a", "b", "c"]
+    assert index.num_members(1) == 3
+    assert len(index) == 3
+    assert 4 in index
+    assert 2 not in index
+    with pytest.raises(KeyError):
+        index[2]
+
+
+def test_list_valued():
+    dicti = {"b": [3, 4], "a": [1, 2, 3]}
+    index = build_inverse_index(dicti, list_valued=True)
+    assert index[3] == ["a", "b"]
+    assert index[4] == ["b"]
+    unique = {"a": [1, 2], "b": [3, 4]}
+    reversed_unique = reverse_list_valued_dict(unique)
+    index = build_inverse_index(unique, list_valued=True)
+    assert {value: keys[0] for value, keys in index.items()} == (
+        reversed_unique
+    )
+
+
+def test_list_valued_repeated_values():
+    index = build_inverse_index({"a": [1, 1, 2], "b": [1]}, list_valued=True)
+    assert index[1] == ["a", "b"]
+    assert index[2] == ["a"]
+    assert index.num_members(1) == 2
+
+
+def test_save_and_load(tmp_path):
+    dicti = {"a": 1, "b": "x", "c": 1, "d": 2.5}
+    path = tmp_path / "index.bin"
+    build_inverse_index(dicti).save(path)
+    with InverseIndex.load(path) as index:
+        assert dict(index) == reverse_dict(dicti)
+        assert index.num_members(1) == 2
+    empty_path = tmp_path / "empty.bin"
+    build_inverse_index({}).save(empty_path)
+    with InverseIndex.load(empty_path) as index:
+        assert len(index) == 0
+
+
+def test_load_bad_file(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        InverseIndex.load(path)
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        InverseIndex.load(path)
+
+
+@pytest.mark.parametrize("length", [10, 40, 60, -1])
+def test_load_truncated_file(tmp_path, length):
+    path = tmp_path / "index.bin"
+    build_inverse_index({"a": 1, "b": 2, "c": 1}).save(path)
+    path.write_bytes(path.read_bytes()[:length])
+    with pytest.raises(
+        ValueError, match="corrupt inverse index file"
+    ) as excinfo:
+        InverseIndex.load(path)
+    if os.path.isdir("/proc/self/fd"):
+        # the file was closed, though the traceback references the load frame
+        assert excinfo.traceback
+        assert not any(
+            os.readlink(os.path.join("/proc/self/fd", fd)) == str(path)
+            for fd in os.listdir("/proc/self/fd")
+            if os.path.exists(os.path.join("/proc/self/fd", fd))
+        )
@@ -0,0 +1,29 @@
+"""Test the KeyProjector class."""
+
+from strct.dicts import KeyProjector, subdict_by_keys
+
+
+def test_projection():
+    projector = KeyProjector(["b", "d", "e", "b"])
+    assert projector.keys == ("b", "d", "e")
+    small = {"b": 2, "z": 0}
+    large = {k: i for i, k in enumerate("abcdefgh")}
+    assert projector(small) == {"b": 2}
+    assert projector(large) == {"b": 1, "d": 3, "e": 4}
+    assert projector({}) == {}
+    for dict_obj in (small, large):
+        assert projector(dict_obj) == subdict_by_keys(dict_obj, "bde")
+    assert projector.project_many([small, large]) == [
+        {"b": 2},
+        {"b": 1, "d": 3, "e": 4},
+    ]
+
+
+def test_projection_key_order():
+    projector = KeyProjector(["b", "d", "e"])
+    # both the small-dict and the large-dict paths follow the key order
+    small = {"d": 1, "b": 2}
+    large = {"d": 1, "b": 2, "x": 3, "y": 4}
+    assert list(projector(small)) == ["b", "d"]
+    assert list(projector(large)) == ["b", "d"]
+    assert list(subdict_by_keys(small, ["b", "d", "e"])) == ["b", "d"]
@@ -0,0 +1,71 @@
+"""Test the MultiDict, MultiSet and FrozenMultiDict classes."""
+
+import pytest
+
+from strct.dicts import (
+    FrozenMultiDict,
+    MultiDict,
+    MultiSet,
+    add_many_to_dict_val_list,
+    add_to_dict_val_set,
+)
+
+
+def test_multidict():
+    mdict = MultiDict([("a", 1), ("b", 2), ("a", 1)])
+    mdict.extend("b", [[3], 4])
+    mdict.add("c", [5])
+    assert mdict["a"] == [1, 1]
+    assert mdict["b"] == [2, [3], 4]
+    assert mdict["c"] == [[5]]
+    assert mdict.num_values("c") == 1
+    assert mdict.num_values("b") == 3
+    assert len(mdict) == 3
+    assert "a" in mdict
+    mdict["a"] = [7]
+    assert mdict["a"] == [7]
+    mdict["a"] = []
+    assert "a" not in mdict
+    del mdict["c"]
+    with pytest.raises(KeyError):
+        mdict["c"]
+    expected = {}
+    add_many_to_dict_val_list(expected, "b", [2, [3], 4])
+    assert mdict.to_dict() == expected
+
+
+def test_multiset():
+    mset = MultiSet()
+    mset.extend_from_pairs([("a", 1), ("a", 1), ("b", 2), ("b", 3)])
+    mset.add("b", 2)
+    assert mset["a"] == {1}
+    assert mset["b"] == {2, 3}
+    assert mset.num_values("a") == 1
+    expected = {}
+    for key, val in [("a", 1), ("b", 2), ("b", 3)]:
+        add_to_dict_val_set(expected, key, val)
+    assert mset.to_dict() == expected
+    assert mset == MultiSet([("b", 3), ("a", 1), ("b", 2)])
+
+
+def test_frozen_multidict():
+    mdict = MultiDict([("a", 1), ("b", 2), ("a", 3)])
+    frozen = mdict.freeze(typecode="q")
+    assert isinstance(frozen, FrozenMultiDict)
+    assert frozen["a"] == [1, 3]
+    assert frozen["b"] == [2]
+    assert frozen.num_values("a") == 2
+    assert list(frozen) == ["a", "b"]
+    assert dict(frozen) == mdict.to_dict()
+    assert "c" not in frozen
+    with pytest.raises(KeyError):
+        frozen["c"]
+    frozen = MultiSet([("x", "y")]).freeze()
+    assert frozen["x"] == ["y"]
+
+
+def test_base_class_is_abstract():
+    from strct.dicts._multidict import _MultiDictBase
+
+    with pytest.raises(TypeError):
+        _MultiDictBase()
@@ -0,0 +1,85 @@
+"""Test the NestedCounter class."""
+
+import pytest
+
+from strct.dicts import NestedCounter, increment_nested_val
+
+
+def get_counter():
+    counter = NestedCounter()
+    counter.increment(("t1", "/a", 200))
+    counter.increment(("t1", "/a", 500), 2)
+    counter.increment(("t1", "/b", 200), 4)
+    counter.increment(("t2", "/a", 200), 3)
+    return counter
+
+
+def test_increment_and_get():
+    counter = get_counter()
+    counter.increment(("t1", "/a", 200))
+    assert counter[("t1", "/a", 200)] == 2
+    assert counter[("t3", "/a", 200)] == 0
+    assert ("t2", "/a", 200) in counter
+    assert ("t2", "/a") not in counter
+    assert len(counter) == 4
+
+
+def test_rollups():
+    counter = get_counter()
+    assert counter.total() == 10
+    assert counter.total(("t1",)) == 7
+    assert counter.total(("t1", "/a")) == 3
+    assert counter.total(("t1", "/a", 500)) == 2
+    assert counter.total(("t9",)) == 0
+    counter.increment(("t2", "/c", 200), 10)
+    assert counter.total() == 20
+    assert counter.top_n((), 1) == [("t2", 13)]
+    assert counter.top_n(("t1",), 5) == [("/b", 4), ("/a", 3)]
+    assert counter.top_n(("t9",), 5) == []
+
+
+def test_merge_and_conversion():
+    nested = {}
+    increment_nested_val(nested, ("t1", "/a", 200), 1)
+    increment_nested_val(nested, ("t1", "/a", 500), 2)
+    counter = NestedCounter.from_nested_dict(nested)
+    assert counter.to_nested_dict() == nested
+    counter.merge(get_counter())
+    assert counter[("t1", "/a", 500)] == 4
+    assert counter.total(("t2",)) == 3
+    counter.update({("t2", "/a", 200): 1})
+    counter.update([(["t2", "/a", 200], 1)])
+    assert counter[("t2", "/a", 200)] == 5
+    assert NestedCounter(counter.items()) == counter
+
+
+def test_list_keys():
+    counter = NestedCounter()
+    counter.increment(["a", "b"])
+    counter.increment(("a", "b"), 2)
+    assert counter[["a", "b"]] == 3
+    assert list(counter) == [("a", "b")]
+
+
+def test_incremental_rollups_match_rebuild():
+    counter = get_counter()
+    assert counter.total() == 10
+    for i in range(50):
+        counter.increment(("t{}".format(i % 3), "/x", i % 4), i)
+    rebuilt = NestedCounter(counter.items())
+    for prefix in [(), ("t0",), ("t1", "/a"), ("t2", "/x", 1)]:
+        assert counter.total(prefix) == rebuilt.total(prefix)
+        assert counter.top_n(prefix, 3) == rebuilt.top_n(prefix, 3)
+
+
+def test_to_nested_dict_mixed_depths():
+    counter = NestedCounter()
+    counter.increment(("a",))
+    counter.increment(("a", "b"))
+    with pytest.raises(ValueError, match="mixed depths"):
+        counter.to_nested_dict()
+    counter = NestedCounter()
+    counter.increment(("a", "b"))
+    counter.increment(("a",))
+    with pytest.raises(ValueError, match="mixed depths"):
+        counter.to_nested_dict()
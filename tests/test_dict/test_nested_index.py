@@ -0,0 +1,99 @@
+"""Testing the NestedIndex class."""
+
+import pytest
+
+from strct.dicts import (
+    NestedIndex,
+    get_alternative_nested_val,
+    key_tuple_value_nested_generator,
+)
+
+CATALOG = {
+    "items": {
+        "a": {"price": 3, "tags": ["x"]},
+        "b": {"price": 5},
+        "c": {"name": "c"},
+    },
+    "meta": {"version": 2, "empty": {}},
+    "count": 3,
+}
+
+
+@pytest.fixture(params=[False, True], ids=["eager", "lazy"])
+def index(request):
+    return NestedIndex(CATALOG, lazy=request.param)
+
+
+def test_lookups(index):
+    assert index[("items", "a", "price")] == 3
+    assert index[("items", "a")] is CATALOG["items"]["a"]
+    assert index[()] is CATALOG
+    assert index[("count",)] == 3
+    assert index[("meta", "empty")] == {}
+    assert ("items", "b") in index
+    assert ("items", "d") not in index
+    assert ("items", "a", "tags", 0) not in index
+    assert index.get(("items", "z"), 7) == 7
+    with pytest.raises(KeyError):
+        index[("nope",)]
+
+
+def test_none_values():
+    index = NestedIndex({"a": {"b": None}})
+    assert ("a", "b") in index
+    assert index[("a", "b")] is None
+
+
+def test_items(index):
+    expected = [
+        (path, value)
+        for path, value in key_tuple_value_nested_generator(CATALOG)
+        if not isinstance(value, dict)
+    ]
+    assert list(index.items()) == expected
+    assert len(index) == len(expected)
+    assert list(index.items(("items", "a"))) == [
+        (("items", "a", "price"), 3),
+        (("items", "a", "tags"), ["x"]),
+    ]
+    assert list(index.items(("meta", "empty"))) == []
+    assert list(index.items(("count",))) == [(("count",), 3)]
+    assert list(index.items(("missing",))) == []
+
+
+def test_match(index):
+    assert index.match(("items", "*", "price")) == [
+        (("items", "a", "price"), 3),
+        (("items", "b", "price"), 5),
+    ]
+    assert index.match(("*", "version")) == [(("meta", "version"), 2)]
+    assert index.match(("*",)) == [
+        (("items",), CATALOG["items"]),
+        (("meta",), CATALOG["meta"]),
+        (("count",), 3),
+    ]
+    assert index.match(("count", "*")) == []
+    assert index.match(["items", "?", "name"], wildcard="?") == [
+        (("items", "c", "name"), "c")
+    ]
+    # cached results are not shared with callers
+    index.match(("items", "*", "price")).clear()
+    assert len(index.match(("items", "*", "price"))) == 2
+
+
+def test_get_alternative(index):
+    for key_tuple in [
+        ("items", ("x", "b", "a"), "price"),
+        (["meta", "items"], ("c", "version")),
+    ]:
+        assert index.get_alternative(key_tuple) == get_alternative_nested_val(
+            key_tuple, CATALOG
+        )
+    assert index.get_alternative((("x", "y"), "z"), 0) == 0
+
+
+def test_lazy_indexes_on_demand():
+    index = NestedIndex(CATALOG, lazy=True)
+    assert index._leaves == {}
+    assert index[("meta", "version")] == 2
+    assert list(index._leaves) == ["meta"]
@@ -0,0 +1,104 @@
+"""Testing wildcard path queries."""
+
+import pytest
+
+from strct.dicts import Query, compile_query, select
+
+LOGS = {
+    "hosts": {
+        "web": {"requests": [{"ms": 3, "status": 200}, {"ms": 7}]},
+        "db": {"requests": [{"ms": 9, "status": 500}], "ms": 1},
+    },
+    "ms": 0,
+}
+
+
+def _select(query, dict_obj=LOGS):
+    return list(select(query, dict_obj))
+
+
+def test_exact_paths():
+    assert _select(("hosts", "db", "ms")) == [(("hosts", "db", "ms"), 1)]
+    assert _select(("hosts", "web", "requests", 1, "ms")) == [
+        (("hosts", "web", "requests", 1, "ms"), 7)
+    ]
+    assert _select(("hosts", "nope")) == []
+    assert _select(("ms", "x")) == []
+    assert _select(("hosts", "web", "requests", 5)) == []
+    assert _select(()) == [((), LOGS)]
+    assert _select(("a",), {"a": None}) == [(("a",), None)]
+
+
+def test_any_key():
+    assert _select(("hosts", "*", "requests", "*", "ms")) == [
+        (("hosts", "web", "requests", 0, "ms"), 3),
+        (("hosts", "web", "requests", 1, "ms"), 7),
+        (("hosts", "db", "requests", 0, "ms"), 9),
+    ]
+    assert _select(("*", "*", "ms")) == [(("hosts", "db", "ms"), 1)]
+
+
+def test_any_depth():
+    assert [path for path, _ in _select(("**", "ms"))] == [
+        ("hosts", "web", "requests", 0, "ms"),
+        ("hosts", "web", "requests", 1, "ms"),
+        ("hosts", "db", "requests", 0, "ms"),
+        ("hosts", "db", "ms"),
+        ("ms",),
+    ]
+    assert _select(("hosts", "**", "status")) == [
+        (("hosts", "web", "requests", 0, "status"), 200),
+        (("hosts", "db", "requests", 0, "status"), 500),
+    ]
+    # ** matches zero levels, and each value is yielded once
+    assert _select(("**", "**", "hosts", "**", "db", "ms")) == [
+        (("hosts", "db", "ms"), 1)
+    ]
+    assert len(_select(("**",))) == 16
+
+
+def test_slices_and_predicates():
+    rows = {"rows": [10, 11, 12, 13]}
+    assert _select(("rows", slice(1, None, 2)), rows) == [
+        (("rows", 1), 11),
+        (("rows", 3), 13),
+    ]
+    assert _select(("rows", slice(-1, None)), rows) == [(("rows", 3), 13)]
+    assert _select((slice(0, 1),), rows) == []
+
+    def failed(request):
+        return request["status"] >= 500
+
+    assert _select(("**", failed, "ms")) == [
+        (("hosts", "db", "requests", 0, "ms"), 9)
+    ]
+
+
+def test_string_queries():
+    assert _select("hosts.*.requests.[0].ms") == [
+        (("hosts", "web", "requests", 0, "ms"), 3),
+        (("hosts", "db", "requests", 0, "ms"), 9),
+    ]
+    assert _select("hosts/web/requests/[1:]", dict_obj=LOGS) == []
+    assert list(select("hosts/web/requests/[1:]", LOGS, separator="/")) == [
+        (("hosts", "web", "requests", 1), {"ms": 7})
+    ]
+    with pytest.raises(ValueError):
+        compile_query("a.[x]")
+    with pytest.raises(ValueError):
+        compile_query("a.[1:2:3:4]")
+
+
+def test_compiled_queries():
+    query = compile_query("hosts.*.ms")
+    assert isinstance(query, Query)
+    assert compile_query("hosts.*.ms") is query
+    assert list(select(query, LOGS)) == list(query.select(LOGS))
+    assert list(query.select(LOGS)) == [(("hosts", "db", "ms"), 1)]
+    # queries with unhashable steps are compiled uncached
+    assert compile_query(("rows", [1])).steps == ("rows", [1])
+
+
+def test_select_is_lazy():
+    results = select(("**",), LOGS)
+    assert next(results) == ((), LOGS)
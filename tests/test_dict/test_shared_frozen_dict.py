@@ -0,0 +1,131 @@
+"""Testing the SharedFrozenDict class."""
+
+import multiprocessing
+import pickle
+from multiprocessing import shared_memory
+
+import pytest
+
+from strct.dicts import SharedFrozenDict, reverse_dict
+
+DATA = {
+    "a": [1, 2],
+    "ünï": {"x": None},
+    7: "seven",
+    -3: -3.5,
+    2.5: True,
+    10**30: "big",
+    "": 0,
+}
+
+
+@pytest.fixture
+def shared():
+    shared = SharedFrozenDict.create(DATA)
+    yield shared
+    shared.close()
+    shared.unlink()
+
+
+def test_lookups(shared):
+    assert len(shared) == len(DATA)
+    for key, value in DATA.items():
+        assert shared[key] == value
+        assert key in shared
+    assert dict(shared) == DATA
+    assert list(shared) == list(DATA)
+    assert "b" not in shared
+    assert 8 not in shared
+    assert ("a",) not in shared
+    assert shared.get("b", 5) == 5
+    with pytest.raises(KeyError):
+        shared["b"]
+
+
+def test_numeric_key_equivalence():
+    with SharedFrozenDict.create({1: "one", 2.0: "two", False: "f"}) as shared:
+        assert shared[1.0] == "one"
+        assert shared[True] == "one"
+        assert shared[2] == "two"
+        assert shared[0] == "f"
+        assert [(key, type(key)) for key in shared] == [
+            (1, int),
+            (2.0, float),
+            (False, bool),
+        ]
+        shared.unlink()
+
+
+def test_large_and_empty():
+    dict_obj = reverse_dict({"k{}".format(i): i for i in range(5000)})
+    shared = SharedFrozenDict.create(dict_obj)
+    with SharedFrozenDict.attach(shared.name) as attached:
+        assert dict(attached) == dict_obj
+    shared.close()
+    shared.unlink()
+    with SharedFrozenDict.create({}) as empty:
+        assert len(empty) == 0
+        assert "a" not in empty
+        empty.unlink()
+
+
+def test_invalid_input():
+    with pytest.raises(TypeError):
+        SharedFrozenDict.create({("a",): 1})
+    with pytest.raises(TypeError):
+        SharedFrozenDict.create({"a": object()})
+
+
+@pytest.mark.parametrize(
+    "value",
+    [(1, 2), {1: "x"}, [{"a": (1,)}], {"a"}, [10**5000]],
+    ids=["tuple", "int_keys", "nested_tuple", "set", "nested_huge_int"],
+)
+def test_values_not_surviving_json(value):
+    with pytest.raises(TypeError):
+        SharedFrozenDict.create({"a": value})
+
+
+def test_int_values():
+    values = {"huge": 10**5000, "neg": -(10**5000), "zero": 0, "min": -128}
+    with SharedFrozenDict.create(values) as shared:
+        assert dict(shared) == values
+        shared.unlink()
+
+
+def test_foreign_block_is_closed():
+    shm = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            SharedFrozenDict(shm)
+        # the block was closed by the failed constructor
+        assert shm.buf is None
+    finally:
+        shm.unlink()
+
+
+def _read_in_worker(shared, queue):
+    queue.put((shared.name, shared["a"], shared[7], len(shared)))
+    shared.close()
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_other_processes(shared, start_method):
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip("{} is not available".format(start_method))
+    context = multiprocessing.get_context(start_method)
+    queue = context.Queue()
+    process = context.Process(target=_read_in_worker, args=(shared, queue))
+    process.start()
+    result = queue.get(timeout=60)
+    process.join(timeout=60)
+    assert result == (shared.name, [1, 2], "seven", len(DATA))
+    # the block outlives the workers attaching to it
+    assert shared["a"] == [1, 2]
+
+
+def test_pickle(shared):
+    other = pickle.loads(pickle.dumps(shared))  # noqa: S301
+    assert other.name == shared.name
+    assert other[7] == "seven"
+    other.close()
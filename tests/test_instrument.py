@@ -0,0 +1,100 @@
+"""Testing the opt-in instrumentation of strct functions."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import strct.dicts
+import strct.dicts._dict
+from strct import instrument
+
+
+@pytest.fixture
+def instrumented():
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled_installs_no_wrappers():
+    assert not instrument.is_enabled()
+    assert not hasattr(strct.dicts.get_nested_val, "__wrapped__")
+
+
+def test_enable_and_disable_restore_originals(instrumented):
+    original = strct.dicts.get_nested_val
+    instrument.enable()
+    assert instrument.is_enabled()
+    assert strct.dicts.get_nested_val.__wrapped__ is original
+    assert strct.dicts._dict.get_nested_val.__wrapped__ is original
+    instrument.disable()
+    assert strct.dicts.get_nested_val is original
+    assert strct.dicts._dict.get_nested_val is original
+
+
+def test_stats(instrumented):
+    instrument.enable()
+    dict_obj = {"a": {"b": 7}}
+    assert strct.dicts.safe_nested_val(("a", "b"), dict_obj) == 7
+    assert strct.dicts.safe_nested_val(("a", "c", "d"), dict_obj) is None
+    stats = instrument.stats()
+    safe = stats["strct.dicts.safe_nested_val"]
+    assert safe["calls"] == 2
+    assert safe["exceptions"] == {}
+    assert safe["total_size"] == 5
+    assert safe["max_size"] == 3
+    assert safe["total_time"] > 0
+    # recursive calls are recorded once
+    get = stats["strct.dicts.get_nested_val"]
+    assert get["calls"] == 2
+    assert get["exceptions"] == {"KeyError": 1}
+    assert "strct.dicts.put_nested_val" not in stats
+    instrument.reset()
+    assert instrument.stats() == {}
+
+
+def test_callback(instrumented):
+    reports = []
+    instrument.enable(callback=reports.append)
+    strct.dicts.reverse_dict({"a": 1})
+    instrument.flush()
+    assert reports[0]["strct.dicts.reverse_dict"]["calls"] == 1
+    strct.dicts.reverse_dict({"a": 1})
+    instrument.disable()
+    assert reports[1]["strct.dicts.reverse_dict"]["calls"] == 2
+
+
+def test_prometheus_text(instrumented):
+    instrument.enable()
+    with pytest.raises(KeyError):
+        strct.dicts.get_nested_val(("x",), {})
+    text = instrument.prometheus_text()
+    assert "# TYPE strct_calls_total counter" in text
+    assert 'strct_calls_total{function="strct.dicts.get_nested_val"} 1' in text
+    assert (
+        'strct_exceptions_total{function="strct.dicts.get_nested_val",'
+        'exception="KeyError"} 1'
+    ) in text
+
+
+def _run_with_env(value):
+    env = dict(os.environ, STRCT_INSTRUMENT=value)
+    code = (
+        "import strct, strct.dicts; "
+        "print(hasattr(strct.dicts.get_nested_val, '__wrapped__'))"
+    )
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def test_env_var():
+    assert _run_with_env("1") == "True"
+    assert _run_with_env("0") == "False"
@@ -0,0 +1,74 @@
+"""Testing the IntervalTree class."""
+
+import random
+
+import pytest
+
+from strct.sortedlists import IntervalTree
+
+
+def _linear_overlap(intervals, start, end):
+    return sorted(iv for iv in intervals if iv[0] <= end and iv[1] >= start)
+
+
+def test_basic_queries():
+    tree = IntervalTree([(5, 8), (1, 10), (9, 12)])
+    assert len(tree) == 3
+    assert list(tree) == [(1, 10), (5, 8), (9, 12)]
+    assert tree.overlap(7, 9) == [(1, 10), (5, 8), (9, 12)]
+    assert tree.overlap(11, 20) == [(9, 12)]
+    assert tree.overlap(13, 20) == []
+    assert tree.at(1) == [(1, 10)]
+    assert tree.at(0) == []
+    assert tree.at_many([0, 8, 12]) == [[], [(1, 10), (5, 8)], [(9, 12)]]
+    assert tree.overlap_many([(0, 0), (10, 11)]) == [[], [(1, 10), (9, 12)]]
+    assert (5, 8) in tree
+    assert (5, 9) not in tree
+
+
+def test_duplicates_and_removal():
+    tree = IntervalTree()
+    tree.add(2, 4)
+    tree.add(2, 4)
+    tree.add(3, 3)
+    assert tree.at(3) == [(2, 4), (2, 4), (3, 3)]
+    tree.remove(2, 4)
+    assert tree.at(3) == [(2, 4), (3, 3)]
+    tree.remove(2, 4)
+    tree.remove(3, 3)
+    assert len(tree) == 0
+    assert tree.at(3) == []
+    with pytest.raises(KeyError):
+        tree.remove(2, 4)
+
+
+def test_invalid_intervals():
+    with pytest.raises(ValueError):
+        IntervalTree([(4, 2)])
+    with pytest.raises(ValueError):
+        IntervalTree().add(4, 2)
+    with pytest.raises(ValueError):
+        IntervalTree.from_sorted([(4, 5), (1, 2)])
+
+
+def test_matches_linear_scan():
+    rand = random.Random(42)
+    intervals = []
+    for _ in range(500):
+        start = rand.randint(0, 1000)
+        intervals.append((start, start + rand.randint(0, 50)))
+    tree = IntervalTree.from_sorted(sorted(intervals))
+    for _ in range(300):
+        iv = intervals.pop(rand.randrange(len(intervals)))
+        tree.remove(*iv)
+        start = rand.randint(0, 1000)
+        new_iv = (start, start + rand.randint(0, 80))
+        intervals.append(new_iv)
+        tree.add(*new_iv)
+    assert list(tree) == sorted(intervals)
+    for _ in range(200):
+        start = rand.randint(-10, 1100)
+        end = start + rand.randint(0, 30)
+        assert tree.overlap(start, end) == _linear_overlap(
+            intervals, start, end
+        )
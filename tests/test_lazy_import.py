@@ -0,0 +1,72 @@
+"""Testing lazy loading of the strct subpackages."""
+
+import subprocess
+import sys
+
+import pytest
+
+import strct
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def _importtime_modules(code):
+    # -X importtime reports each module imported by an import statement
+    modules = set()
+    for line in _run("-X", "importtime", "-c", code).stderr.splitlines():
+        if line.startswith("import time:"):
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def test_import_time():
+    modules = _importtime_modules("import strct")
+    modules -= _importtime_modules("pass")
+    assert "strct" in modules
+    assert {"strct", "strct._lazy"} >= {
+        name for name in modules if name.startswith("strct")
+    }
+    assert not modules & {"hashlib", "json", "subprocess", "copy"}
+
+
+def _loaded_modules(code):
+    code += "; import sys; print(' '.join(sys.modules))"
+    return set(_run("-c", code).stdout.split())
+
+
+def test_subpackage_attributes_are_lazy():
+    modules = _loaded_modules("import strct.dicts")
+    assert "strct.dicts" in modules
+    assert "strct.dicts._dict" not in modules
+    assert "strct.hash" not in modules
+    modules = _loaded_modules("import strct.dicts; strct.dicts.BiDict")
+    assert "strct.dicts._bidict" in modules
+    assert "strct.dicts._dict" not in modules
+
+
+def test_lazy_attributes():
+    from strct.dicts import get_nested_val
+    from strct.dicts._dict import get_nested_val as defined
+
+    assert get_nested_val is defined
+    assert strct.dicts.get_nested_val is defined
+    assert "get_nested_val" in dir(strct.dicts)
+    assert isinstance(strct.__version__, str)
+    assert strct.sortedlists.intervaltree.IntervalTree
+    with pytest.raises(AttributeError, match="no_such_name"):
+        strct.dicts.no_such_name  # noqa: B018
+    with pytest.raises(ImportError):
+        from strct.dicts import no_such_name  # noqa: F401
+
+
+def test_star_import():
+    namespace = {}
+    exec("from strct.sets import *", namespace)  # noqa: S102
+    assert set(namespace) - {"__builtins__"} == {
+        "PriorityResolver",
+        "get_priority_elem_in_set",
+    }
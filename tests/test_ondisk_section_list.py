@@ -0,0 +1,88 @@
+"""Testing the OnDiskSectionList class."""
+
+import os
+
+import pytest
+
+from strct.sortedlists import (
+    OnDiskSectionList,
+    find_point_in_section_list,
+    find_range_in_section_list,
+    find_range_ix_in_point_list,
+    find_range_ix_in_section_list,
+)
+
+
+def test_section_list_semantics(tmp_path):
+    path = tmp_path / "bounds.bin"
+    with OnDiskSectionList.from_iterable(path, [5, 8, 30, 31], "q") as sl:
+        assert len(sl) == 4
+        assert list(sl) == [5, 8, 30, 31]
+        assert 8 in sl
+        assert 9 not in sl
+        assert find_point_in_section_list(4, sl) is None
+        assert find_point_in_section_list(5, sl) == 5
+        assert find_point_in_section_list(27, sl) == 8
+        assert find_point_in_section_list(31, sl) == 30
+        assert find_range_ix_in_section_list(7, 30, sl) == [0, 3]
+        assert find_range_in_section_list(7, 9, sl) == [5, 8]
+        assert find_range_in_section_list(4, 321, sl) == [5, 8, 30]
+        assert find_range_ix_in_point_list(6, 321, sl) == [1, 4]
+
+
+def test_append_and_reopen(tmp_path):
+    path = tmp_path / "bounds.bin"
+    with OnDiskSectionList(path, "d", mode="a") as sl:
+        assert len(sl) == 0
+        sl.append(1.5)
+        sl.extend([2.5, 4.0])
+        assert sl[-1] == 4.0
+        with pytest.raises(ValueError):
+            sl.append(3.0)
+        with pytest.raises(ValueError):
+            sl.extend([5.0, 4.5])
+        assert len(sl) == 3
+    with OnDiskSectionList(path, "d") as sl:
+        assert sl[:] == [1.5, 2.5, 4.0]
+        assert find_point_in_section_list(3.0, sl) == 2.5
+        with pytest.raises(OSError):
+            sl.append(5.0)
+
+
+def test_numpy_compatible_file(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "bounds.bin"
+    np.array([5, 8, 30, 31], dtype=np.int64).tofile(path)
+    with OnDiskSectionList(path, "q") as sl:
+        assert find_point_in_section_list(27, sl) == 8
+    OnDiskSectionList.from_iterable(path, [1.0, 2.0], "d").close()
+    assert np.memmap(path, dtype=np.float64, mode="r").tolist() == [1.0, 2.0]
+
+
+def test_bad_args(tmp_path):
+    path = tmp_path / "bounds.bin"
+    with pytest.raises(ValueError):
+        OnDiskSectionList(path, "d", mode="w")
+    path.write_bytes(b"abc")
+    with pytest.raises(ValueError) as excinfo:
+        OnDiskSectionList(path, "d")
+    if os.path.isdir("/proc/self/fd"):
+        # the file opened before the failed mapping was closed, even though
+        # the traceback still references the half-built object
+        assert excinfo.traceback
+        assert not any(
+            os.readlink(os.path.join("/proc/self/fd", fd)) == str(path)
+            for fd in os.listdir("/proc/self/fd")
+            if os.path.exists(os.path.join("/proc/self/fd", fd))
+        )
+
+
+def test_append_while_iterating(tmp_path):
+    path = tmp_path / "bounds.bin"
+    with OnDiskSectionList.from_iterable(path, range(10_000), "q") as sl:
+        seen = []
+        for value in sl:
+            seen.append(value)
+            if value == 5:
+                sl.append(10_000)
+        assert seen == list(range(10_001))
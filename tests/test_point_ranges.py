@@ -0,0 +1,85 @@
+"""Testing vectorized range queries over point lists."""
+
+import pytest
+from sortedcontainers import SortedList
+
+np = pytest.importorskip("numpy")
+
+from strct.sortedlists import (  # noqa: E402
+    WeightedPointList,
+    count_in_ranges,
+    find_range_ix_in_point_list,
+    sum_in_ranges,
+)
+
+
+def test_count_in_ranges():
+    starts = [3, 3, 3, 4, 4, 6, 20, 9]
+    ends = [4, 7, 8, 15, 321, 321, 30, 2]
+    for point_list in (
+        [5, 8, 15],
+        SortedList([5, 8, 15]),
+        np.array([5, 8, 15]),
+        WeightedPointList(SortedList([5, 8, 15])),
+    ):
+        counts = count_in_ranges(starts, ends, point_list)
+        assert counts.tolist() == [0, 1, 2, 3, 3, 2, 0, 0]
+
+
+def test_count_matches_point_list_ix():
+    rand = np.random.default_rng(7)
+    points = np.sort(rand.integers(0, 1000, 500))
+    starts = rand.integers(-50, 1050, 200)
+    ends = starts + rand.integers(0, 100, 200)
+    counts = count_in_ranges(starts, ends, points)
+    for start, end, count in zip(starts, ends, counts, strict=True):
+        ix = find_range_ix_in_point_list(start, end, points)
+        assert count == ix[1] - ix[0]
+
+
+def test_sum_in_ranges():
+    points = [5, 8, 8, 15]
+    weights = [1.0, 2.0, 0.5, 4.0]
+    sums = sum_in_ranges([3, 8, 16], [8, 20, 30], points, weights)
+    assert sums.tolist() == [3.5, 6.5, 0.0]
+    wpl = WeightedPointList(points, weights)
+    assert len(wpl) == 4
+    assert sum_in_ranges([3, 8], [8, 20], wpl).tolist() == [3.5, 6.5]
+    assert count_in_ranges([3], [8], wpl).tolist() == [3]
+
+
+def test_sum_in_ranges_small_dtypes():
+    points = list(range(300))
+    sums = sum_in_ranges([0], [1000], points, np.ones(300, dtype=np.uint8))
+    assert sums.tolist() == [300]
+    sums = sum_in_ranges([0], [1000], points, np.full(300, 100, np.int8))
+    assert sums.tolist() == [30000]
+    flags = np.arange(300) % 3 == 0
+    assert sum_in_ranges([0, 3], [1000, 5], points, flags).tolist() == [
+        100,
+        1,
+    ]
+    float_weights = np.full(300, 0.1, dtype=np.float32)
+    wpl = WeightedPointList(points, float_weights)
+    assert wpl.prefix_sums.dtype == np.float64
+
+
+def test_sum_in_ranges_bad_args():
+    with pytest.raises(ValueError):
+        sum_in_ranges([1], [2], [1, 2])
+    wpl = WeightedPointList([1, 2], [1, 1])
+    with pytest.raises(ValueError):
+        sum_in_ranges([1], [2], wpl, [1, 1])
+    with pytest.raises(ValueError):
+        WeightedPointList([1, 2], [1])
+    with pytest.raises(ValueError):
+        sum_in_ranges([1], [2], WeightedPointList([1, 2]))
+
+
+def test_points_converted_once():
+    points = WeightedPointList([5, 8, 15])
+    converted = points.points
+    count_in_ranges([3], [8], points)
+    assert points.points is converted
+    array = np.array([5, 8, 15])
+    assert WeightedPointList(array).points is array
@@ -1,6 +1,10 @@
 """Testing set related utility functions."""
 
-from strct.sets import get_priority_elem_in_set
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from strct.sets import PriorityResolver, get_priority_elem_in_set
 
 
 def test_get_priority_elem_in_set():
@@ -15,3 +19,40 @@ def test_get_priority_elem_in_set_no_match():
     obj_set = {3, 2, 7, 8}
     priority_list = [4, 9, 10]
     assert get_priority_elem_in_set(obj_set, priority_list) is None
+
+
+def test_priority_resolver():
+    """Test PriorityResolver agrees with get_priority_elem_in_set."""
+    priority_list = [4, 8, 1, 3, 8]
+    resolver = PriorityResolver(priority_list)
+    sets = [
+        {3, 2, 7, 8},
+        {3, 2, 7, 8, 1, 10, 11},
+        {9},
+        set(),
+        [3, 1],
+        frozenset(range(20)),
+    ]
+    expected = [get_priority_elem_in_set(s, priority_list) for s in sets]
+    assert expected == [8, 8, None, None, 1, 4]
+    assert [resolver.resolve(s) for s in sets] == expected
+    assert resolver.resolve_many(sets) == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert resolver.resolve_many(sets, executor=executor) == expected
+
+
+def test_priority_resolver_unhashable():
+    priority_list = [[1], {"a": 1}, 3]
+    resolver = PriorityResolver(priority_list)
+    for obj_set in ([3, {"a": 1}], [[1], 3], [5]):
+        assert resolver.resolve(obj_set) == get_priority_elem_in_set(
+            obj_set, priority_list
+        )
+    # unhashable objects can't be looked up in actual sets by either
+    with pytest.raises(TypeError):
+        get_priority_elem_in_set({3, 4}, priority_list)
+    with pytest.raises(TypeError):
+        resolver.resolve({3, 4})
+    resolver = PriorityResolver([4, 8, 3])
+    assert resolver.resolve([[1], 8, 3]) == 8
+    assert resolver.resolve_many([[[1]], [{}, 3]]) == [None, 3]
@@ -1,5 +1,6 @@
 """Testing the threadsafe_generator decorator."""
 
+import pytest
 from sortedcontainers import SortedList
 
 from strct.sortedlists import (
@@ -50,3 +51,38 @@ def test_find_range_ix_in_point_list():
     assert find_range_ix_in_point_list(4, 15, point_list) == [0, 3]
     assert find_range_ix_in_point_list(4, 321, point_list) == [0, 3]
     assert find_range_ix_in_point_list(6, 321, point_list) == [1, 3]
+
+
+def test_plain_list_backend():
+    """Testing the sortedlist functions on plain sorted python lists."""
+    seclist = [5, 8, 30, 31]
+    assert find_point_in_section_list(4, seclist) is None
+    assert find_point_in_section_list(5, seclist) == 5
+    assert find_point_in_section_list(27, seclist) == 8
+    assert find_point_in_section_list(31, seclist) == 30
+    assert find_range_ix_in_section_list(7, 30, seclist) == [0, 3]
+    assert find_range_in_section_list(6, 7, seclist) == [5]
+    assert find_range_in_section_list(4, 321, seclist) == [5, 8, 30]
+    assert find_range_ix_in_point_list(3, 8, [5, 8, 15]) == [0, 2]
+    assert find_range_ix_in_point_list(6, 321, [5, 8, 15]) == [1, 3]
+
+
+def test_numpy_backend(tmp_path):
+    """Testing the sortedlist functions on numpy arrays and memmaps."""
+    np = pytest.importorskip("numpy")
+    seclist = np.array([5, 8, 30, 31])
+    memlist = np.memmap(
+        tmp_path / "seclist.bin", dtype=seclist.dtype, mode="w+", shape=(4,)
+    )
+    memlist[:] = seclist
+    for backend in (seclist, memlist):
+        assert find_point_in_section_list(4, backend) is None
+        assert find_point_in_section_list(5, backend) == 5
+        assert find_point_in_section_list(27, backend) == 8
+        assert find_point_in_section_list(31, backend) == 30
+        assert find_range_ix_in_section_list(3, 4, backend) == [0, 0]
+        assert find_range_ix_in_section_list(7, 9, backend) == [0, 2]
+        assert find_range_ix_in_section_list(7, 321, backend) == [0, 3]
+        assert list(find_range_in_section_list(7, 30, backend)) == [5, 8, 30]
+        assert find_range_ix_in_point_list(3, 7, backend) == [0, 1]
+        assert find_range_ix_in_point_list(6, 321, backend) == [1, 4]